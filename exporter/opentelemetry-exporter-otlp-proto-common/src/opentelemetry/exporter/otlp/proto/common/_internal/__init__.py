@@ -14,7 +14,9 @@
 
 
 import logging
+from collections import OrderedDict
 from collections.abc import Sequence
+from threading import Lock
 from typing import Any, Mapping, Optional, List, Callable, TypeVar, Dict
 
 import backoff
@@ -42,10 +44,57 @@ _logger = logging.getLogger(__name__)
 
 _TypingResourceT = TypeVar("_TypingResourceT")
 _ResourceDataT = TypeVar("_ResourceDataT")
-
-
-def _encode_instrumentation_scope(
-    instrumentation_scope: InstrumentationScope,
+_EncodedT = TypeVar("_EncodedT")
+
+# Resources and instrumentation scopes are few and live as long as the
+# providers that create them, this is more than enough to hold all of them.
+_ENCODING_CACHE_SIZE = 64
+
+
+class _EncodingCache:
+    """Bounded cache of the encodings of immutable objects.
+
+    The encodings are keyed by the identity of the objects, looking them up
+    does not hash the objects, which is expensive for resources. The objects
+    are kept alive while their encodings are cached so that their ids are not
+    reused. The least recently used encoding is evicted when the cache is
+    full.
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[Any], _EncodedT],
+        maxsize: int = _ENCODING_CACHE_SIZE,
+    ) -> None:
+        self._encode = encode
+        self._maxsize = maxsize
+        self._lock = Lock()
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+
+    def get(self, obj: Any) -> _EncodedT:
+        key = id(obj)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is obj:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        encoded = self._encode(obj)
+
+        with self._lock:
+            self._entries[key] = (obj, encoded)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return encoded
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _encode_instrumentation_scope_uncached(
+    instrumentation_scope: Optional[InstrumentationScope],
 ) -> PB2InstrumentationScope:
     if instrumentation_scope is None:
         return PB2InstrumentationScope()
@@ -55,10 +104,28 @@ def _encode_instrumentation_scope(
     )
 
 
-def _encode_resource(resource: Resource) -> PB2Resource:
+def _encode_resource_uncached(resource: Resource) -> PB2Resource:
     return PB2Resource(attributes=_encode_attributes(resource.attributes))
 
 
+_instrumentation_scope_cache = _EncodingCache(
+    _encode_instrumentation_scope_uncached
+)
+_resource_cache = _EncodingCache(_encode_resource_uncached)
+
+
+# The encoded messages are shared by every batch, they are copied into the
+# messages that contain them and must not be modified.
+def _encode_instrumentation_scope(
+    instrumentation_scope: Optional[InstrumentationScope],
+) -> PB2InstrumentationScope:
+    return _instrumentation_scope_cache.get(instrumentation_scope)
+
+
+def _encode_resource(resource: Resource) -> PB2Resource:
+    return _resource_cache.get(resource)
+
+
 def _encode_value(value: Any) -> PB2AnyValue:
     if isinstance(value, bool):
         return PB2AnyValue(bool_value=value)
@@ -120,13 +187,10 @@ def _get_resource_data(
         sdk_resource,
         scope_data,
     ) in sdk_resource_scope_data.items():
-        collector_resource = PB2Resource(
-            attributes=_encode_attributes(sdk_resource.attributes)
-        )
         resource_data.append(
             resource_class(
                 **{
-                    "resource": collector_resource,
+                    "resource": _encode_resource(sdk_resource),
                     "scope_{}".format(name): scope_data.values(),
                 }
             )
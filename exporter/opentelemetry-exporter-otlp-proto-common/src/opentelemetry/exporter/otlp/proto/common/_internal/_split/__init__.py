@@ -0,0 +1,327 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers that split serialized OTLP export requests by their size.
+
+The requests of the three signals have the same layout: a repeated resource
+field, each resource has a repeated scope field and each scope has a repeated
+item field (spans, log records or metrics), all of them with field number 2
+except for the resources, that have field number 1. The requests are split
+by copying the bytes of the items into smaller requests that repeat the
+resource and scope they belong to, the items are not decoded again.
+"""
+
+import logging
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from opentelemetry.exporter.otlp.proto.common._internal._wire_format import (
+    _WIRE_TYPE_FIXED64,
+    _WIRE_TYPE_LENGTH_DELIMITED,
+    _WIRE_TYPE_VARINT,
+    _encode_varint,
+    _tag,
+    _write_length_delimited,
+)
+
+_logger = logging.getLogger(__name__)
+
+_WIRE_TYPE_FIXED32 = 5
+
+_RESOURCES_FIELD = 1
+_SCOPES_FIELD = 2
+_ITEMS_FIELD = 2
+# Metric.data_points is field 1 of every metric data message
+_DATA_POINTS_FIELD = 1
+# the oneof fields of Metric: gauge, sum, histogram, exponential_histogram
+# and summary
+_METRIC_DATA_FIELDS = (5, 7, 9, 10, 11)
+
+_RESOURCES_TAG = _tag(_RESOURCES_FIELD, _WIRE_TYPE_LENGTH_DELIMITED)
+_SCOPES_TAG = _tag(_SCOPES_FIELD, _WIRE_TYPE_LENGTH_DELIMITED)
+_ITEMS_TAG = _tag(_ITEMS_FIELD, _WIRE_TYPE_LENGTH_DELIMITED)
+
+# Splits an item that is too large into items of at most the given size.
+_ItemSplitter = Callable[[memoryview, int], List[bytes]]
+
+
+def _read_varint(data: memoryview, position: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, position
+        shift += 7
+
+
+def _iter_fields(
+    data: memoryview,
+) -> Iterator[Tuple[int, memoryview, Optional[memoryview]]]:
+    """Yields the field number, the bytes of the field, tag included, and
+    the payload of the length delimited fields of a serialized message."""
+    position = 0
+    end = len(data)
+    while position < end:
+        start = position
+        key, position = _read_varint(data, position)
+        field_number, wire_type = key >> 3, key & 0x7
+        payload = None
+        if wire_type == _WIRE_TYPE_VARINT:
+            _, position = _read_varint(data, position)
+        elif wire_type == _WIRE_TYPE_FIXED64:
+            position += 8
+        elif wire_type == _WIRE_TYPE_FIXED32:
+            position += 4
+        elif wire_type == _WIRE_TYPE_LENGTH_DELIMITED:
+            length, position = _read_varint(data, position)
+            payload = data[position : position + length]
+            position += length
+        else:
+            raise ValueError(f"Unsupported wire type {wire_type}")
+        yield field_number, data[start:position], payload
+
+
+def _split_fields(
+    data: memoryview, field_number: int
+) -> Tuple[bytes, List[memoryview], List[memoryview]]:
+    """Returns the bytes of the other fields of a message, and the bytes and
+    payloads of the occurrences of one of its repeated fields."""
+    header = bytearray()
+    fields = []
+    payloads = []
+    for number, field, payload in _iter_fields(data):
+        if number == field_number:
+            fields.append(field)
+            payloads.append(payload)
+        else:
+            header += field
+    return bytes(header), fields, payloads
+
+
+def _field_size(payload_size: int) -> int:
+    # the tags of the fields that are split are a single byte
+    return 1 + len(_encode_varint(payload_size)) + payload_size
+
+
+class _RequestSplitter:
+    """Packs the items of a request into requests of at most ``max_size``
+    bytes, in the same order."""
+
+    def __init__(
+        self, max_size: int, split_item: Optional[_ItemSplitter] = None
+    ) -> None:
+        self._max_size = max_size
+        self._split_item = split_item
+        self._requests: List[bytes] = []
+        self._request = bytearray()
+        self._resource_header = b""
+        self._resource: Optional[bytearray] = None
+        self._scope_header = b""
+        self._scope: Optional[bytearray] = None
+        self._items = 0
+        # the scopes and resources without items are left out of the requests
+        self._resource_items = 0
+        self._scope_items = 0
+
+    def _size(self, item_size: int = 0) -> int:
+        """Returns the size of the current request with an item of
+        ``item_size`` bytes added to it."""
+        size = len(self._request)
+        if self._resource is not None:
+            resource_size = len(self._resource)
+            if self._scope is not None:
+                resource_size += _field_size(len(self._scope) + item_size)
+            size += _field_size(resource_size)
+        return size
+
+    def open_resource(self, header: bytes) -> None:
+        self._close_resource()
+        self._resource_header = header
+        self._resource = bytearray(header)
+        self._resource_items = 0
+
+    def open_scope(self, header: bytes) -> None:
+        self._close_scope()
+        self._scope_header = header
+        self._scope = bytearray(header)
+        self._scope_items = 0
+
+    def add_item(self, item: memoryview, payload: memoryview) -> None:
+        if self._items and self._size(len(item)) > self._max_size:
+            self._flush()
+        if self._size(len(item)) <= self._max_size:
+            self._scope += item
+            self._count_item()
+            return
+
+        max_payload_size = self._max_payload_size()
+        if self._split_item is not None and max_payload_size > 0:
+            parts = self._split_item(payload, max_payload_size)
+        else:
+            parts = [bytes(payload)]
+        for part in parts:
+            if self._items and self._size(_field_size(len(part))) > (
+                self._max_size
+            ):
+                self._flush()
+            if self._size(_field_size(len(part))) > self._max_size:
+                _logger.warning(
+                    "Exporting an item of %s bytes that does not fit in the "
+                    "maximum request size of %s bytes.",
+                    len(part),
+                    self._max_size,
+                )
+            _write_length_delimited(self._scope, _ITEMS_TAG, part)
+            self._count_item()
+
+    def _max_payload_size(self) -> int:
+        """Returns the size of the largest item payload that fits in the
+        current request, with the length prefixes of the item, its scope and
+        its resource that grow with it."""
+        max_payload_size = self._max_size - self._size()
+        while max_payload_size > 0:
+            excess = self._size(_field_size(max_payload_size)) - self._max_size
+            if excess <= 0:
+                break
+            max_payload_size -= excess
+        return max_payload_size
+
+    def _count_item(self) -> None:
+        self._items += 1
+        self._resource_items += 1
+        self._scope_items += 1
+
+    def _close_scope(self) -> None:
+        if self._scope is not None:
+            if self._scope_items:
+                _write_length_delimited(
+                    self._resource, _SCOPES_TAG, self._scope
+                )
+            self._scope = None
+
+    def _close_resource(self) -> None:
+        self._close_scope()
+        if self._resource is not None:
+            if self._resource_items:
+                _write_length_delimited(
+                    self._request, _RESOURCES_TAG, self._resource
+                )
+            self._resource = None
+
+    def _flush(self) -> None:
+        """Ends the current request, the next one starts with the resource
+        and scope that are open."""
+        in_resource = self._resource is not None
+        in_scope = self._scope is not None
+        self._close_resource()
+        self._requests.append(bytes(self._request))
+        self._request = bytearray()
+        self._items = 0
+        if in_resource:
+            self.open_resource(self._resource_header)
+        if in_scope:
+            self.open_scope(self._scope_header)
+
+    def finish(self) -> List[bytes]:
+        self._close_resource()
+        if self._request:
+            self._requests.append(bytes(self._request))
+        return self._requests
+
+
+def _split_request(
+    serialized_request: bytes,
+    max_size: int,
+    split_item: Optional[_ItemSplitter] = None,
+) -> List[bytes]:
+    """Splits a serialized export request into requests of at most
+    ``max_size`` bytes each.
+
+    The request is split between resources, scopes and items. An item that
+    does not fit in a request on its own is split with ``split_item`` if it
+    is given, or exported alone otherwise.
+    """
+    if len(serialized_request) <= max_size:
+        return [serialized_request]
+
+    splitter = _RequestSplitter(max_size, split_item)
+    _, _, resources = _split_fields(
+        memoryview(serialized_request), _RESOURCES_FIELD
+    )
+    for resource in resources:
+        resource_header, _, scopes = _split_fields(resource, _SCOPES_FIELD)
+        splitter.open_resource(resource_header)
+        for scope in scopes:
+            scope_header, items, payloads = _split_fields(scope, _ITEMS_FIELD)
+            splitter.open_scope(scope_header)
+            for item, payload in zip(items, payloads):
+                splitter.add_item(item, payload)
+    return splitter.finish()
+
+
+def _split_metric(metric: memoryview, max_size: int) -> List[bytes]:
+    """Splits a serialized metric into metrics of at most ``max_size`` bytes
+    that have the same name, description, unit and data but a part of its
+    data points each."""
+    metric_header = bytearray()
+    data_field = None
+    data_tag = b""
+    for number, field, payload in _iter_fields(metric):
+        if number in _METRIC_DATA_FIELDS:
+            data_field = payload
+            data_tag = _tag(number, _WIRE_TYPE_LENGTH_DELIMITED)
+        else:
+            metric_header += field
+    if data_field is None:
+        return [bytes(metric)]
+
+    data_header, data_points, _ = _split_fields(data_field, _DATA_POINTS_FIELD)
+
+    def metric_size(data_points_size: int) -> int:
+        return len(metric_header) + _field_size(
+            len(data_header) + data_points_size
+        )
+
+    metrics = []
+    split_data_points = bytearray()
+
+    def add_metric() -> None:
+        split_metric = bytearray(metric_header)
+        _write_length_delimited(
+            split_metric, data_tag, data_header + split_data_points
+        )
+        metrics.append(bytes(split_metric))
+
+    for data_point in data_points:
+        if (
+            split_data_points
+            and metric_size(len(split_data_points) + len(data_point))
+            > max_size
+        ):
+            add_metric()
+            split_data_points = bytearray()
+        split_data_points += data_point
+    add_metric()
+    return metrics
+
+
+def _split_metrics_request(
+    serialized_request: bytes, max_size: int
+) -> List[bytes]:
+    """Splits a serialized metrics export request like `_split_request`,
+    the metrics that do not fit in a request are split between their data
+    points."""
+    return _split_request(serialized_request, max_size, _split_metric)
@@ -0,0 +1,322 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import mmap
+import os
+import struct
+import threading
+import zlib
+from time import time
+from typing import Callable, Dict, List, Optional
+
+_logger = logging.getLogger(__name__)
+
+# Every record is prefixed by its length, the crc32 of its data and the time
+# at which it was written, in seconds since the epoch.
+_RECORD_HEADER = struct.Struct("<IId")
+_SEGMENT_SUFFIX = ".seg"
+
+
+class DiskSpool:
+    """Disk backed spool of serialized export requests.
+
+    Exporters append the batches they failed to deliver to the spool and
+    replay them once the endpoint is reachable again, which gives at-least-once
+    delivery across outages and process restarts without buffering the
+    batches in memory.
+
+    The spool is made of append-only segment files in ``directory``. Records
+    are appended to the active segment, which is rotated once it grows larger
+    than ``max_segment_size`` bytes. Closed segments are read through
+    ``mmap`` and deleted once every record in them has been replayed.
+
+    Args:
+        directory: Directory where the segment files are stored, it is
+            created if it does not exist.
+        max_size: Maximum number of bytes stored in the spool, the oldest
+            segments are dropped to make room for new records.
+        max_age: Maximum age in seconds of a record, older records are
+            dropped instead of being replayed.
+        max_segment_size: Size in bytes after which the active segment is
+            rotated.
+        replay_interval: Interval in seconds at which the background thread
+            started by `start` replays the spool.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_size: int = 256 * 1024 * 1024,
+        max_age: float = 24 * 60 * 60,
+        max_segment_size: int = 4 * 1024 * 1024,
+        replay_interval: float = 30,
+    ):
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer.")
+        if max_age <= 0:
+            raise ValueError("max_age must be a positive number.")
+        if max_segment_size <= 0:
+            raise ValueError("max_segment_size must be a positive integer.")
+        if replay_interval <= 0:
+            raise ValueError("replay_interval must be a positive number.")
+
+        self._directory = directory
+        self._max_size = max_size
+        self._max_age = max_age
+        self._max_segment_size = max_segment_size
+        self._replay_interval = replay_interval
+
+        self._lock = threading.Lock()
+        # only one replay runs at a time
+        self._replay_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._worker_thread = None  # type: Optional[threading.Thread]
+
+        os.makedirs(directory, exist_ok=True)
+
+        # closed segments, oldest first, and their size in bytes
+        self._segments = []  # type: List[str]
+        self._segment_sizes = {}  # type: Dict[str, int]
+        # offsets up to which closed segments have already been replayed
+        self._replayed_offsets = {}  # type: Dict[str, int]
+        self._next_sequence = 0
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith(_SEGMENT_SUFFIX):
+                continue
+            try:
+                sequence = int(name[: -len(_SEGMENT_SUFFIX)])
+            except ValueError:
+                _logger.warning(
+                    "Ignoring %s in the spool directory, it is not a spool "
+                    "segment.",
+                    name,
+                )
+                continue
+            path = os.path.join(directory, name)
+            self._segments.append(path)
+            self._segment_sizes[path] = os.path.getsize(path)
+            self._next_sequence = sequence + 1
+        self._size = sum(self._segment_sizes.values())
+
+        self._active_path = None  # type: Optional[str]
+        self._active_file = None
+        self._active_size = 0
+
+    @property
+    def size(self) -> int:
+        """Number of bytes currently stored in the spool."""
+        return self._size
+
+    def append(self, data: bytes) -> bool:
+        """Appends a serialized batch to the spool.
+
+        Batches appended after `close` are dropped, exporters can still be
+        spooling the batch of an export that outlived their shutdown.
+
+        Returns:
+            False if the batch is larger than the spool or the spool is
+            closed, and the batch was dropped.
+        """
+        if self._closed:
+            _logger.warning("Spool already closed, dropping batch.")
+            return False
+
+        record_size = _RECORD_HEADER.size + len(data)
+        if record_size > self._max_size:
+            _logger.warning(
+                "Batch of %s bytes is larger than the spool, dropping it.",
+                len(data),
+            )
+            return False
+
+        with self._lock:
+            if self._closed:
+                _logger.warning("Spool already closed, dropping batch.")
+                return False
+
+            while self._size + record_size > self._max_size:
+                if not self._segments:
+                    self._rotate()
+                    if not self._segments:
+                        break
+                _logger.warning(
+                    "Spool is full, dropping its oldest segment %s.",
+                    self._segments[0],
+                )
+                self._remove_segment(self._segments[0])
+
+            if self._active_file is None:
+                self._active_path = os.path.join(
+                    self._directory,
+                    f"{self._next_sequence:020d}{_SEGMENT_SUFFIX}",
+                )
+                self._next_sequence += 1
+                # pylint: disable=consider-using-with
+                self._active_file = open(self._active_path, "ab")
+                self._active_size = 0
+
+            self._active_file.write(
+                _RECORD_HEADER.pack(len(data), zlib.crc32(data), time())
+            )
+            self._active_file.write(data)
+            self._active_file.flush()
+            self._active_size += record_size
+            self._size += record_size
+
+            if self._active_size >= self._max_segment_size:
+                self._rotate()
+        return True
+
+    def replay(self, send: Callable[[bytes], bool]) -> bool:
+        """Replays the spooled batches, oldest first.
+
+        ``send`` is called with every batch still in the spool and returns
+        whether the batch was delivered. Replay stops at the first batch that
+        could not be delivered, that batch and the ones after it are replayed
+        again next time.
+
+        Returns:
+            True if the spool was drained.
+        """
+        with self._replay_lock:
+            with self._lock:
+                self._rotate()
+                segments = list(self._segments)
+
+            for path in segments:
+                if not self._replay_segment(path, send):
+                    return False
+            return True
+
+    def start(self, send: Callable[[bytes], bool]) -> None:
+        """Starts replaying the spool with ``send`` in a background thread.
+
+        The spool is replayed every ``replay_interval`` seconds and whenever
+        `notify` is called.
+        """
+        with self._lock:
+            if self._worker_thread is not None or self._closed:
+                return
+            self._worker_thread = threading.Thread(
+                name="OtelDiskSpool",
+                target=self._worker,
+                args=(send,),
+                daemon=True,
+            )
+            self._worker_thread.start()
+
+    def notify(self) -> None:
+        """Wakes up the background replay, e.g. after a successful export."""
+        if self._size:
+            self._wakeup.set()
+
+    def close(self) -> None:
+        """Stops the background replay and closes the active segment.
+
+        Batches still in the spool are kept on disk and replayed by the next
+        spool opened on the same directory.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._close_active_segment()
+        self._wakeup.set()
+        if self._worker_thread is not None:
+            self._worker_thread.join()
+
+    def _worker(self, send: Callable[[bytes], bool]) -> None:
+        while not self._closed:
+            self._wakeup.wait(self._replay_interval)
+            self._wakeup.clear()
+            if self._closed:
+                break
+            if not self._size:
+                continue
+            try:
+                self.replay(send)
+            except Exception:  # pylint: disable=broad-except
+                _logger.exception("Exception while replaying the spool.")
+
+    def _replay_segment(
+        self, path: str, send: Callable[[bytes], bool]
+    ) -> bool:
+        offset = self._replayed_offsets.get(path, 0)
+        try:
+            with open(path, "rb") as segment_file:
+                if os.fstat(segment_file.fileno()).st_size == 0:
+                    data = b""
+                else:
+                    data = mmap.mmap(
+                        segment_file.fileno(), 0, access=mmap.ACCESS_READ
+                    )
+        except FileNotFoundError:
+            # the segment was dropped to make room for new records
+            return True
+
+        try:
+            oldest = time() - self._max_age
+            end = len(data)
+            while offset + _RECORD_HEADER.size <= end:
+                length, crc, timestamp = _RECORD_HEADER.unpack_from(
+                    data, offset
+                )
+                start = offset + _RECORD_HEADER.size
+                record = data[start : start + length]
+                if len(record) != length or zlib.crc32(record) != crc:
+                    _logger.warning(
+                        "Spool segment %s is corrupted, dropping the rest of it.",
+                        path,
+                    )
+                    break
+                if timestamp >= oldest and not send(record):
+                    self._replayed_offsets[path] = offset
+                    return False
+                offset = start + length
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+        with self._lock:
+            self._remove_segment(path)
+        return True
+
+    def _rotate(self) -> None:
+        # must be called while holding self._lock
+        if self._active_file is None:
+            return
+        self._close_active_segment()
+        self._segments.append(self._active_path)
+        self._segment_sizes[self._active_path] = self._active_size
+        self._active_path = None
+        self._active_size = 0
+
+    def _close_active_segment(self) -> None:
+        if self._active_file is not None:
+            self._active_file.close()
+            self._active_file = None
+
+    def _remove_segment(self, path: str) -> None:
+        # must be called while holding self._lock
+        if path not in self._segment_sizes:
+            return
+        self._segments.remove(path)
+        self._size -= self._segment_sizes.pop(path)
+        self._replayed_offsets.pop(path, None)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,203 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers that write protobuf wire format directly into a bytearray.
+
+They produce the same bytes as building the corresponding protobuf messages
+and calling ``SerializeToString`` on them, without creating the intermediate
+message objects. Fields are written in field number order and fields set to
+their default value are omitted, except for the members of a oneof.
+"""
+
+import logging
+from collections.abc import Sequence
+from struct import Struct
+from typing import Any, Mapping, Optional
+
+from opentelemetry.exporter.otlp.proto.common._internal import _EncodingCache
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+from opentelemetry.util.types import Attributes
+
+_logger = logging.getLogger(__name__)
+
+_WIRE_TYPE_VARINT = 0
+_WIRE_TYPE_FIXED64 = 1
+_WIRE_TYPE_LENGTH_DELIMITED = 2
+
+_FIXED64 = Struct("<Q")
+_DOUBLE = Struct("<d")
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+_SINGLE_BYTE_VARINTS = tuple(bytes((value,)) for value in range(0x80))
+
+
+def _encode_varint(value: int) -> bytes:
+    if 0 <= value < 0x80:
+        return _SINGLE_BYTE_VARINTS[value]
+    if value < 0:
+        # negative int64 values are written as their two's complement
+        value += 1 << 64
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _tag(field_number: int, wire_type: int) -> bytes:
+    return _encode_varint((field_number << 3) | wire_type)
+
+
+def _write_length_delimited(
+    buffer: bytearray, tag: bytes, payload: bytes
+) -> None:
+    buffer += tag
+    buffer += _encode_varint(len(payload))
+    buffer += payload
+
+
+def _write_string(buffer: bytearray, tag: bytes, value: Optional[str]):
+    if value:
+        _write_length_delimited(buffer, tag, value.encode("utf-8"))
+
+
+def _write_bytes(buffer: bytearray, tag: bytes, value: Optional[bytes]):
+    if value:
+        _write_length_delimited(buffer, tag, value)
+
+
+def _write_varint(buffer: bytearray, tag: bytes, value: Optional[int]):
+    if value:
+        buffer += tag
+        buffer += _encode_varint(value)
+
+
+def _write_fixed64(buffer: bytearray, tag: bytes, value: Optional[int]):
+    if value:
+        buffer += tag
+        buffer += _FIXED64.pack(value)
+
+
+# AnyValue
+_STRING_VALUE_TAG = _tag(1, _WIRE_TYPE_LENGTH_DELIMITED)
+_BOOL_VALUE_TAG = _tag(2, _WIRE_TYPE_VARINT)
+_INT_VALUE_TAG = _tag(3, _WIRE_TYPE_VARINT)
+_DOUBLE_VALUE_TAG = _tag(4, _WIRE_TYPE_FIXED64)
+_ARRAY_VALUE_TAG = _tag(5, _WIRE_TYPE_LENGTH_DELIMITED)
+_KVLIST_VALUE_TAG = _tag(6, _WIRE_TYPE_LENGTH_DELIMITED)
+# ArrayValue and KeyValueList
+_VALUES_TAG = _tag(1, _WIRE_TYPE_LENGTH_DELIMITED)
+# KeyValue
+_KEY_TAG = _tag(1, _WIRE_TYPE_LENGTH_DELIMITED)
+_VALUE_TAG = _tag(2, _WIRE_TYPE_LENGTH_DELIMITED)
+# Resource
+_RESOURCE_ATTRIBUTES_TAG = _tag(1, _WIRE_TYPE_LENGTH_DELIMITED)
+# InstrumentationScope
+_SCOPE_NAME_TAG = _tag(1, _WIRE_TYPE_LENGTH_DELIMITED)
+_SCOPE_VERSION_TAG = _tag(2, _WIRE_TYPE_LENGTH_DELIMITED)
+
+
+def _serialize_value(value: Any) -> bytes:
+    """Serializes an AnyValue, mirroring ``_encode_value``."""
+    # oneof members are written even when set to their default value
+    if isinstance(value, bool):
+        return _BOOL_VALUE_TAG + (b"\x01" if value else b"\x00")
+    if isinstance(value, str):
+        encoded = value.encode("utf-8")
+        return _STRING_VALUE_TAG + _encode_varint(len(encoded)) + encoded
+    if isinstance(value, int):
+        if not _INT64_MIN <= value <= _INT64_MAX:
+            raise ValueError(f"Value out of range: {value}")
+        return _INT_VALUE_TAG + _encode_varint(value)
+    if isinstance(value, float):
+        return _DOUBLE_VALUE_TAG + _DOUBLE.pack(value)
+    if isinstance(value, Sequence):
+        array = bytearray()
+        for element in value:
+            _write_length_delimited(
+                array, _VALUES_TAG, _serialize_value(element)
+            )
+        return _ARRAY_VALUE_TAG + _encode_varint(len(array)) + array
+    if isinstance(value, Mapping):
+        kvlist = bytearray()
+        for key, element in value.items():
+            _write_length_delimited(
+                kvlist, _VALUES_TAG, _serialize_key_value(str(key), element)
+            )
+        return _KVLIST_VALUE_TAG + _encode_varint(len(kvlist)) + kvlist
+    raise Exception(f"Invalid type {type(value)} of value {value}")
+
+
+def _serialize_key_value(key: str, value: Any) -> bytes:
+    if not isinstance(key, str):
+        raise TypeError(f"Invalid type {type(key)} of key {key}")
+    key_value = bytearray()
+    _write_string(key_value, _KEY_TAG, key)
+    _write_length_delimited(key_value, _VALUE_TAG, _serialize_value(value))
+    return bytes(key_value)
+
+
+def _write_attributes(
+    buffer: bytearray, tag: bytes, attributes: Attributes
+) -> None:
+    """Writes attributes as a repeated KeyValue field, mirroring
+    ``_encode_attributes``."""
+    if attributes:
+        for key, value in attributes.items():
+            try:
+                key_value = _serialize_key_value(key, value)
+            except Exception as error:  # pylint: disable=broad-except
+                _logger.exception(error)
+                continue
+            _write_length_delimited(buffer, tag, key_value)
+
+
+def _serialize_resource_uncached(resource: Resource) -> bytes:
+    serialized = bytearray()
+    _write_attributes(
+        serialized, _RESOURCE_ATTRIBUTES_TAG, resource.attributes
+    )
+    return bytes(serialized)
+
+
+def _serialize_instrumentation_scope_uncached(
+    instrumentation_scope: Optional[InstrumentationScope],
+) -> bytes:
+    serialized = bytearray()
+    if instrumentation_scope is not None:
+        _write_string(serialized, _SCOPE_NAME_TAG, instrumentation_scope.name)
+        _write_string(
+            serialized, _SCOPE_VERSION_TAG, instrumentation_scope.version
+        )
+    return bytes(serialized)
+
+
+_serialized_resource_cache = _EncodingCache(_serialize_resource_uncached)
+_serialized_instrumentation_scope_cache = _EncodingCache(
+    _serialize_instrumentation_scope_uncached
+)
+
+
+def _serialize_resource(resource: Resource) -> bytes:
+    return _serialized_resource_cache.get(resource)
+
+
+def _serialize_instrumentation_scope(
+    instrumentation_scope: Optional[InstrumentationScope],
+) -> bytes:
+    return _serialized_instrumentation_scope_cache.get(instrumentation_scope)
@@ -27,6 +27,8 @@ from opentelemetry.sdk.metrics import (
 )
 from opentelemetry.exporter.otlp.proto.common._internal import (
     _encode_attributes,
+    _encode_instrumentation_scope,
+    _encode_resource,
 )
 from opentelemetry.sdk.environment_variables import (
     OTEL_EXPORTER_OTLP_METRICS_TEMPORALITY_PREFERENCE,
@@ -37,7 +39,6 @@ from opentelemetry.sdk.metrics.export import (
 from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import (
     ExportMetricsServiceRequest,
 )
-from opentelemetry.proto.common.v1.common_pb2 import InstrumentationScope
 from opentelemetry.proto.metrics.v1 import metrics_pb2 as pb2
 from opentelemetry.sdk.metrics.export import (
     MetricsData,
@@ -47,9 +48,6 @@ from opentelemetry.sdk.metrics.export import (
     ExponentialHistogram as ExponentialHistogramType,
 )
 from typing import Dict
-from opentelemetry.proto.resource.v1.resource_pb2 import (
-    Resource as PB2Resource,
-)
 from opentelemetry.sdk.environment_variables import (
     OTEL_EXPORTER_OTLP_METRICS_DEFAULT_HISTOGRAM_AGGREGATION,
 )
@@ -175,10 +173,7 @@ def encode_metrics(data: MetricsData) -> ExportMetricsServiceRequest:
             # there is no need to check for existing instrumentation scopes
             # here.
             pb2_scope_metrics = pb2.ScopeMetrics(
-                scope=InstrumentationScope(
-                    name=instrumentation_scope.name,
-                    version=instrumentation_scope.version,
-                )
+                scope=_encode_instrumentation_scope(instrumentation_scope)
             )
 
             scope_metrics_dict[instrumentation_scope] = pb2_scope_metrics
@@ -308,9 +303,7 @@ def encode_metrics(data: MetricsData) -> ExportMetricsServiceRequest:
     ) in resource_metrics_dict.items():
         resource_data.append(
             pb2.ResourceMetrics(
-                resource=PB2Resource(
-                    attributes=_encode_attributes(sdk_resource.attributes)
-                ),
+                resource=_encode_resource(sdk_resource),
                 scope_metrics=scope_data.values(),
             )
         )
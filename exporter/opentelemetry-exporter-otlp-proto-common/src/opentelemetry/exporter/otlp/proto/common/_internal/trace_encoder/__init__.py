@@ -23,6 +23,20 @@ from opentelemetry.exporter.otlp.proto.common._internal import (
     _encode_attributes,
     _encode_resource,
 )
+from opentelemetry.exporter.otlp.proto.common._internal._wire_format import (
+    _WIRE_TYPE_FIXED64,
+    _WIRE_TYPE_LENGTH_DELIMITED,
+    _WIRE_TYPE_VARINT,
+    _serialize_instrumentation_scope,
+    _serialize_resource,
+    _tag,
+    _write_attributes,
+    _write_bytes,
+    _write_fixed64,
+    _write_length_delimited,
+    _write_string,
+    _write_varint,
+)
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
     ExportTraceServiceRequest as PB2ExportTraceServiceRequest,
 )
@@ -50,6 +64,44 @@ _SPAN_KIND_MAP = {
 
 _logger = logging.getLogger(__name__)
 
+# ExportTraceServiceRequest
+_RESOURCE_SPANS_TAG = _tag(1, _WIRE_TYPE_LENGTH_DELIMITED)
+# ResourceSpans
+_RESOURCE_TAG = _tag(1, _WIRE_TYPE_LENGTH_DELIMITED)
+_SCOPE_SPANS_TAG = _tag(2, _WIRE_TYPE_LENGTH_DELIMITED)
+# ScopeSpans
+_SCOPE_TAG = _tag(1, _WIRE_TYPE_LENGTH_DELIMITED)
+_SPANS_TAG = _tag(2, _WIRE_TYPE_LENGTH_DELIMITED)
+# Span
+_SPAN_TRACE_ID_TAG = _tag(1, _WIRE_TYPE_LENGTH_DELIMITED)
+_SPAN_SPAN_ID_TAG = _tag(2, _WIRE_TYPE_LENGTH_DELIMITED)
+_SPAN_TRACE_STATE_TAG = _tag(3, _WIRE_TYPE_LENGTH_DELIMITED)
+_SPAN_PARENT_SPAN_ID_TAG = _tag(4, _WIRE_TYPE_LENGTH_DELIMITED)
+_SPAN_NAME_TAG = _tag(5, _WIRE_TYPE_LENGTH_DELIMITED)
+_SPAN_KIND_TAG = _tag(6, _WIRE_TYPE_VARINT)
+_SPAN_START_TIME_TAG = _tag(7, _WIRE_TYPE_FIXED64)
+_SPAN_END_TIME_TAG = _tag(8, _WIRE_TYPE_FIXED64)
+_SPAN_ATTRIBUTES_TAG = _tag(9, _WIRE_TYPE_LENGTH_DELIMITED)
+_SPAN_DROPPED_ATTRIBUTES_TAG = _tag(10, _WIRE_TYPE_VARINT)
+_SPAN_EVENTS_TAG = _tag(11, _WIRE_TYPE_LENGTH_DELIMITED)
+_SPAN_DROPPED_EVENTS_TAG = _tag(12, _WIRE_TYPE_VARINT)
+_SPAN_LINKS_TAG = _tag(13, _WIRE_TYPE_LENGTH_DELIMITED)
+_SPAN_DROPPED_LINKS_TAG = _tag(14, _WIRE_TYPE_VARINT)
+_SPAN_STATUS_TAG = _tag(15, _WIRE_TYPE_LENGTH_DELIMITED)
+# Span.Event
+_EVENT_TIME_TAG = _tag(1, _WIRE_TYPE_FIXED64)
+_EVENT_NAME_TAG = _tag(2, _WIRE_TYPE_LENGTH_DELIMITED)
+_EVENT_ATTRIBUTES_TAG = _tag(3, _WIRE_TYPE_LENGTH_DELIMITED)
+_EVENT_DROPPED_ATTRIBUTES_TAG = _tag(4, _WIRE_TYPE_VARINT)
+# Span.Link
+_LINK_TRACE_ID_TAG = _tag(1, _WIRE_TYPE_LENGTH_DELIMITED)
+_LINK_SPAN_ID_TAG = _tag(2, _WIRE_TYPE_LENGTH_DELIMITED)
+_LINK_ATTRIBUTES_TAG = _tag(4, _WIRE_TYPE_LENGTH_DELIMITED)
+_LINK_DROPPED_ATTRIBUTES_TAG = _tag(5, _WIRE_TYPE_VARINT)
+# Status
+_STATUS_MESSAGE_TAG = _tag(2, _WIRE_TYPE_LENGTH_DELIMITED)
+_STATUS_CODE_TAG = _tag(3, _WIRE_TYPE_VARINT)
+
 
 def encode_spans(
     sdk_spans: Sequence[ReadableSpan],
@@ -59,6 +111,118 @@ def encode_spans(
     )
 
 
+def serialize_spans(sdk_spans: Sequence[ReadableSpan]) -> bytes:
+    """Serializes spans into an ExportTraceServiceRequest.
+
+    The result is the same as ``encode_spans(sdk_spans).SerializeToString()``
+    but the spans are written straight into the protobuf wire format, without
+    building the intermediate protobuf message objects.
+    """
+    sdk_resource_spans = defaultdict(lambda: defaultdict(list))
+
+    for sdk_span in sdk_spans:
+        sdk_resource_spans[sdk_span.resource][
+            sdk_span.instrumentation_scope or None
+        ].append(_serialize_span(sdk_span))
+
+    request = bytearray()
+
+    for sdk_resource, sdk_instrumentations in sdk_resource_spans.items():
+        resource_spans = bytearray()
+        _write_length_delimited(
+            resource_spans, _RESOURCE_TAG, _serialize_resource(sdk_resource)
+        )
+        for (
+            sdk_instrumentation,
+            serialized_spans,
+        ) in sdk_instrumentations.items():
+            scope_spans = bytearray()
+            _write_length_delimited(
+                scope_spans,
+                _SCOPE_TAG,
+                _serialize_instrumentation_scope(sdk_instrumentation),
+            )
+            for serialized_span in serialized_spans:
+                _write_length_delimited(
+                    scope_spans, _SPANS_TAG, serialized_span
+                )
+            _write_length_delimited(
+                resource_spans, _SCOPE_SPANS_TAG, scope_spans
+            )
+        _write_length_delimited(request, _RESOURCE_SPANS_TAG, resource_spans)
+
+    return bytes(request)
+
+
+def _serialize_span(sdk_span: ReadableSpan) -> bytearray:
+    span_context = sdk_span.get_span_context()
+    span = bytearray()
+    _write_bytes(
+        span, _SPAN_TRACE_ID_TAG, _encode_trace_id(span_context.trace_id)
+    )
+    _write_bytes(
+        span, _SPAN_SPAN_ID_TAG, _encode_span_id(span_context.span_id)
+    )
+    _write_string(
+        span,
+        _SPAN_TRACE_STATE_TAG,
+        _encode_trace_state(span_context.trace_state),
+    )
+    _write_bytes(
+        span, _SPAN_PARENT_SPAN_ID_TAG, _encode_parent_id(sdk_span.parent)
+    )
+    _write_string(span, _SPAN_NAME_TAG, sdk_span.name)
+    _write_varint(span, _SPAN_KIND_TAG, _SPAN_KIND_MAP[sdk_span.kind])
+    _write_fixed64(span, _SPAN_START_TIME_TAG, sdk_span.start_time)
+    _write_fixed64(span, _SPAN_END_TIME_TAG, sdk_span.end_time)
+    _write_attributes(span, _SPAN_ATTRIBUTES_TAG, sdk_span.attributes)
+    _write_varint(
+        span, _SPAN_DROPPED_ATTRIBUTES_TAG, sdk_span.dropped_attributes
+    )
+    for event in sdk_span.events:
+        _write_length_delimited(
+            span, _SPAN_EVENTS_TAG, _serialize_event(event)
+        )
+    _write_varint(span, _SPAN_DROPPED_EVENTS_TAG, sdk_span.dropped_events)
+    for link in sdk_span.links:
+        _write_length_delimited(span, _SPAN_LINKS_TAG, _serialize_link(link))
+    _write_varint(span, _SPAN_DROPPED_LINKS_TAG, sdk_span.dropped_links)
+    if sdk_span.status is not None:
+        status = bytearray()
+        _write_string(status, _STATUS_MESSAGE_TAG, sdk_span.status.description)
+        _write_varint(
+            status, _STATUS_CODE_TAG, sdk_span.status.status_code.value
+        )
+        _write_length_delimited(span, _SPAN_STATUS_TAG, status)
+    return span
+
+
+def _serialize_event(event: Event) -> bytearray:
+    serialized = bytearray()
+    _write_fixed64(serialized, _EVENT_TIME_TAG, event.timestamp)
+    _write_string(serialized, _EVENT_NAME_TAG, event.name)
+    _write_attributes(serialized, _EVENT_ATTRIBUTES_TAG, event.attributes)
+    _write_varint(
+        serialized, _EVENT_DROPPED_ATTRIBUTES_TAG, event.attributes.dropped
+    )
+    return serialized
+
+
+def _serialize_link(link: Link) -> bytearray:
+    serialized = bytearray()
+    _write_bytes(
+        serialized, _LINK_TRACE_ID_TAG, _encode_trace_id(link.context.trace_id)
+    )
+    _write_bytes(
+        serialized, _LINK_SPAN_ID_TAG, _encode_span_id(link.context.span_id)
+    )
+    _write_attributes(serialized, _LINK_ATTRIBUTES_TAG, link.attributes)
+    _write_varint(
+        serialized, _LINK_DROPPED_ATTRIBUTES_TAG, link.attributes.dropped
+    )
+    return serialized
+
+
 def _encode_resource_spans(
     sdk_spans: Sequence[ReadableSpan],
 ) -> List[PB2ResourceSpans]:
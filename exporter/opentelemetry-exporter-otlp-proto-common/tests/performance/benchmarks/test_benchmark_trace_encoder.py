@@ -0,0 +1,66 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import (
+    encode_spans,
+    serialize_spans,
+)
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider, sampling
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+
+def get_spans(number_of_spans=512):
+    span_exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider(
+        sampler=sampling.DEFAULT_ON,
+        resource=Resource({"service.name": "benchmarked-service"}),
+    )
+    tracer_provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    tracer = tracer_provider.get_tracer("encoder_benchmark_tracer")
+
+    for index in range(number_of_spans):
+        with tracer.start_as_current_span(
+            "benchmarkedSpan",
+            attributes={
+                "http.method": "GET",
+                "http.status_code": 200,
+                "http.url": f"https://example.com/{index}",
+                "latency": 0.123,
+            },
+        ) as span:
+            span.add_event("benchmarkEvent", {"index": index})
+
+    return span_exporter.get_finished_spans()
+
+
+def test_encode_spans(benchmark):
+    spans = get_spans()
+
+    def encode():
+        return encode_spans(spans).SerializeToString()
+
+    benchmark(encode)
+
+
+def test_serialize_spans(benchmark):
+    spans = get_spans()
+
+    def serialize():
+        return serialize_spans(spans)
+
+    benchmark(serialize)
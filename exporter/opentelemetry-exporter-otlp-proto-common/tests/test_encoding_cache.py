@@ -0,0 +1,99 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest.mock import Mock
+
+from opentelemetry.exporter.otlp.proto.common._internal import (
+    _encode_instrumentation_scope,
+    _encode_resource,
+    _EncodingCache,
+)
+from opentelemetry.exporter.otlp.proto.common._internal._wire_format import (
+    _serialize_instrumentation_scope,
+    _serialize_resource,
+)
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+
+
+class TestEncodingCache(unittest.TestCase):
+    def test_encodes_once(self):
+        encode = Mock(side_effect=lambda obj: obj.upper())
+        cache = _EncodingCache(encode)
+        obj = "resource"
+
+        self.assertEqual(cache.get(obj), "RESOURCE")
+        self.assertEqual(cache.get(obj), "RESOURCE")
+        encode.assert_called_once_with(obj)
+
+    def test_keyed_by_identity(self):
+        encode = Mock(side_effect=lambda obj: obj.attributes["key"])
+        cache = _EncodingCache(encode)
+        resource = Resource.create({"key": "value"})
+        equal_resource = Resource.create({"key": "value"})
+
+        self.assertEqual(resource, equal_resource)
+        cache.get(resource)
+        cache.get(equal_resource)
+        self.assertEqual(encode.call_count, 2)
+
+    def test_evicts_least_recently_used(self):
+        encode = Mock(side_effect=lambda obj: obj[0])
+        cache = _EncodingCache(encode, maxsize=2)
+        first, second, third = [1], [2], [3]
+
+        cache.get(first)
+        cache.get(second)
+        cache.get(first)
+        cache.get(third)
+        self.assertEqual(len(cache._entries), 2)
+
+        encode.reset_mock()
+        cache.get(first)
+        cache.get(third)
+        encode.assert_not_called()
+        cache.get(second)
+        encode.assert_called_once_with(second)
+
+    def test_clear(self):
+        encode = Mock(side_effect=lambda obj: obj)
+        cache = _EncodingCache(encode)
+        obj = object()
+
+        cache.get(obj)
+        cache.clear()
+        cache.get(obj)
+        self.assertEqual(encode.call_count, 2)
+
+    def test_encoders_reuse_encodings(self):
+        resource = Resource({"service.name": "service"})
+        scope = InstrumentationScope("name", "version")
+
+        self.assertIs(_encode_resource(resource), _encode_resource(resource))
+        self.assertIs(
+            _encode_instrumentation_scope(scope),
+            _encode_instrumentation_scope(scope),
+        )
+        self.assertIs(
+            _serialize_resource(resource), _serialize_resource(resource)
+        )
+        self.assertIs(
+            _serialize_instrumentation_scope(scope),
+            _serialize_instrumentation_scope(scope),
+        )
+        self.assertEqual(
+            _encode_resource(resource).SerializeToString(),
+            _serialize_resource(resource),
+        )
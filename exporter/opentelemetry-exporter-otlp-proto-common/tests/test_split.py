@@ -0,0 +1,235 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest.mock import patch
+
+from opentelemetry.exporter.otlp.proto.common._internal._split import (
+    _split_metrics_request,
+    _split_request,
+)
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import (
+    ExportMetricsServiceRequest,
+)
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
+    ExportTraceServiceRequest,
+)
+from opentelemetry.proto.common.v1.common_pb2 import (
+    AnyValue,
+    InstrumentationScope,
+    KeyValue,
+)
+from opentelemetry.proto.metrics.v1 import metrics_pb2
+from opentelemetry.proto.resource.v1.resource_pb2 import Resource
+from opentelemetry.proto.trace.v1 import trace_pb2
+
+
+def _resource(name):
+    return Resource(
+        attributes=[
+            KeyValue(key="service.name", value=AnyValue(string_value=name))
+        ]
+    )
+
+
+def _trace_request():
+    return ExportTraceServiceRequest(
+        resource_spans=[
+            trace_pb2.ResourceSpans(
+                resource=_resource(f"service-{resource}"),
+                schema_url="https://opentelemetry.io/schemas/1.21.0",
+                scope_spans=[
+                    trace_pb2.ScopeSpans(
+                        scope=InstrumentationScope(
+                            name=f"scope-{scope}", version="1.0"
+                        ),
+                        spans=[
+                            trace_pb2.Span(
+                                trace_id=bytes(16),
+                                span_id=span.to_bytes(8, "big"),
+                                name=f"span-{resource}-{scope}-{span}",
+                            )
+                            for span in range(10)
+                        ],
+                    )
+                    for scope in range(3)
+                ],
+            )
+            for resource in range(2)
+        ]
+    )
+
+
+def _spans(request):
+    return [
+        (resource_spans.resource, resource_spans.schema_url, scope_spans.scope)
+        + (span,)
+        for resource_spans in request.resource_spans
+        for scope_spans in resource_spans.scope_spans
+        for span in scope_spans.spans
+    ]
+
+
+def _metrics_request(points=50):
+    return ExportMetricsServiceRequest(
+        resource_metrics=[
+            metrics_pb2.ResourceMetrics(
+                resource=_resource("service"),
+                scope_metrics=[
+                    metrics_pb2.ScopeMetrics(
+                        scope=InstrumentationScope(name="scope"),
+                        metrics=[
+                            metrics_pb2.Metric(
+                                name="requests",
+                                unit="1",
+                                sum=metrics_pb2.Sum(
+                                    aggregation_temporality=2,
+                                    is_monotonic=True,
+                                    data_points=[
+                                        metrics_pb2.NumberDataPoint(
+                                            attributes=[
+                                                KeyValue(
+                                                    key="id",
+                                                    value=AnyValue(
+                                                        int_value=point
+                                                    ),
+                                                )
+                                            ],
+                                            as_int=point,
+                                        )
+                                        for point in range(points)
+                                    ],
+                                ),
+                            )
+                        ],
+                    )
+                ],
+            )
+        ]
+    )
+
+
+class TestSplitRequest(unittest.TestCase):
+    def test_small_request_not_split(self):
+        serialized = _trace_request().SerializeToString()
+
+        self.assertEqual(
+            _split_request(serialized, len(serialized)), [serialized]
+        )
+
+    def test_split_between_items(self):
+        request = _trace_request()
+        serialized = request.SerializeToString()
+
+        for max_size in (200, 500, 1000, len(serialized) - 1):
+            with self.subTest(max_size=max_size):
+                split_requests = _split_request(serialized, max_size)
+
+                self.assertGreater(len(split_requests), 1)
+                spans = []
+                for split_request in split_requests:
+                    self.assertLessEqual(len(split_request), max_size)
+                    spans.extend(
+                        _spans(
+                            ExportTraceServiceRequest.FromString(split_request)
+                        )
+                    )
+                self.assertEqual(spans, _spans(request))
+
+    def test_item_larger_than_max_size(self):
+        request = _trace_request()
+        serialized = request.SerializeToString()
+
+        with self.assertLogs(level="WARNING"):
+            split_requests = _split_request(serialized, 50)
+
+        self.assertEqual(len(split_requests), 60)
+        spans = []
+        for split_request in split_requests:
+            spans.extend(
+                _spans(ExportTraceServiceRequest.FromString(split_request))
+            )
+        self.assertEqual(spans, _spans(request))
+
+    def test_split_metric_data_points(self):
+        request = _metrics_request()
+        serialized = request.SerializeToString()
+        max_size = 300
+
+        split_requests = _split_metrics_request(serialized, max_size)
+
+        self.assertGreater(len(split_requests), 1)
+        data_points = []
+        for split_request in split_requests:
+            self.assertLessEqual(len(split_request), max_size)
+            split = ExportMetricsServiceRequest.FromString(split_request)
+            (resource_metrics,) = split.resource_metrics
+            self.assertEqual(
+                resource_metrics.resource,
+                request.resource_metrics[0].resource,
+            )
+            (scope_metrics,) = resource_metrics.scope_metrics
+            (metric,) = scope_metrics.metrics
+            self.assertEqual(metric.name, "requests")
+            self.assertEqual(metric.unit, "1")
+            self.assertEqual(metric.sum.aggregation_temporality, 2)
+            self.assertTrue(metric.sum.is_monotonic)
+            data_points.extend(metric.sum.data_points)
+
+        self.assertEqual(
+            data_points,
+            list(
+                request.resource_metrics[0]
+                .scope_metrics[0]
+                .metrics[0]
+                .sum.data_points
+            ),
+        )
+
+    def test_split_requests_fit_max_size(self):
+        request = _metrics_request(300)
+        serialized = request.SerializeToString()
+
+        for max_size in range(100, len(serialized), 13):
+            with self.subTest(max_size=max_size), patch(
+                "opentelemetry.exporter.otlp.proto.common._internal._split."
+                "_logger"
+            ) as logger:
+                split_requests = _split_metrics_request(serialized, max_size)
+
+                oversized = 0
+                data_points = []
+                for split_request in split_requests:
+                    (metric,) = (
+                        ExportMetricsServiceRequest.FromString(split_request)
+                        .resource_metrics[0]
+                        .scope_metrics[0]
+                        .metrics
+                    )
+                    data_points.extend(metric.sum.data_points)
+                    if len(split_request) > max_size:
+                        # only a metric with a single data point can not be
+                        # split to fit
+                        self.assertEqual(len(metric.sum.data_points), 1)
+                        oversized += 1
+                self.assertEqual(logger.warning.call_count, oversized)
+                self.assertEqual(
+                    data_points,
+                    list(
+                        request.resource_metrics[0]
+                        .scope_metrics[0]
+                        .metrics[0]
+                        .sum.data_points
+                    ),
+                )
@@ -0,0 +1,212 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=protected-access
+
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from opentelemetry.exporter.otlp.proto.common.spool import DiskSpool
+
+
+class TestDiskSpool(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = self._directory.name
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def _segments(self):
+        return sorted(
+            name
+            for name in os.listdir(self.directory)
+            if name.endswith(".seg")
+        )
+
+    def test_invalid_arguments(self):
+        for kwargs in (
+            {"max_size": 0},
+            {"max_age": 0},
+            {"max_segment_size": 0},
+            {"replay_interval": 0},
+        ):
+            with self.assertRaises(ValueError):
+                DiskSpool(self.directory, **kwargs)
+
+    def test_replay(self):
+        spool = DiskSpool(self.directory)
+        for data in (b"first", b"", b"third"):
+            self.assertTrue(spool.append(data))
+        self.assertGreater(spool.size, 0)
+
+        sent = []
+        self.assertTrue(spool.replay(lambda data: sent.append(data) or True))
+        self.assertEqual(sent, [b"first", b"", b"third"])
+        self.assertEqual(spool.size, 0)
+        self.assertEqual(self._segments(), [])
+
+        sent.clear()
+        self.assertTrue(spool.replay(lambda data: sent.append(data) or True))
+        self.assertEqual(sent, [])
+
+    def test_replay_stops_at_failure(self):
+        spool = DiskSpool(self.directory)
+        for data in (b"first", b"second", b"third"):
+            spool.append(data)
+
+        sent = []
+
+        def send(data):
+            sent.append(data)
+            return data != b"second"
+
+        self.assertFalse(spool.replay(send))
+        self.assertEqual(sent, [b"first", b"second"])
+
+        # already delivered batches are not replayed again
+        sent.clear()
+        self.assertTrue(spool.replay(lambda data: sent.append(data) or True))
+        self.assertEqual(sent, [b"second", b"third"])
+
+    def test_segment_rotation(self):
+        spool = DiskSpool(self.directory, max_segment_size=20)
+        for index in range(3):
+            spool.append(b"x" * 10 + bytes([index]))
+        self.assertEqual(len(self._segments()), 3)
+
+        sent = []
+        spool.replay(lambda data: sent.append(data) or True)
+        self.assertEqual([data[-1] for data in sent], [0, 1, 2])
+
+    def test_max_size_drops_oldest_segment(self):
+        spool = DiskSpool(self.directory, max_size=100, max_segment_size=1)
+        for index in range(5):
+            spool.append(bytes([index]) * 30)
+        self.assertLessEqual(spool.size, 100)
+
+        sent = []
+        spool.replay(lambda data: sent.append(data) or True)
+        self.assertEqual([data[0] for data in sent], [3, 4])
+
+    def test_batch_larger_than_spool(self):
+        spool = DiskSpool(self.directory, max_size=10)
+        with self.assertLogs(level="WARNING"):
+            self.assertFalse(spool.append(b"x" * 10))
+        self.assertEqual(spool.size, 0)
+
+    def test_max_age(self):
+        spool = DiskSpool(self.directory, max_age=10)
+        with patch(
+            "opentelemetry.exporter.otlp.proto.common._internal._spool.time",
+            return_value=100,
+        ):
+            spool.append(b"old")
+        with patch(
+            "opentelemetry.exporter.otlp.proto.common._internal._spool.time",
+            return_value=105,
+        ):
+            spool.append(b"new")
+        with patch(
+            "opentelemetry.exporter.otlp.proto.common._internal._spool.time",
+            return_value=112,
+        ):
+            sent = []
+            self.assertTrue(
+                spool.replay(lambda data: sent.append(data) or True)
+            )
+        self.assertEqual(sent, [b"new"])
+
+    def test_reopen(self):
+        spool = DiskSpool(self.directory)
+        spool.append(b"first")
+        spool.close()
+        self.assertFalse(spool.append(b"dropped"))
+
+        spool = DiskSpool(self.directory)
+        self.assertGreater(spool.size, 0)
+        spool.append(b"second")
+
+        sent = []
+        spool.replay(lambda data: sent.append(data) or True)
+        self.assertEqual(sent, [b"first", b"second"])
+        self.assertEqual(self._segments(), [])
+
+    def test_append_after_close(self):
+        spool = DiskSpool(self.directory)
+        spool.close()
+
+        with self.assertLogs(level="WARNING"):
+            self.assertFalse(spool.append(b"dropped"))
+        self.assertEqual(spool.size, 0)
+        self.assertEqual(self._segments(), [])
+
+    def test_stray_segment_files_ignored(self):
+        spool = DiskSpool(self.directory)
+        spool.append(b"first")
+        spool.close()
+        for name in ("backup.seg", "00000000000000000001.old.seg"):
+            with open(os.path.join(self.directory, name), "wb"):
+                pass
+
+        with self.assertLogs(level="WARNING"):
+            spool = DiskSpool(self.directory)
+        spool.append(b"second")
+
+        sent = []
+        spool.replay(lambda data: sent.append(data) or True)
+        self.assertEqual(sent, [b"first", b"second"])
+        self.assertEqual(
+            self._segments(), ["00000000000000000001.old.seg", "backup.seg"]
+        )
+
+    def test_corrupted_segment(self):
+        spool = DiskSpool(self.directory)
+        spool.append(b"first")
+        spool.append(b"second")
+        spool.close()
+
+        path = os.path.join(self.directory, self._segments()[0])
+        with open(path, "r+b") as segment_file:
+            segment_file.truncate(os.path.getsize(path) - 1)
+
+        spool = DiskSpool(self.directory)
+        sent = []
+        with self.assertLogs(level="WARNING"):
+            spool.replay(lambda data: sent.append(data) or True)
+        self.assertEqual(sent, [b"first"])
+        self.assertEqual(self._segments(), [])
+
+    def test_background_replay(self):
+        spool = DiskSpool(self.directory, replay_interval=60)
+        sent = []
+        replayed = threading.Event()
+
+        def send(data):
+            sent.append(data)
+            replayed.set()
+            return True
+
+        spool.start(send)
+        try:
+            spool.append(b"first")
+            spool.notify()
+            self.assertTrue(replayed.wait(10))
+            self.assertEqual(sent, [b"first"])
+        finally:
+            spool.close()
+        self.assertFalse(spool._worker_thread.is_alive())
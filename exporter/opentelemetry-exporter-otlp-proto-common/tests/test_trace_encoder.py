@@ -14,18 +14,27 @@
 
 # pylint: disable=protected-access
 
+import math
 import unittest
 from typing import List, Tuple
 
 from opentelemetry.exporter.otlp.proto.common._internal import (
+    _encode_attributes,
     _encode_span_id,
     _encode_trace_id,
 )
+from opentelemetry.exporter.otlp.proto.common._internal._wire_format import (
+    _encode_varint,
+    _write_attributes,
+)
 from opentelemetry.exporter.otlp.proto.common._internal.trace_encoder import (
     _SPAN_KIND_MAP,
     _encode_status,
 )
-from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import (
+    encode_spans,
+    serialize_spans,
+)
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
     ExportTraceServiceRequest as PB2ExportTraceServiceRequest,
 )
@@ -46,6 +55,7 @@ from opentelemetry.proto.trace.v1.trace_pb2 import Status as PB2Status
 from opentelemetry.sdk.trace import Event as SDKEvent
 from opentelemetry.sdk.trace import Resource as SDKResource
 from opentelemetry.sdk.trace import SpanContext as SDKSpanContext
+from opentelemetry.sdk.trace import SpanLimits
 from opentelemetry.sdk.trace import _Span as SDKSpan
 from opentelemetry.sdk.util.instrumentation import (
     InstrumentationScope as SDKInstrumentationScope,
@@ -53,6 +63,7 @@ from opentelemetry.sdk.util.instrumentation import (
 from opentelemetry.trace import Link as SDKLink
 from opentelemetry.trace import SpanKind as SDKSpanKind
 from opentelemetry.trace import TraceFlags as SDKTraceFlags
+from opentelemetry.trace import TraceState as SDKTraceState
 from opentelemetry.trace.status import Status as SDKStatus
 from opentelemetry.trace.status import StatusCode as SDKStatusCode
 
@@ -376,3 +387,141 @@ class TestOTLPTraceEncoder(unittest.TestCase):
                 code=SDKStatusCode.ERROR.value,
             ),
         )
+
+
+class TestOTLPTraceWireFormat(unittest.TestCase):
+    def assertSameSerialization(self, spans):
+        self.assertEqual(
+            serialize_spans(spans), encode_spans(spans).SerializeToString()
+        )
+
+    def test_encode_varint(self):
+        self.assertEqual(_encode_varint(0), b"\x00")
+        self.assertEqual(_encode_varint(127), b"\x7f")
+        self.assertEqual(_encode_varint(300), b"\xac\x02")
+        self.assertEqual(_encode_varint(2**63 - 1), b"\xff" * 8 + b"\x7f")
+        self.assertEqual(_encode_varint(-1), b"\xff" * 9 + b"\x01")
+
+    def test_no_spans(self):
+        self.assertSameSerialization([])
+
+    def test_exhaustive_spans(self):
+        self.assertSameSerialization(
+            TestOTLPTraceEncoder.get_exhaustive_otel_span_list()
+        )
+
+    def test_span_fields(self):
+        trace_id = 0x3E0C63257DE34C926F9EFCD03927272E
+        spans = []
+        for index, (kind, status) in enumerate(
+            zip(
+                SDKSpanKind,
+                (
+                    None,
+                    SDKStatus(SDKStatusCode.OK),
+                    SDKStatus(SDKStatusCode.ERROR, "déscription"),
+                    SDKStatus(SDKStatusCode.ERROR),
+                    SDKStatus(SDKStatusCode.UNSET),
+                ),
+            )
+        ):
+            span = SDKSpan(
+                name=f"span-{index}-ñ",
+                context=SDKSpanContext(
+                    trace_id,
+                    index + 1,
+                    is_remote=False,
+                    trace_flags=SDKTraceFlags(SDKTraceFlags.SAMPLED),
+                    trace_state=SDKTraceState([("k", f"v{index}")])
+                    if index % 2
+                    else None,
+                ),
+                parent=SDKSpanContext(trace_id, 2**64 - 1, is_remote=True)
+                if index % 2
+                else None,
+                kind=kind,
+                resource=SDKResource({"service.name": f"service-{index % 2}"}),
+                instrumentation_scope=(
+                    SDKInstrumentationScope(f"scope-{index % 3}", "1.0")
+                    if index % 3
+                    else None
+                ),
+                limits=SpanLimits(max_attributes=3, max_events=1, max_links=1),
+                links=(
+                    SDKLink(
+                        SDKSpanContext(trace_id, 0x1234, is_remote=False),
+                        {"link.attribute": index},
+                    ),
+                    SDKLink(SDKSpanContext(trace_id, 0x5678, is_remote=False)),
+                ),
+            )
+            span.start(start_time=index)
+            span.set_attributes(
+                {
+                    "int": -index,
+                    "big.int": 2**63 - 1,
+                    "float": -0.0,
+                    "strings": ["a", "", "c"],
+                }
+            )
+            span.add_event("event", {"bools": [True, False]}, timestamp=12)
+            span.add_event("dropped")
+            if status is not None:
+                span.set_status(status)
+            span.end(end_time=index + 2**40)
+            spans.append(span)
+
+        self.assertSameSerialization(spans)
+
+    def test_events(self):
+        span = SDKSpan(
+            name="span",
+            context=SDKSpanContext(1, 2, is_remote=False),
+            events=(
+                SDKEvent("no-attributes", timestamp=0),
+                SDKEvent("attributes", {"a": 1, "b": (1.5, 2.5)}, 10),
+            ),
+        )
+        span.start(start_time=1)
+        span.end(end_time=2)
+        self.assertSameSerialization([span])
+
+    def test_span_not_ended(self):
+        span = SDKSpan(name="", context=SDKSpanContext(1, 2, is_remote=False))
+        self.assertSameSerialization([span])
+
+    def test_attribute_values(self):
+        attributes = {
+            "bool": False,
+            "string": "",
+            "unicode": "日本語",
+            "int": 0,
+            "negative": -(2**63),
+            "float": 0.0,
+            "inf": math.inf,
+            "empty": (),
+            "nested": [[1, 2], ["a"]],
+            "mapping": {"a": {"b": [1.0]}, 1: "c"},
+            "bytes": b"ab",
+            "out-of-range": 2**64,
+            "invalid": object(),
+            "long": "x" * 300,
+        }
+        with self.assertLogs(level="ERROR"):
+            expected = PB2Resource(
+                attributes=_encode_attributes(attributes)
+            ).SerializeToString()
+        serialized = bytearray()
+        with self.assertLogs(level="ERROR"):
+            _write_attributes(serialized, b"\n", attributes)
+        self.assertEqual(bytes(serialized), expected)
+
+        invalid_key = {1: "value", "valid": "value"}
+        with self.assertLogs(level="ERROR"):
+            expected = PB2Resource(
+                attributes=_encode_attributes(invalid_key)
+            ).SerializeToString()
+        serialized = bytearray()
+        with self.assertLogs(level="ERROR"):
+            _write_attributes(serialized, b"\n", invalid_key)
+        self.assertEqual(bytes(serialized), expected)
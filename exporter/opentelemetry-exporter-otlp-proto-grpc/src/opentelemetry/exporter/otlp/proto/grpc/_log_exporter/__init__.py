@@ -17,6 +17,7 @@ from typing import Sequence as TypingSequence
 from grpc import ChannelCredentials, Compression
 
 from opentelemetry.exporter.otlp.proto.common._log_encoder import encode_logs
+from opentelemetry.exporter.otlp.proto.common.spool import DiskSpool
 from opentelemetry.exporter.otlp.proto.grpc.exporter import (
     OTLPExporterMixin,
     _get_credentials,
@@ -49,6 +50,7 @@ class OTLPLogExporter(
 
     _result = LogExportResult
     _stub = LogsServiceStub
+    _request = ExportLogsServiceRequest
 
     def __init__(
         self,
@@ -60,6 +62,7 @@ class OTLPLogExporter(
         ] = None,
         timeout: Optional[int] = None,
         compression: Optional[Compression] = None,
+        spool: Optional[DiskSpool] = None,
     ):
         if insecure is None:
             insecure = environ.get(OTEL_EXPORTER_OTLP_LOGS_INSECURE)
@@ -96,6 +99,7 @@ class OTLPLogExporter(
                 "headers": headers,
                 "timeout": timeout or environ_timeout,
                 "compression": compression,
+                "spool": spool,
             }
         )
 
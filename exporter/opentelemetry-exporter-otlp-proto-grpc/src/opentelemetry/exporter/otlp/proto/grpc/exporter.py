@@ -19,7 +19,6 @@ from abc import ABC, abstractmethod
 from collections.abc import Sequence  # noqa: F401
 from logging import getLogger
 from os import environ
-from time import sleep
 from typing import (  # noqa: F401
     Any,
     Callable,
@@ -40,6 +39,7 @@ from opentelemetry.exporter.otlp.proto.common._internal import (
     _get_resource_data,
     _create_exp_backoff_generator,
 )
+from opentelemetry.exporter.otlp.proto.common.spool import DiskSpool
 from google.rpc.error_details_pb2 import RetryInfo
 from grpc import (
     ChannelCredentials,
@@ -85,6 +85,18 @@ _ENVIRON_TO_COMPRESSION = {
     "gzip": Compression.Gzip,
 }
 
+_RETRYABLE_ERROR_CODES = frozenset(
+    (
+        StatusCode.CANCELLED,
+        StatusCode.DEADLINE_EXCEEDED,
+        StatusCode.RESOURCE_EXHAUSTED,
+        StatusCode.ABORTED,
+        StatusCode.OUT_OF_RANGE,
+        StatusCode.UNAVAILABLE,
+        StatusCode.DATA_LOSS,
+    )
+)
+
 
 class InvalidCompressionValueException(Exception):
     def __init__(self, environ_key: str, environ_value: str):
@@ -150,6 +162,8 @@ class OTLPExporterMixin(
         headers: Headers to send when exporting
         timeout: Backend request timeout in seconds
         compression: gRPC compression method to use
+        spool: DiskSpool where the batches that could not be exported are
+            stored until the endpoint is reachable again
     """
 
     def __init__(
@@ -162,6 +176,7 @@ class OTLPExporterMixin(
         ] = None,
         timeout: Optional[int] = None,
         compression: Optional[Compression] = None,
+        spool: Optional[DiskSpool] = None,
     ):
         super().__init__()
 
@@ -224,6 +239,12 @@ class OTLPExporterMixin(
 
         self._export_lock = threading.Lock()
         self._shutdown = False
+        # set when shutdown starts so that pending retries stop waiting
+        self._shutdown_in_progress = threading.Event()
+
+        self._spool = spool
+        if spool is not None:
+            spool.start(self._export_spooled)
 
     @abstractmethod
     def _translate_data(
@@ -250,59 +271,35 @@ class OTLPExporterMixin(
         #     delay,
         # )
         max_value = 64
+
+        # The data is translated only once, every retry sends the same
+        # request instead of encoding the whole batch again.
+        request = self._translate_data(data)
+
         # expo returns a generator that yields delay values which grow
         # exponentially. Once delay is greater than max_value, the yielded
         # value will remain constant.
         for delay in _create_exp_backoff_generator(max_value=max_value):
             if delay == max_value or self._shutdown:
+                self._spool_request(request)
                 return self._result.FAILURE
 
             with self._export_lock:
                 try:
                     self._client.Export(
-                        request=self._translate_data(data),
+                        request=request,
                         metadata=self._headers,
                         timeout=self._timeout,
                     )
 
+                    if self._spool is not None:
+                        # the endpoint is reachable, replay what was spooled
+                        self._spool.notify()
                     return self._result.SUCCESS
 
                 except RpcError as error:
 
-                    if error.code() in [
-                        StatusCode.CANCELLED,
-                        StatusCode.DEADLINE_EXCEEDED,
-                        StatusCode.RESOURCE_EXHAUSTED,
-                        StatusCode.ABORTED,
-                        StatusCode.OUT_OF_RANGE,
-                        StatusCode.UNAVAILABLE,
-                        StatusCode.DATA_LOSS,
-                    ]:
-
-                        retry_info_bin = dict(error.trailing_metadata()).get(
-                            "google.rpc.retryinfo-bin"
-                        )
-                        if retry_info_bin is not None:
-                            retry_info = RetryInfo()
-                            retry_info.ParseFromString(retry_info_bin)
-                            delay = (
-                                retry_info.retry_delay.seconds
-                                + retry_info.retry_delay.nanos / 1.0e9
-                            )
-
-                        logger.warning(
-                            (
-                                "Transient error %s encountered while exporting "
-                                "%s to %s, retrying in %ss."
-                            ),
-                            error.code(),
-                            self._exporting,
-                            self._endpoint,
-                            delay,
-                        )
-                        sleep(delay)
-                        continue
-                    else:
+                    if error.code() not in _RETRYABLE_ERROR_CODES:
                         logger.error(
                             "Failed to export %s to %s, error code: %s",
                             self._exporting,
@@ -310,21 +307,83 @@ class OTLPExporterMixin(
                             error.code(),
                         )
 
-                    if error.code() == StatusCode.OK:
-                        return self._result.SUCCESS
+                        if error.code() == StatusCode.OK:
+                            return self._result.SUCCESS
 
-                    return self._result.FAILURE
+                        return self._result.FAILURE
 
+                    retry_info_bin = dict(error.trailing_metadata()).get(
+                        "google.rpc.retryinfo-bin"
+                    )
+                    if retry_info_bin is not None:
+                        retry_info = RetryInfo()
+                        retry_info.ParseFromString(retry_info_bin)
+                        delay = (
+                            retry_info.retry_delay.seconds
+                            + retry_info.retry_delay.nanos / 1.0e9
+                        )
+
+                    logger.warning(
+                        (
+                            "Transient error %s encountered while exporting "
+                            "%s to %s, retrying in %ss."
+                        ),
+                        error.code(),
+                        self._exporting,
+                        self._endpoint,
+                        delay,
+                    )
+
+            # The lock is not held while backing off so other exports and
+            # shutdown can proceed, shutdown also interrupts the wait.
+            if self._shutdown_in_progress.wait(delay):
+                self._spool_request(request)
+                return self._result.FAILURE
+
+        self._spool_request(request)
         return self._result.FAILURE
 
+    def _spool_request(self, request: ExportServiceRequestT) -> None:
+        if self._spool is not None:
+            self._spool.append(request.SerializeToString())
+
+    def _export_spooled(self, serialized_request: bytes) -> bool:
+        """Sends a spooled request once, without retrying.
+
+        Returns False if the request should be replayed again later.
+        """
+        if self._shutdown:
+            return False
+
+        with self._export_lock:
+            try:
+                self._client.Export(
+                    request=self._request.FromString(serialized_request),
+                    metadata=self._headers,
+                    timeout=self._timeout,
+                )
+            except RpcError as error:
+                if error.code() in _RETRYABLE_ERROR_CODES:
+                    return False
+                logger.error(
+                    "Failed to export spooled %s to %s, error code: %s",
+                    self._exporting,
+                    self._endpoint,
+                    error.code(),
+                )
+        return True
+
     def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
         if self._shutdown:
             logger.warning("Exporter already shutdown, ignoring call")
             return
+        self._shutdown_in_progress.set()
         # wait for the last export if any
         self._export_lock.acquire(timeout=timeout_millis)
         self._shutdown = True
         self._export_lock.release()
+        if self._spool is not None:
+            self._spool.close()
 
     @property
     @abstractmethod
@@ -67,6 +67,7 @@ from opentelemetry.sdk.metrics.export import (  # noqa: F401
 from opentelemetry.exporter.otlp.proto.common._internal.metrics_encoder import (
     OTLPMetricExporterMixin,
 )
+from opentelemetry.exporter.otlp.proto.common.spool import DiskSpool
 
 _logger = getLogger(__name__)
 
@@ -83,10 +84,13 @@ class OTLPMetricExporter(
         max_export_batch_size: Maximum number of data points to export in a single request. This is to deal with
             gRPC's 4MB message size limit. If not set there is no limit to the number of data points in a request.
             If it is set and the number of data points exceeds the max, the request will be split.
+        spool: DiskSpool where the batches that could not be exported are
+            stored until the endpoint is reachable again
     """
 
     _result = MetricExportResult
     _stub = MetricsServiceStub
+    _request = ExportMetricsServiceRequest
 
     def __init__(
         self,
@@ -101,6 +105,7 @@ class OTLPMetricExporter(
         preferred_temporality: Dict[type, AggregationTemporality] = None,
         preferred_aggregation: Dict[type, Aggregation] = None,
         max_export_batch_size: Optional[int] = None,
+        spool: Optional[DiskSpool] = None,
     ):
 
         if insecure is None:
@@ -138,6 +143,7 @@ class OTLPMetricExporter(
             headers=headers or environ.get(OTEL_EXPORTER_OTLP_METRICS_HEADERS),
             timeout=timeout or environ_timeout,
             compression=compression,
+            spool=spool,
         )
 
         self._max_export_batch_size: Optional[int] = max_export_batch_size
@@ -24,6 +24,7 @@ from grpc import ChannelCredentials, Compression
 from opentelemetry.exporter.otlp.proto.common.trace_encoder import (
     encode_spans,
 )
+from opentelemetry.exporter.otlp.proto.common.spool import DiskSpool
 from opentelemetry.exporter.otlp.proto.grpc.exporter import (
     OTLPExporterMixin,
     _get_credentials,
@@ -78,10 +79,13 @@ class OTLPSpanExporter(
         headers: Headers to send when exporting
         timeout: Backend request timeout in seconds
         compression: gRPC compression method to use
+        spool: DiskSpool where the batches that could not be exported are
+            stored until the endpoint is reachable again
     """
 
     _result = SpanExportResult
     _stub = TraceServiceStub
+    _request = ExportTraceServiceRequest
 
     def __init__(
         self,
@@ -93,6 +97,7 @@ class OTLPSpanExporter(
         ] = None,
         timeout: Optional[int] = None,
         compression: Optional[Compression] = None,
+        spool: Optional[DiskSpool] = None,
     ):
 
         if insecure is None:
@@ -129,6 +134,7 @@ class OTLPSpanExporter(
                 or environ.get(OTEL_EXPORTER_OTLP_TRACES_HEADERS),
                 "timeout": timeout or environ_timeout,
                 "compression": compression,
+                "spool": spool,
             }
         )
 
@@ -16,7 +16,7 @@ import time
 from concurrent.futures import ThreadPoolExecutor
 from os.path import dirname
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from google.protobuf.duration_pb2 import Duration
 from google.rpc.error_details_pb2 import RetryInfo
@@ -295,8 +295,10 @@ class TestOTLPLogExporter(TestCase):
     @patch(
         "opentelemetry.exporter.otlp.proto.grpc.exporter._create_exp_backoff_generator"
     )
-    @patch("opentelemetry.exporter.otlp.proto.grpc.exporter.sleep")
-    def test_unavailable(self, mock_sleep, mock_expo):
+    def test_unavailable(self, mock_expo):
+        mock_wait = Mock(return_value=False)
+        # pylint: disable=protected-access
+        self.exporter._shutdown_in_progress.wait = mock_wait
 
         mock_expo.configure_mock(**{"return_value": [1]})
 
@@ -306,13 +308,15 @@ class TestOTLPLogExporter(TestCase):
         self.assertEqual(
             self.exporter.export([self.log_data_1]), LogExportResult.FAILURE
         )
-        mock_sleep.assert_called_with(1)
+        mock_wait.assert_called_with(1)
 
     @patch(
         "opentelemetry.exporter.otlp.proto.grpc.exporter._create_exp_backoff_generator"
     )
-    @patch("opentelemetry.exporter.otlp.proto.grpc.exporter.sleep")
-    def test_unavailable_delay(self, mock_sleep, mock_expo):
+    def test_unavailable_delay(self, mock_expo):
+        mock_wait = Mock(return_value=False)
+        # pylint: disable=protected-access
+        self.exporter._shutdown_in_progress.wait = mock_wait
 
         mock_expo.configure_mock(**{"return_value": [1]})
 
@@ -322,7 +326,7 @@ class TestOTLPLogExporter(TestCase):
         self.assertEqual(
             self.exporter.export([self.log_data_1]), LogExportResult.FAILURE
         )
-        mock_sleep.assert_called_with(4)
+        mock_wait.assert_called_with(4)
 
     def test_success(self):
         add_LogsServiceServicer_to_server(
@@ -184,23 +184,187 @@ class TestOTLPExporterMixin(TestCase):
                 return "mock"
 
         otlp_mock_exporter = OTLPMockExporter()
+        export_called = threading.Event()
+
+        def export(**kwargs):
+            export_called.set()
+            raise rpc_error
 
         # pylint: disable=protected-access
+        otlp_mock_exporter._client.Export.side_effect = export
+
+        results = []
         export_thread = threading.Thread(
-            target=otlp_mock_exporter._export, args=({},)
+            target=lambda: results.append(otlp_mock_exporter._export({}))
         )
         export_thread.start()
         try:
-            # pylint: disable=protected-access
-            self.assertTrue(otlp_mock_exporter._export_lock.locked())
-            # delay is 1 second while the default shutdown timeout is 30_000 milliseconds
+            self.assertTrue(export_called.wait(10))
+            # the retry delay is 1 second, shutdown does not wait for it
             start_time = time.time()
             otlp_mock_exporter.shutdown()
-            now = time.time()
-            self.assertGreaterEqual(now, (start_time + 30 / 1000))
+            export_thread.join(10)
+            self.assertLess(time.time() - start_time, 1)
+            self.assertEqual(results, [result_mock.FAILURE])
             # pylint: disable=protected-access
             self.assertTrue(otlp_mock_exporter._shutdown)
             # pylint: disable=protected-access
             self.assertFalse(otlp_mock_exporter._export_lock.locked())
         finally:
             export_thread.join()
+
+    @patch(
+        "opentelemetry.exporter.otlp.proto.grpc.exporter._create_exp_backoff_generator"
+    )
+    def test_retry_does_not_translate_again(self, mock_expo):
+        mock_expo.configure_mock(**{"return_value": [0, 0, 0]})
+        result_mock = Mock()
+        rpc_error = RpcError()
+
+        def code(self):
+            return StatusCode.UNAVAILABLE
+
+        def trailing_metadata(self):
+            return {}
+
+        rpc_error.code = MethodType(code, rpc_error)
+        rpc_error.trailing_metadata = MethodType(trailing_metadata, rpc_error)
+        translate_data = Mock()
+
+        class OTLPMockExporter(OTLPExporterMixin):
+            _result = result_mock
+            _stub = Mock(
+                **{
+                    "return_value": Mock(
+                        **{"Export.side_effect": [rpc_error, rpc_error, None]}
+                    )
+                }
+            )
+
+            def _translate_data(
+                self, data: Sequence[SDKDataT]
+            ) -> ExportServiceRequestT:
+                return translate_data(data)
+
+            @property
+            def _exporting(self) -> str:
+                return "mock"
+
+        otlp_mock_exporter = OTLPMockExporter()
+
+        # pylint: disable=protected-access
+        self.assertEqual(otlp_mock_exporter._export({}), result_mock.SUCCESS)
+        translate_data.assert_called_once_with({})
+        self.assertEqual(otlp_mock_exporter._client.Export.call_count, 3)
+        for call in otlp_mock_exporter._client.Export.call_args_list:
+            self.assertIs(call.kwargs["request"], translate_data.return_value)
+
+    def test_backoff_does_not_hold_export_lock(self):
+        result_mock = Mock()
+        rpc_error = RpcError()
+
+        def code(self):
+            return StatusCode.UNAVAILABLE
+
+        def trailing_metadata(self):
+            return {}
+
+        rpc_error.code = MethodType(code, rpc_error)
+        rpc_error.trailing_metadata = MethodType(trailing_metadata, rpc_error)
+
+        class OTLPMockExporter(OTLPExporterMixin):
+            _result = result_mock
+            _stub = Mock(
+                **{"return_value": Mock(**{"Export.side_effect": rpc_error})}
+            )
+
+            def _translate_data(
+                self, data: Sequence[SDKDataT]
+            ) -> ExportServiceRequestT:
+                pass
+
+            @property
+            def _exporting(self) -> str:
+                return "mock"
+
+        otlp_mock_exporter = OTLPMockExporter()
+        lock_held = []
+
+        def wait(delay):
+            # pylint: disable=protected-access
+            lock_held.append(otlp_mock_exporter._export_lock.locked())
+            return True
+
+        # pylint: disable=protected-access
+        otlp_mock_exporter._shutdown_in_progress.wait = wait
+
+        with self.assertLogs(level=WARNING):
+            self.assertEqual(
+                otlp_mock_exporter._export({}), result_mock.FAILURE
+            )
+        self.assertEqual(lock_held, [False])
+
+    @patch(
+        "opentelemetry.exporter.otlp.proto.grpc.exporter._create_exp_backoff_generator"
+    )
+    def test_spools_failed_requests(self, mock_expo):
+        mock_expo.configure_mock(**{"return_value": [0, 64]})
+        result_mock = Mock()
+        rpc_error = RpcError()
+
+        def code(self):
+            return StatusCode.UNAVAILABLE
+
+        def trailing_metadata(self):
+            return {}
+
+        rpc_error.code = MethodType(code, rpc_error)
+        rpc_error.trailing_metadata = MethodType(trailing_metadata, rpc_error)
+        request = RetryInfo(retry_delay=Duration(seconds=3))
+
+        class OTLPMockExporter(OTLPExporterMixin):
+            _result = result_mock
+            _stub = Mock(
+                **{"return_value": Mock(**{"Export.side_effect": rpc_error})}
+            )
+            _request = RetryInfo
+
+            def _translate_data(
+                self, data: Sequence[SDKDataT]
+            ) -> ExportServiceRequestT:
+                return request
+
+            @property
+            def _exporting(self) -> str:
+                return "mock"
+
+        spool = Mock()
+        otlp_mock_exporter = OTLPMockExporter(spool=spool)
+        # pylint: disable=protected-access
+        spool.start.assert_called_once_with(otlp_mock_exporter._export_spooled)
+
+        with self.assertLogs(level=WARNING):
+            # pylint: disable=protected-access
+            self.assertEqual(
+                otlp_mock_exporter._export({}), result_mock.FAILURE
+            )
+        spool.append.assert_called_once_with(request.SerializeToString())
+
+        # pylint: disable=protected-access
+        self.assertFalse(
+            otlp_mock_exporter._export_spooled(request.SerializeToString())
+        )
+        otlp_mock_exporter._client.Export.side_effect = None
+        self.assertTrue(
+            otlp_mock_exporter._export_spooled(request.SerializeToString())
+        )
+        self.assertEqual(
+            otlp_mock_exporter._client.Export.call_args.kwargs["request"],
+            request,
+        )
+
+        self.assertEqual(otlp_mock_exporter._export({}), result_mock.SUCCESS)
+        spool.notify.assert_called_once_with()
+
+        otlp_mock_exporter.shutdown()
+        spool.close.assert_called_once_with()
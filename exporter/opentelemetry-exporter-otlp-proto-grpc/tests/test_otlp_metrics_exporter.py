@@ -22,7 +22,7 @@ from os import environ
 from os.path import dirname
 from typing import List
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from google.protobuf.duration_pb2 import Duration
 from google.rpc.error_details_pb2 import RetryInfo
@@ -410,8 +410,10 @@ class TestOTLPMetricExporter(TestCase):
     @patch(
         "opentelemetry.exporter.otlp.proto.grpc.exporter._create_exp_backoff_generator"
     )
-    @patch("opentelemetry.exporter.otlp.proto.grpc.exporter.sleep")
-    def test_unavailable(self, mock_sleep, mock_expo):
+    def test_unavailable(self, mock_expo):
+        mock_wait = Mock(return_value=False)
+        # pylint: disable=protected-access
+        self.exporter._shutdown_in_progress.wait = mock_wait
 
         mock_expo.configure_mock(**{"return_value": [1]})
 
@@ -422,13 +424,15 @@ class TestOTLPMetricExporter(TestCase):
             self.exporter.export(self.metrics["sum_int"]),
             MetricExportResult.FAILURE,
         )
-        mock_sleep.assert_called_with(1)
+        mock_wait.assert_called_with(1)
 
     @patch(
         "opentelemetry.exporter.otlp.proto.grpc.exporter._create_exp_backoff_generator"
     )
-    @patch("opentelemetry.exporter.otlp.proto.grpc.exporter.sleep")
-    def test_unavailable_delay(self, mock_sleep, mock_expo):
+    def test_unavailable_delay(self, mock_expo):
+        mock_wait = Mock(return_value=False)
+        # pylint: disable=protected-access
+        self.exporter._shutdown_in_progress.wait = mock_wait
 
         mock_expo.configure_mock(**{"return_value": [1]})
 
@@ -439,7 +443,7 @@ class TestOTLPMetricExporter(TestCase):
             self.exporter.export(self.metrics["sum_int"]),
             MetricExportResult.FAILURE,
         )
-        mock_sleep.assert_called_with(4)
+        mock_wait.assert_called_with(4)
 
     def test_success(self):
         add_MetricsServiceServicer_to_server(
@@ -764,13 +768,13 @@ class TestOTLPMetricExporter(TestCase):
         )
         export_thread.start()
         try:
-            # pylint: disable=protected-access
-            self.assertTrue(self.exporter._export_lock.locked())
-            # delay is 4 seconds while the default shutdown timeout is 30_000 milliseconds
+            # delay is 4 seconds while the default shutdown timeout is 30_000
+            # milliseconds, shutdown interrupts the backoff instead of
+            # waiting for it
             start_time = time.time()
             self.exporter.shutdown()
-            now = time.time()
-            self.assertGreaterEqual(now, (start_time + 30 / 1000))
+            export_thread.join(10)
+            self.assertLess(time.time() - start_time, 4)
             # pylint: disable=protected-access
             self.assertTrue(self.exporter._shutdown)
             # pylint: disable=protected-access
@@ -461,8 +461,11 @@ class TestOTLPSpanExporter(TestCase):
         )
 
     @patch("opentelemetry.exporter.otlp.proto.common._internal.backoff")
-    @patch("opentelemetry.exporter.otlp.proto.grpc.exporter.sleep")
-    def test_handles_backoff_v2_api(self, mock_sleep, mock_backoff):
+    def test_handles_backoff_v2_api(self, mock_backoff):
+        mock_wait = Mock(return_value=False)
+        # pylint: disable=protected-access
+        self.exporter._shutdown_in_progress.wait = mock_wait
+
         # In backoff ~= 2.0.0 the first value yielded from expo is None.
         def generate_delays(*args, **kwargs):
             if _is_backoff_v2:
@@ -475,13 +478,15 @@ class TestOTLPSpanExporter(TestCase):
             TraceServiceServicerUNAVAILABLE(), self.server
         )
         self.exporter.export([self.span])
-        mock_sleep.assert_called_once_with(1)
+        mock_wait.assert_called_once_with(1)
 
     @patch(
         "opentelemetry.exporter.otlp.proto.grpc.exporter._create_exp_backoff_generator"
     )
-    @patch("opentelemetry.exporter.otlp.proto.grpc.exporter.sleep")
-    def test_unavailable(self, mock_sleep, mock_expo):
+    def test_unavailable(self, mock_expo):
+        mock_wait = Mock(return_value=False)
+        # pylint: disable=protected-access
+        self.exporter._shutdown_in_progress.wait = mock_wait
 
         mock_expo.configure_mock(**{"return_value": [1]})
 
@@ -490,13 +495,15 @@ class TestOTLPSpanExporter(TestCase):
         )
         result = self.exporter.export([self.span])
         self.assertEqual(result, SpanExportResult.FAILURE)
-        mock_sleep.assert_called_with(1)
+        mock_wait.assert_called_with(1)
 
     @patch(
         "opentelemetry.exporter.otlp.proto.grpc.exporter._create_exp_backoff_generator"
     )
-    @patch("opentelemetry.exporter.otlp.proto.grpc.exporter.sleep")
-    def test_unavailable_delay(self, mock_sleep, mock_expo):
+    def test_unavailable_delay(self, mock_expo):
+        mock_wait = Mock(return_value=False)
+        # pylint: disable=protected-access
+        self.exporter._shutdown_in_progress.wait = mock_wait
 
         mock_expo.configure_mock(**{"return_value": [1]})
 
@@ -506,7 +513,7 @@ class TestOTLPSpanExporter(TestCase):
         self.assertEqual(
             self.exporter.export([self.span]), SpanExportResult.FAILURE
         )
-        mock_sleep.assert_called_with(4)
+        mock_wait.assert_called_with(4)
 
     def test_success(self):
         add_TraceServiceServicer_to_server(
@@ -962,13 +969,13 @@ class TestOTLPSpanExporter(TestCase):
         )
         export_thread.start()
         try:
-            # pylint: disable=protected-access
-            self.assertTrue(self.exporter._export_lock.locked())
-            # delay is 4 seconds while the default shutdown timeout is 30_000 milliseconds
+            # delay is 4 seconds while the default shutdown timeout is 30_000
+            # milliseconds, shutdown interrupts the backoff instead of
+            # waiting for it
             start_time = time.time()
             self.exporter.shutdown()
-            now = time.time()
-            self.assertGreaterEqual(now, (start_time + 30 / 1000))
+            export_thread.join(10)
+            self.assertLess(time.time() - start_time, 4)
             # pylint: disable=protected-access
             self.assertTrue(self.exporter._shutdown)
             # pylint: disable=protected-access
@@ -70,17 +70,97 @@ API
 ---
 """
 import enum
+import logging
+import zlib
+from typing import Iterator, Optional, Union
 
 from .version import __version__
 
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+_logger = logging.getLogger(__name__)
 
 _OTLP_HTTP_HEADERS = {
     "Content-Type": "application/x-protobuf",
     "User-Agent": "OTel-OTLP-Exporter-Python/" + __version__,
 }
 
+# Size of the slices of a payload that are compressed and sent at a time when
+# the request body is streamed.
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# gzip used to be written with gzip.GzipFile, which compresses with level 9
+# by default.
+_DEFAULT_GZIP_LEVEL = 9
+_DEFAULT_ZSTD_LEVEL = 3
+
 
 class Compression(enum.Enum):
     NoCompression = "none"
     Deflate = "deflate"
     Gzip = "gzip"
+    Zstd = "zstd"
+
+
+def _check_compression(compression: Compression) -> Compression:
+    """Returns the compression to use instead of ``compression`` when its
+    library is not installed."""
+    if compression is Compression.Zstd and zstandard is None:
+        _logger.warning(
+            "zstd compression requires the zstandard package, "
+            "using gzip compression instead."
+        )
+        return Compression.Gzip
+    return compression
+
+
+def _compressor(compression: Compression, level: Optional[int]):
+    if compression is Compression.Gzip:
+        return zlib.compressobj(
+            _DEFAULT_GZIP_LEVEL if level is None else level,
+            zlib.DEFLATED,
+            # writes a gzip header and trailer
+            16 + zlib.MAX_WBITS,
+        )
+    if compression is Compression.Deflate:
+        return zlib.compressobj(
+            zlib.Z_DEFAULT_COMPRESSION if level is None else level
+        )
+    return zstandard.ZstdCompressor(
+        level=_DEFAULT_ZSTD_LEVEL if level is None else level
+    ).compressobj()
+
+
+def _compress(
+    serialized_data: bytes,
+    compression: Compression,
+    level: Optional[int] = None,
+    stream: bool = False,
+) -> Union[bytes, Iterator[bytes]]:
+    """Returns the body of the request that sends ``serialized_data``.
+
+    When ``stream`` is true the body is an iterator that compresses the data
+    a slice at a time while it is sent, the compressed payload is never held
+    in memory as a whole.
+    """
+    if compression is Compression.NoCompression:
+        return serialized_data
+    if stream:
+        return _compress_chunks(serialized_data, compression, level)
+    compressor = _compressor(compression, level)
+    return compressor.compress(serialized_data) + compressor.flush()
+
+
+def _compress_chunks(
+    serialized_data: bytes, compression: Compression, level: Optional[int]
+) -> Iterator[bytes]:
+    compressor = _compressor(compression, level)
+    data = memoryview(serialized_data)
+    for start in range(0, len(data), _STREAM_CHUNK_SIZE):
+        chunk = compressor.compress(data[start : start + _STREAM_CHUNK_SIZE])
+        if chunk:
+            yield chunk
+    yield compressor.flush()
@@ -12,12 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import gzip
 import logging
-import zlib
-from io import BytesIO
 from os import environ
-from typing import Dict, Optional, Sequence
+from typing import Dict, List, Optional, Sequence
 from time import sleep
 
 import requests
@@ -25,6 +22,10 @@ import requests
 from opentelemetry.exporter.otlp.proto.common._internal import (
     _create_exp_backoff_generator,
 )
+from opentelemetry.exporter.otlp.proto.common._internal._split import (
+    _split_request,
+)
+from opentelemetry.exporter.otlp.proto.common.spool import DiskSpool
 from opentelemetry.exporter.otlp.proto.common._log_encoder import encode_logs
 from opentelemetry.sdk.environment_variables import (
     OTEL_EXPORTER_OTLP_CERTIFICATE,
@@ -46,6 +47,8 @@ from opentelemetry.sdk._logs.export import (
 from opentelemetry.exporter.otlp.proto.http import (
     _OTLP_HTTP_HEADERS,
     Compression,
+    _check_compression,
+    _compress,
 )
 from opentelemetry.util.re import parse_env_headers
 
@@ -71,6 +74,10 @@ class OTLPLogExporter(LogExporter):
         timeout: Optional[int] = None,
         compression: Optional[Compression] = None,
         session: Optional[requests.Session] = None,
+        spool: Optional[DiskSpool] = None,
+        max_request_size: Optional[int] = None,
+        compression_level: Optional[int] = None,
+        stream_compression: bool = False,
     ):
         self._endpoint = endpoint or environ.get(
             OTEL_EXPORTER_OTLP_LOGS_ENDPOINT,
@@ -93,7 +100,12 @@ class OTLPLogExporter(LogExporter):
                 environ.get(OTEL_EXPORTER_OTLP_TIMEOUT, DEFAULT_TIMEOUT),
             )
         )
-        self._compression = compression or _compression_from_env()
+        self._compression = _check_compression(
+            compression or _compression_from_env()
+        )
+        self._compression_level = compression_level
+        # compresses the requests while they are sent, in chunked requests
+        self._stream_compression = stream_compression
         self._session = session or requests.Session()
         self._session.headers.update(self._headers)
         self._session.headers.update(_OTLP_HTTP_HEADERS)
@@ -102,16 +114,20 @@ class OTLPLogExporter(LogExporter):
                 {"Content-Encoding": self._compression.value}
             )
         self._shutdown = False
+        self._spool = spool
+        if spool is not None:
+            spool.start(self._export_spooled)
+        # requests larger than this are split, it applies to the requests
+        # before they are compressed
+        self._max_request_size = max_request_size
 
-    def _export(self, serialized_data: str):
-        data = serialized_data
-        if self._compression == Compression.Gzip:
-            gzip_data = BytesIO()
-            with gzip.GzipFile(fileobj=gzip_data, mode="w") as gzip_stream:
-                gzip_stream.write(serialized_data)
-            data = gzip_data.getvalue()
-        elif self._compression == Compression.Deflate:
-            data = zlib.compress(bytes(serialized_data))
+    def _export(self, serialized_data: bytes):
+        data = _compress(
+            serialized_data,
+            self._compression,
+            self._compression_level,
+            self._stream_compression,
+        )
 
         return self._session.post(
             url=self._endpoint,
@@ -120,6 +136,11 @@ class OTLPLogExporter(LogExporter):
             timeout=self._timeout,
         )
 
+    def _split(self, serialized_data: bytes) -> List[bytes]:
+        if self._max_request_size is None:
+            return [serialized_data]
+        return _split_request(serialized_data, self._max_request_size)
+
     @staticmethod
     def _retryable(resp: requests.Response) -> bool:
         if resp.status_code == 408:
@@ -135,18 +156,42 @@ class OTLPLogExporter(LogExporter):
             _logger.warning("Exporter already shutdown, ignoring batch")
             return LogExportResult.FAILURE
 
-        serialized_data = encode_logs(batch).SerializeToString()
+        export_result = LogExportResult.SUCCESS
+        for serialized_data in self._split(
+            encode_logs(batch).SerializeToString()
+        ):
+            if (
+                self._export_serialized(serialized_data)
+                is LogExportResult.FAILURE
+            ):
+                export_result = LogExportResult.FAILURE
+        return export_result
 
+    def _export_serialized(self, serialized_data: bytes) -> LogExportResult:
         for delay in _create_exp_backoff_generator(
             max_value=self._MAX_RETRY_TIMEOUT
         ):
 
             if delay == self._MAX_RETRY_TIMEOUT:
+                self._spool_batch(serialized_data)
                 return LogExportResult.FAILURE
 
-            resp = self._export(serialized_data)
+            try:
+                resp = self._export(serialized_data)
+            except requests.exceptions.RequestException as error:
+                # the endpoint is not reachable, like a 5xx response
+                _logger.warning(
+                    "Transient error %s encountered while exporting logs batch, retrying in %ss.",
+                    error,
+                    delay,
+                )
+                sleep(delay)
+                continue
             # pylint: disable=no-else-return
             if resp.status_code in (200, 202):
+                if self._spool is not None:
+                    # the endpoint is reachable, replay what was spooled
+                    self._spool.notify()
                 return LogExportResult.SUCCESS
             elif self._retryable(resp):
                 _logger.warning(
@@ -163,8 +208,33 @@ class OTLPLogExporter(LogExporter):
                     resp.text,
                 )
                 return LogExportResult.FAILURE
+        self._spool_batch(serialized_data)
         return LogExportResult.FAILURE
 
+    def _spool_batch(self, serialized_data: bytes) -> None:
+        if self._spool is not None:
+            self._spool.append(serialized_data)
+
+    def _export_spooled(self, serialized_data: bytes) -> bool:
+        """Sends a spooled batch once, without retrying.
+
+        Returns False if the batch should be replayed again later.
+        """
+        try:
+            resp = self._export(serialized_data)
+        except requests.exceptions.RequestException:
+            return False
+        if resp.status_code in (200, 202):
+            return True
+        if self._retryable(resp):
+            return False
+        _logger.error(
+            "Failed to export spooled batch code: %s, reason: %s",
+            resp.status_code,
+            resp.text,
+        )
+        return True
+
     def force_flush(self, timeout_millis: float = 10_000) -> bool:
         """Nothing is buffered in this exporter, so this method does nothing."""
         return True
@@ -173,6 +243,8 @@ class OTLPLogExporter(LogExporter):
         if self._shutdown:
             _logger.warning("Exporter already shutdown, ignoring call")
             return
+        if self._spool is not None:
+            self._spool.close()
         self._session.close()
         self._shutdown = True
 
@@ -11,14 +11,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import gzip
 import logging
-import zlib
 from os import environ
 from typing import Dict, Optional, Any, Callable, List
 from typing import Sequence, Mapping  # noqa: F401
 
-from io import BytesIO
 from time import sleep
 from deprecated import deprecated
 
@@ -26,13 +23,21 @@ from opentelemetry.exporter.otlp.proto.common._internal import (
     _get_resource_data,
     _create_exp_backoff_generator,
 )
+from opentelemetry.exporter.otlp.proto.common._internal._split import (
+    _split_metrics_request,
+)
+from opentelemetry.exporter.otlp.proto.common.spool import DiskSpool
 from opentelemetry.exporter.otlp.proto.common._internal.metrics_encoder import (
     OTLPMetricExporterMixin,
 )
 from opentelemetry.exporter.otlp.proto.common.metrics_encoder import (
     encode_metrics,
 )
-from opentelemetry.exporter.otlp.proto.http import Compression
+from opentelemetry.exporter.otlp.proto.http import (
+    Compression,
+    _check_compression,
+    _compress,
+)
 from opentelemetry.sdk.metrics._internal.aggregation import Aggregation
 from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import (  # noqa: F401
     ExportMetricsServiceRequest,
@@ -102,6 +107,10 @@ class OTLPMetricExporter(MetricExporter, OTLPMetricExporterMixin):
         session: Optional[requests.Session] = None,
         preferred_temporality: Dict[type, AggregationTemporality] = None,
         preferred_aggregation: Dict[type, Aggregation] = None,
+        spool: Optional[DiskSpool] = None,
+        max_request_size: Optional[int] = None,
+        compression_level: Optional[int] = None,
+        stream_compression: bool = False,
     ):
         self._endpoint = endpoint or environ.get(
             OTEL_EXPORTER_OTLP_METRICS_ENDPOINT,
@@ -124,7 +133,12 @@ class OTLPMetricExporter(MetricExporter, OTLPMetricExporterMixin):
                 environ.get(OTEL_EXPORTER_OTLP_TIMEOUT, DEFAULT_TIMEOUT),
             )
         )
-        self._compression = compression or _compression_from_env()
+        self._compression = _check_compression(
+            compression or _compression_from_env()
+        )
+        self._compression_level = compression_level
+        # compresses the requests while they are sent, in chunked requests
+        self._stream_compression = stream_compression
         self._session = session or requests.Session()
         self._session.headers.update(self._headers)
         self._session.headers.update(
@@ -137,15 +151,20 @@ class OTLPMetricExporter(MetricExporter, OTLPMetricExporterMixin):
 
         self._common_configuration(preferred_temporality)
 
-    def _export(self, serialized_data: str):
-        data = serialized_data
-        if self._compression == Compression.Gzip:
-            gzip_data = BytesIO()
-            with gzip.GzipFile(fileobj=gzip_data, mode="w") as gzip_stream:
-                gzip_stream.write(serialized_data)
-            data = gzip_data.getvalue()
-        elif self._compression == Compression.Deflate:
-            data = zlib.compress(bytes(serialized_data))
+        self._spool = spool
+        if spool is not None:
+            spool.start(self._export_spooled)
+        # requests larger than this are split, it applies to the requests
+        # before they are compressed
+        self._max_request_size = max_request_size
+
+    def _export(self, serialized_data: bytes):
+        data = _compress(
+            serialized_data,
+            self._compression,
+            self._compression_level,
+            self._stream_compression,
+        )
 
         return self._session.post(
             url=self._endpoint,
@@ -154,6 +173,11 @@ class OTLPMetricExporter(MetricExporter, OTLPMetricExporterMixin):
             timeout=self._timeout,
         )
 
+    def _split(self, serialized_data: bytes) -> List[bytes]:
+        if self._max_request_size is None:
+            return [serialized_data]
+        return _split_metrics_request(serialized_data, self._max_request_size)
+
     @staticmethod
     def _retryable(resp: requests.Response) -> bool:
         if resp.status_code == 408:
@@ -168,17 +192,42 @@ class OTLPMetricExporter(MetricExporter, OTLPMetricExporterMixin):
         timeout_millis: float = 10_000,
         **kwargs,
     ) -> MetricExportResult:
-        serialized_data = encode_metrics(metrics_data)
+        export_result = MetricExportResult.SUCCESS
+        for serialized_data in self._split(
+            encode_metrics(metrics_data).SerializeToString()
+        ):
+            if (
+                self._export_serialized(serialized_data)
+                is MetricExportResult.FAILURE
+            ):
+                export_result = MetricExportResult.FAILURE
+        return export_result
+
+    def _export_serialized(self, serialized_data: bytes) -> MetricExportResult:
         for delay in _create_exp_backoff_generator(
             max_value=self._MAX_RETRY_TIMEOUT
         ):
 
             if delay == self._MAX_RETRY_TIMEOUT:
+                self._spool_batch(serialized_data)
                 return MetricExportResult.FAILURE
 
-            resp = self._export(serialized_data.SerializeToString())
+            try:
+                resp = self._export(serialized_data)
+            except requests.exceptions.RequestException as error:
+                # the endpoint is not reachable, like a 5xx response
+                _logger.warning(
+                    "Transient error %s encountered while exporting metric batch, retrying in %ss.",
+                    error,
+                    delay,
+                )
+                sleep(delay)
+                continue
             # pylint: disable=no-else-return
             if resp.status_code in (200, 202):
+                if self._spool is not None:
+                    # the endpoint is reachable, replay what was spooled
+                    self._spool.notify()
                 return MetricExportResult.SUCCESS
             elif self._retryable(resp):
                 _logger.warning(
@@ -195,10 +244,36 @@ class OTLPMetricExporter(MetricExporter, OTLPMetricExporterMixin):
                     resp.text,
                 )
                 return MetricExportResult.FAILURE
+        self._spool_batch(serialized_data)
         return MetricExportResult.FAILURE
 
+    def _spool_batch(self, serialized_data: bytes) -> None:
+        if self._spool is not None:
+            self._spool.append(serialized_data)
+
+    def _export_spooled(self, serialized_data: bytes) -> bool:
+        """Sends a spooled batch once, without retrying.
+
+        Returns False if the batch should be replayed again later.
+        """
+        try:
+            resp = self._export(serialized_data)
+        except requests.exceptions.RequestException:
+            return False
+        if resp.status_code in (200, 202):
+            return True
+        if self._retryable(resp):
+            return False
+        _logger.error(
+            "Failed to export spooled batch code: %s, reason: %s",
+            resp.status_code,
+            resp.text,
+        )
+        return True
+
     def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
-        pass
+        if self._spool is not None:
+            self._spool.close()
 
     @property
     def _exporting(self) -> str:
@@ -12,12 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import gzip
+import asyncio
 import logging
-import zlib
-from io import BytesIO
 from os import environ
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from time import sleep
 
 import requests
@@ -25,8 +23,13 @@ import requests
 from opentelemetry.exporter.otlp.proto.common._internal import (
     _create_exp_backoff_generator,
 )
+from opentelemetry.exporter.otlp.proto.common._internal._split import (
+    _split_request,
+)
+from opentelemetry.exporter.otlp.proto.common.spool import DiskSpool
 from opentelemetry.exporter.otlp.proto.common.trace_encoder import (
     encode_spans,
+    serialize_spans,
 )
 from opentelemetry.sdk.environment_variables import (
     OTEL_EXPORTER_OTLP_TRACES_CERTIFICATE,
@@ -40,10 +43,16 @@ from opentelemetry.sdk.environment_variables import (
     OTEL_EXPORTER_OTLP_HEADERS,
     OTEL_EXPORTER_OTLP_TIMEOUT,
 )
-from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+from opentelemetry.sdk.trace.export import (
+    AsyncSpanExporter,
+    SpanExporter,
+    SpanExportResult,
+)
 from opentelemetry.exporter.otlp.proto.http import (
     _OTLP_HTTP_HEADERS,
     Compression,
+    _check_compression,
+    _compress,
 )
 from opentelemetry.util.re import parse_env_headers
 
@@ -69,6 +78,11 @@ class OTLPSpanExporter(SpanExporter):
         timeout: Optional[int] = None,
         compression: Optional[Compression] = None,
         session: Optional[requests.Session] = None,
+        spool: Optional[DiskSpool] = None,
+        max_request_size: Optional[int] = None,
+        compression_level: Optional[int] = None,
+        stream_compression: bool = False,
+        wire_format_encoding: bool = False,
     ):
         self._endpoint = endpoint or environ.get(
             OTEL_EXPORTER_OTLP_TRACES_ENDPOINT,
@@ -91,7 +105,12 @@ class OTLPSpanExporter(SpanExporter):
                 environ.get(OTEL_EXPORTER_OTLP_TIMEOUT, DEFAULT_TIMEOUT),
             )
         )
-        self._compression = compression or _compression_from_env()
+        self._compression = _check_compression(
+            compression or _compression_from_env()
+        )
+        self._compression_level = compression_level
+        # compresses the requests while they are sent, in chunked requests
+        self._stream_compression = stream_compression
         self._session = session or requests.Session()
         self._session.headers.update(self._headers)
         self._session.headers.update(_OTLP_HTTP_HEADERS)
@@ -100,16 +119,23 @@ class OTLPSpanExporter(SpanExporter):
                 {"Content-Encoding": self._compression.value}
             )
         self._shutdown = False
+        self._spool = spool
+        if spool is not None:
+            spool.start(self._export_spooled)
+        # requests larger than this are split, it applies to the requests
+        # before they are compressed
+        self._max_request_size = max_request_size
+        # writes the requests with serialize_spans instead of serializing
+        # the messages built by encode_spans
+        self._wire_format_encoding = wire_format_encoding
 
-    def _export(self, serialized_data: str):
-        data = serialized_data
-        if self._compression == Compression.Gzip:
-            gzip_data = BytesIO()
-            with gzip.GzipFile(fileobj=gzip_data, mode="w") as gzip_stream:
-                gzip_stream.write(serialized_data)
-            data = gzip_data.getvalue()
-        elif self._compression == Compression.Deflate:
-            data = zlib.compress(bytes(serialized_data))
+    def _export(self, serialized_data: bytes):
+        data = _compress(
+            serialized_data,
+            self._compression,
+            self._compression_level,
+            self._stream_compression,
+        )
 
         return self._session.post(
             url=self._endpoint,
@@ -118,6 +144,17 @@ class OTLPSpanExporter(SpanExporter):
             timeout=self._timeout,
         )
 
+    def _split(self, serialized_data: bytes) -> List[bytes]:
+        if self._max_request_size is None:
+            return [serialized_data]
+        return _split_request(serialized_data, self._max_request_size)
+
+    def _serialize(self, spans) -> List[bytes]:
+        """Returns the serialized requests to export the spans with."""
+        if self._wire_format_encoding:
+            return self._split(serialize_spans(spans))
+        return self._split(encode_spans(spans).SerializeToString())
+
     @staticmethod
     def _retryable(resp: requests.Response) -> bool:
         if resp.status_code == 408:
@@ -133,40 +170,100 @@ class OTLPSpanExporter(SpanExporter):
             _logger.warning("Exporter already shutdown, ignoring batch")
             return SpanExportResult.FAILURE
 
-        serialized_data = encode_spans(spans).SerializeToString()
+        export_result = SpanExportResult.SUCCESS
+        for serialized_data in self._serialize(spans):
+            if (
+                self._export_serialized(serialized_data)
+                is SpanExportResult.FAILURE
+            ):
+                export_result = SpanExportResult.FAILURE
+        return export_result
 
+    def _export_serialized(self, serialized_data: bytes) -> SpanExportResult:
         for delay in _create_exp_backoff_generator(
             max_value=self._MAX_RETRY_TIMEOUT
         ):
-
             if delay == self._MAX_RETRY_TIMEOUT:
-                return SpanExportResult.FAILURE
-
-            resp = self._export(serialized_data)
-            # pylint: disable=no-else-return
-            if resp.status_code in (200, 202):
-                return SpanExportResult.SUCCESS
-            elif self._retryable(resp):
-                _logger.warning(
-                    "Transient error %s encountered while exporting span batch, retrying in %ss.",
-                    resp.reason,
-                    delay,
-                )
+                break
+            try:
+                resp = self._export(serialized_data)
+            except requests.exceptions.RequestException as error:
+                self._log_request_error(error, delay)
                 sleep(delay)
                 continue
-            else:
-                _logger.error(
-                    "Failed to export batch code: %s, reason: %s",
-                    resp.status_code,
-                    resp.text,
-                )
-                return SpanExportResult.FAILURE
+            result = self._handle_response(resp, delay)
+            if result is not None:
+                return result
+            sleep(delay)
+        self._spool_batch(serialized_data)
+        return SpanExportResult.FAILURE
+
+    def _handle_response(
+        self, resp: requests.Response, delay: int
+    ) -> Optional[SpanExportResult]:
+        """Returns the result of an export request, or None if the request
+        should be retried after ``delay`` seconds."""
+        if resp.status_code in (200, 202):
+            if self._spool is not None:
+                # the endpoint is reachable, replay what was spooled
+                self._spool.notify()
+            return SpanExportResult.SUCCESS
+        if self._retryable(resp):
+            _logger.warning(
+                "Transient error %s encountered while exporting span batch, retrying in %ss.",
+                resp.reason,
+                delay,
+            )
+            return None
+        _logger.error(
+            "Failed to export batch code: %s, reason: %s",
+            resp.status_code,
+            resp.text,
+        )
         return SpanExportResult.FAILURE
 
+    @staticmethod
+    def _log_request_error(
+        error: requests.exceptions.RequestException, delay: int
+    ) -> None:
+        # the endpoint is not reachable, the request is retried like the
+        # ones that get a 5xx response
+        _logger.warning(
+            "Transient error %s encountered while exporting span batch, retrying in %ss.",
+            error,
+            delay,
+        )
+
+    def _spool_batch(self, serialized_data: bytes) -> None:
+        if self._spool is not None:
+            self._spool.append(serialized_data)
+
+    def _export_spooled(self, serialized_data: bytes) -> bool:
+        """Sends a spooled batch once, without retrying.
+
+        Returns False if the batch should be replayed again later.
+        """
+        try:
+            resp = self._export(serialized_data)
+        except requests.exceptions.RequestException:
+            return False
+        if resp.status_code in (200, 202):
+            return True
+        if self._retryable(resp):
+            return False
+        _logger.error(
+            "Failed to export spooled batch code: %s, reason: %s",
+            resp.status_code,
+            resp.text,
+        )
+        return True
+
     def shutdown(self):
         if self._shutdown:
             _logger.warning("Exporter already shutdown, ignoring call")
             return
+        if self._spool is not None:
+            self._spool.close()
         self._session.close()
         self._shutdown = True
 
@@ -175,6 +272,96 @@ class OTLPSpanExporter(SpanExporter):
         return True
 
 
+class AsyncOTLPSpanExporter(AsyncSpanExporter):
+    """`AsyncSpanExporter` variant of `OTLPSpanExporter`.
+
+    It is configured like `OTLPSpanExporter` and is meant to be used with an
+    `opentelemetry.sdk.trace.export.AsyncBatchSpanProcessor`. The spans are
+    encoded and the HTTP requests are sent from the event loop's default
+    executor and the exporter waits between retries with `asyncio.sleep`,
+    so none of them blocks the event loop.
+    """
+
+    def __init__(
+        self,
+        endpoint: Optional[str] = None,
+        certificate_file: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None,
+        compression: Optional[Compression] = None,
+        session: Optional[requests.Session] = None,
+        spool: Optional[DiskSpool] = None,
+        max_request_size: Optional[int] = None,
+        compression_level: Optional[int] = None,
+        stream_compression: bool = False,
+        wire_format_encoding: bool = False,
+    ):
+        self._exporter = OTLPSpanExporter(
+            endpoint=endpoint,
+            certificate_file=certificate_file,
+            headers=headers,
+            timeout=timeout,
+            compression=compression,
+            session=session,
+            spool=spool,
+            max_request_size=max_request_size,
+            compression_level=compression_level,
+            stream_compression=stream_compression,
+            wire_format_encoding=wire_format_encoding,
+        )
+
+    async def export(self, spans) -> SpanExportResult:
+        # pylint: disable=protected-access
+        if self._exporter._shutdown:
+            _logger.warning("Exporter already shutdown, ignoring batch")
+            return SpanExportResult.FAILURE
+
+        loop = asyncio.get_running_loop()
+        export_result = SpanExportResult.SUCCESS
+        for serialized_data in await loop.run_in_executor(
+            None, self._exporter._serialize, spans
+        ):
+            if (
+                await self._export_serialized(serialized_data)
+                is SpanExportResult.FAILURE
+            ):
+                export_result = SpanExportResult.FAILURE
+        return export_result
+
+    async def _export_serialized(
+        self, serialized_data: bytes
+    ) -> SpanExportResult:
+        # pylint: disable=protected-access
+        loop = asyncio.get_running_loop()
+
+        for delay in _create_exp_backoff_generator(
+            max_value=OTLPSpanExporter._MAX_RETRY_TIMEOUT
+        ):
+            if delay == OTLPSpanExporter._MAX_RETRY_TIMEOUT:
+                break
+            try:
+                resp = await loop.run_in_executor(
+                    None, self._exporter._export, serialized_data
+                )
+            except requests.exceptions.RequestException as error:
+                self._exporter._log_request_error(error, delay)
+                await asyncio.sleep(delay)
+                continue
+            result = self._exporter._handle_response(resp, delay)
+            if result is not None:
+                return result
+            await asyncio.sleep(delay)
+        self._exporter._spool_batch(serialized_data)
+        return SpanExportResult.FAILURE
+
+    async def shutdown(self):
+        self._exporter.shutdown()
+
+    async def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Nothing is buffered in this exporter, so this method does nothing."""
+        return True
+
+
 def _compression_from_env() -> Compression:
     compression = (
         environ.get(
@@ -12,12 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from dataclasses import replace
 from logging import WARNING
 from os import environ
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from requests import Session
+from requests.exceptions import ConnectionError as RequestsConnectionError
 from requests.models import Response
 from responses import POST, activate, add
 
@@ -33,6 +35,9 @@ from opentelemetry.exporter.otlp.proto.http.metric_exporter import (
     DEFAULT_TIMEOUT,
     OTLPMetricExporter,
 )
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import (
+    ExportMetricsServiceRequest,
+)
 from opentelemetry.sdk.environment_variables import (
     OTEL_EXPORTER_OTLP_CERTIFICATE,
     OTEL_EXPORTER_OTLP_COMPRESSION,
@@ -275,6 +280,29 @@ class TestOTLPMetricExporter(TestCase):
             MetricExportResult.FAILURE,
         )
 
+    @patch(
+        "opentelemetry.exporter.otlp.proto.http.metric_exporter._create_exp_backoff_generator"
+    )
+    @patch("opentelemetry.exporter.otlp.proto.http.metric_exporter.sleep")
+    @patch.object(Session, "post")
+    def test_spools_unreachable_endpoint(
+        self, mock_post, mock_sleep, mock_expo
+    ):
+        mock_expo.configure_mock(
+            **{"return_value": [1, OTLPMetricExporter._MAX_RETRY_TIMEOUT]}
+        )
+        mock_post.side_effect = RequestsConnectionError()
+        spool = Mock()
+        exporter = OTLPMetricExporter(spool=spool)
+
+        with self.assertLogs(level=WARNING):
+            self.assertEqual(
+                exporter.export(self.metrics["sum_int"]),
+                MetricExportResult.FAILURE,
+            )
+        mock_sleep.assert_called_once_with(1)
+        spool.append.assert_called_once()
+
     @patch.object(Session, "post")
     def test_serialization(self, mock_post):
 
@@ -297,6 +325,59 @@ class TestOTLPMetricExporter(TestCase):
             timeout=exporter._timeout,
         )
 
+    @patch.object(Session, "post")
+    def test_splits_large_requests(self, mock_post):
+        resp = Response()
+        resp.status_code = 200
+        mock_post.return_value = resp
+
+        metric = _generate_sum("sum_int", 33)
+        data_point = metric.data.data_points[0]
+        metric = replace(
+            metric,
+            data=replace(
+                metric.data,
+                data_points=[
+                    replace(data_point, value=value) for value in range(20)
+                ],
+            ),
+        )
+        metrics_data = MetricsData(
+            resource_metrics=[
+                ResourceMetrics(
+                    resource=Resource({"a": 1}),
+                    scope_metrics=[
+                        ScopeMetrics(
+                            scope=SDKInstrumentationScope(name="name"),
+                            metrics=[metric],
+                            schema_url="",
+                        )
+                    ],
+                    schema_url="",
+                )
+            ]
+        )
+        exporter = OTLPMetricExporter(max_request_size=300)
+
+        self.assertEqual(
+            exporter.export(metrics_data), MetricExportResult.SUCCESS
+        )
+        self.assertGreater(mock_post.call_count, 1)
+        values = []
+        for call in mock_post.call_args_list:
+            data = call.kwargs["data"]
+            self.assertLessEqual(len(data), 300)
+            request = ExportMetricsServiceRequest.FromString(data)
+            (resource_metrics,) = request.resource_metrics
+            (scope_metrics,) = resource_metrics.scope_metrics
+            (split_metric,) = scope_metrics.metrics
+            self.assertEqual(split_metric.name, "sum_int")
+            values.extend(
+                data_point.as_int
+                for data_point in split_metric.sum.data_points
+            )
+        self.assertEqual(values, list(range(20)))
+
     @activate
     @patch("opentelemetry.exporter.otlp.proto.common._internal.backoff")
     @patch("opentelemetry.exporter.otlp.proto.http.metric_exporter.sleep")
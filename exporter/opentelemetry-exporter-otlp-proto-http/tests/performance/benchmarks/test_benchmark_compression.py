@@ -0,0 +1,85 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from time import process_time
+
+import pytest
+
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import (
+    serialize_spans,
+)
+from opentelemetry.exporter.otlp.proto.http import (
+    Compression,
+    _compress,
+    zstandard,
+)
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider, sampling
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+COMPRESSIONS = [
+    (Compression.NoCompression, None),
+    (Compression.Deflate, 1),
+    (Compression.Deflate, None),
+    (Compression.Gzip, 1),
+    (Compression.Gzip, 6),
+    (Compression.Gzip, None),
+]
+if zstandard is not None:
+    COMPRESSIONS += [(Compression.Zstd, 1), (Compression.Zstd, None)]
+
+
+def get_serialized_spans(number_of_spans=512):
+    span_exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider(
+        sampler=sampling.DEFAULT_ON,
+        resource=Resource({"service.name": "benchmarked-service"}),
+    )
+    tracer_provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    tracer = tracer_provider.get_tracer("compression_benchmark_tracer")
+
+    for index in range(number_of_spans):
+        with tracer.start_as_current_span(
+            "benchmarkedSpan",
+            attributes={
+                "http.method": "GET",
+                "http.status_code": 200,
+                "http.url": f"https://example.com/{index}",
+                "latency": 0.123,
+            },
+        ) as span:
+            span.add_event("benchmarkEvent", {"index": index})
+
+    return serialize_spans(span_exporter.get_finished_spans())
+
+
+# The time measured is the CPU time of the compression, the size of the
+# request body is reported in the extra info of every benchmark.
+@pytest.mark.benchmark(timer=process_time)
+@pytest.mark.parametrize("stream", [False, True])
+@pytest.mark.parametrize("compression,level", COMPRESSIONS)
+def test_compress_spans(benchmark, compression, level, stream):
+    serialized_data = get_serialized_spans()
+
+    def compress():
+        body = _compress(serialized_data, compression, level, stream)
+        if isinstance(body, bytes):
+            return len(body)
+        return sum(len(chunk) for chunk in body)
+
+    benchmark.extra_info["uncompressed_bytes"] = len(serialized_data)
+    benchmark.extra_info["bytes_on_wire"] = benchmark(compress)
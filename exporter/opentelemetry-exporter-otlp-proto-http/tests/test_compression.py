@@ -0,0 +1,112 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import zlib
+from os import urandom
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+from opentelemetry.exporter.otlp.proto.http import (
+    _STREAM_CHUNK_SIZE,
+    Compression,
+    _check_compression,
+    _compress,
+    zstandard,
+)
+from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+    OTLPSpanExporter,
+)
+
+# compressible data that spans several chunks
+DATA = (urandom(1024) * 200)[: _STREAM_CHUNK_SIZE * 3 + 10]
+
+
+class TestCompression(TestCase):
+    def test_no_compression(self):
+        self.assertIs(
+            _compress(DATA, Compression.NoCompression, stream=True), DATA
+        )
+
+    def test_gzip(self):
+        self.assertEqual(
+            gzip.decompress(_compress(DATA, Compression.Gzip)), DATA
+        )
+
+    def test_deflate(self):
+        self.assertEqual(
+            zlib.decompress(_compress(DATA, Compression.Deflate)), DATA
+        )
+
+    def test_level(self):
+        fast = _compress(DATA, Compression.Gzip, level=1)
+        best = _compress(DATA, Compression.Gzip, level=9)
+
+        self.assertEqual(gzip.decompress(fast), DATA)
+        self.assertEqual(gzip.decompress(best), DATA)
+        self.assertLessEqual(len(best), len(fast))
+
+    def test_stream(self):
+        for compression, decompress in (
+            (Compression.Gzip, gzip.decompress),
+            (Compression.Deflate, zlib.decompress),
+        ):
+            with self.subTest(compression=compression):
+                chunks = list(_compress(DATA, compression, stream=True))
+
+                self.assertGreater(len(chunks), 1)
+                self.assertEqual(decompress(b"".join(chunks)), DATA)
+
+    @skipIf(zstandard is None, "zstandard is not installed")
+    def test_zstd(self):
+        decompressor = zstandard.ZstdDecompressor()
+
+        self.assertEqual(
+            decompressor.decompressobj().decompress(
+                _compress(DATA, Compression.Zstd)
+            ),
+            DATA,
+        )
+        self.assertEqual(
+            decompressor.decompressobj().decompress(
+                b"".join(_compress(DATA, Compression.Zstd, stream=True))
+            ),
+            DATA,
+        )
+
+    @patch("opentelemetry.exporter.otlp.proto.http.zstandard", None)
+    def test_zstd_not_installed(self):
+        with self.assertLogs(level="WARNING"):
+            self.assertIs(
+                _check_compression(Compression.Zstd), Compression.Gzip
+            )
+        self.assertIs(_check_compression(Compression.Gzip), Compression.Gzip)
+
+    @patch("requests.Session.post")
+    def test_exporter_streams_compressed_body(self, mock_post):
+        mock_post.return_value.status_code = 200
+        exporter = OTLPSpanExporter(
+            compression=Compression.Deflate,
+            compression_level=1,
+            stream_compression=True,
+        )
+
+        exporter._export(DATA)  # pylint: disable=protected-access
+
+        self.assertEqual(
+            exporter._session.headers["Content-Encoding"], "deflate"
+        )
+        body = mock_post.call_args.kwargs["data"]
+        self.assertNotIsInstance(body, bytes)
+        self.assertEqual(zlib.decompress(b"".join(body)), DATA)
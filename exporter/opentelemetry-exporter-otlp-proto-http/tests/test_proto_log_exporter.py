@@ -32,8 +32,12 @@ from opentelemetry.exporter.otlp.proto.http._log_exporter import (
     OTLPLogExporter,
 )
 from opentelemetry.exporter.otlp.proto.http.version import __version__
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import (
+    ExportLogsServiceRequest,
+)
 from opentelemetry.sdk._logs import LogData
 from opentelemetry.sdk._logs import LogRecord as SDKLogRecord
+from opentelemetry.sdk._logs.export import LogExportResult
 from opentelemetry.sdk.environment_variables import (
     OTEL_EXPORTER_OTLP_CERTIFICATE,
     OTEL_EXPORTER_OTLP_COMPRESSION,
@@ -193,6 +197,59 @@ class TestOTLPHTTPLogExporter(unittest.TestCase):
         exporter.export(logs)
         mock_sleep.assert_called_once_with(1)
 
+    @patch(
+        "opentelemetry.exporter.otlp.proto.http._log_exporter._create_exp_backoff_generator"
+    )
+    @patch("opentelemetry.exporter.otlp.proto.http._log_exporter.sleep")
+    def test_spools_unreachable_endpoint(self, mock_sleep, mock_expo):
+        mock_expo.configure_mock(
+            **{"return_value": [1, OTLPLogExporter._MAX_RETRY_TIMEOUT]}
+        )
+        session = MagicMock()
+        session.post.side_effect = requests.exceptions.ConnectionError()
+        spool = MagicMock()
+        exporter = OTLPLogExporter(session=session, spool=spool)
+
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(
+                exporter.export(self._get_sdk_log_data()),
+                LogExportResult.FAILURE,
+            )
+        mock_sleep.assert_called_once_with(1)
+        spool.append.assert_called_once()
+
+    @responses.activate
+    def test_splits_large_requests(self):
+        responses.add(
+            responses.POST, "http://logs.example.com/export", status=200
+        )
+        exporter = OTLPLogExporter(
+            endpoint="http://logs.example.com/export", max_request_size=300
+        )
+
+        self.assertEqual(
+            exporter.export(self._get_sdk_log_data()),
+            LogExportResult.SUCCESS,
+        )
+        self.assertGreater(len(responses.calls), 1)
+        bodies = []
+        for call in responses.calls:
+            self.assertLessEqual(len(call.request.body), 300)
+            request = ExportLogsServiceRequest.FromString(call.request.body)
+            for resource_logs in request.resource_logs:
+                for scope_logs in resource_logs.scope_logs:
+                    bodies.extend(
+                        log_record.body.string_value
+                        for log_record in scope_logs.log_records
+                    )
+        self.assertCountEqual(
+            bodies,
+            [
+                log_data.log_record.body
+                for log_data in self._get_sdk_log_data()
+            ],
+        )
+
     @staticmethod
     def _get_sdk_log_data() -> List[LogData]:
         log1 = LogData(
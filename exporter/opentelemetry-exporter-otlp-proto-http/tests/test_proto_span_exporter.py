@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import threading
 import unittest
 from collections import OrderedDict
 from unittest.mock import Mock, patch
@@ -26,9 +28,13 @@ from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
     DEFAULT_ENDPOINT,
     DEFAULT_TIMEOUT,
     DEFAULT_TRACES_EXPORT_PATH,
+    AsyncOTLPSpanExporter,
     OTLPSpanExporter,
 )
 from opentelemetry.exporter.otlp.proto.http.version import __version__
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
+    ExportTraceServiceRequest,
+)
 from opentelemetry.sdk.environment_variables import (
     OTEL_EXPORTER_OTLP_CERTIFICATE,
     OTEL_EXPORTER_OTLP_COMPRESSION,
@@ -42,6 +48,7 @@ from opentelemetry.sdk.environment_variables import (
     OTEL_EXPORTER_OTLP_TRACES_TIMEOUT,
 )
 from opentelemetry.sdk.trace import _Span
+from opentelemetry.sdk.trace.export import SpanExportResult
 
 OS_ENV_ENDPOINT = "os.env.base"
 OS_ENV_CERTIFICATE = "os/env/base.crt"
@@ -239,3 +246,280 @@ class TestOTLPSpanExporter(unittest.TestCase):
 
         exporter.export([span])
         mock_sleep.assert_called_once_with(1)
+
+    @responses.activate
+    @patch(
+        "opentelemetry.exporter.otlp.proto.http.trace_exporter._create_exp_backoff_generator"
+    )
+    @patch("opentelemetry.exporter.otlp.proto.http.trace_exporter.sleep")
+    def test_spools_failed_batches(self, mock_sleep, mock_expo):
+        mock_expo.configure_mock(
+            **{"return_value": [1, OTLPSpanExporter._MAX_RETRY_TIMEOUT]}
+        )
+        responses.add(
+            responses.POST,
+            "http://traces.example.com/export",
+            json={"error": "something exploded"},
+            status=503,
+        )
+        spool = Mock()
+        exporter = OTLPSpanExporter(
+            endpoint="http://traces.example.com/export", spool=spool
+        )
+        # pylint: disable=protected-access
+        spool.start.assert_called_once_with(exporter._export_spooled)
+
+        self.assertEqual(
+            exporter.export([_create_span()]), SpanExportResult.FAILURE
+        )
+        spool.append.assert_called_once()
+        serialized_data = spool.append.call_args.args[0]
+
+        # the spooled batch is sent again once the endpoint recovers
+        self.assertFalse(exporter._export_spooled(serialized_data))
+        responses.replace(
+            responses.POST, "http://traces.example.com/export", status=200
+        )
+        self.assertTrue(exporter._export_spooled(serialized_data))
+        self.assertEqual(responses.calls[-1].request.body, serialized_data)
+
+        self.assertEqual(
+            exporter.export([_create_span()]), SpanExportResult.SUCCESS
+        )
+        spool.notify.assert_called_once_with()
+
+        exporter.shutdown()
+        spool.close.assert_called_once_with()
+
+    @patch(
+        "opentelemetry.exporter.otlp.proto.http.trace_exporter._create_exp_backoff_generator"
+    )
+    @patch("opentelemetry.exporter.otlp.proto.http.trace_exporter.sleep")
+    def test_spools_unreachable_endpoint(self, mock_sleep, mock_expo):
+        mock_expo.configure_mock(
+            **{"return_value": [1, OTLPSpanExporter._MAX_RETRY_TIMEOUT]}
+        )
+        session = Mock()
+        session.post.side_effect = requests.exceptions.ConnectionError()
+        spool = Mock()
+        exporter = OTLPSpanExporter(session=session, spool=spool)
+
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(
+                exporter.export([_create_span()]), SpanExportResult.FAILURE
+            )
+        self.assertEqual(session.post.call_count, 1)
+        mock_sleep.assert_called_once_with(1)
+        spool.append.assert_called_once()
+
+    @responses.activate
+    def test_splits_large_requests(self):
+        responses.add(
+            responses.POST, "http://traces.example.com/export", status=200
+        )
+        exporter = OTLPSpanExporter(
+            endpoint="http://traces.example.com/export",
+            max_request_size=300,
+        )
+
+        self.assertEqual(
+            exporter.export([_create_span() for _ in range(5)]),
+            SpanExportResult.SUCCESS,
+        )
+        self.assertGreater(len(responses.calls), 1)
+        spans = []
+        for call in responses.calls:
+            self.assertLessEqual(len(call.request.body), 300)
+            request = ExportTraceServiceRequest.FromString(call.request.body)
+            for resource_spans in request.resource_spans:
+                for scope_spans in resource_spans.scope_spans:
+                    spans.extend(scope_spans.spans)
+        self.assertEqual(len(spans), 5)
+
+    @patch(
+        "opentelemetry.exporter.otlp.proto.http.trace_exporter.serialize_spans"
+    )
+    @patch(
+        "opentelemetry.exporter.otlp.proto.http.trace_exporter.encode_spans"
+    )
+    def test_wire_format_encoding(self, mock_encode, mock_serialize):
+        spans = [_create_span()]
+        mock_encode.return_value.SerializeToString.return_value = b"encoded"
+        mock_serialize.return_value = b"serialized"
+
+        self.assertEqual(OTLPSpanExporter()._serialize(spans), [b"encoded"])
+        mock_encode.assert_called_once_with(spans)
+        mock_serialize.assert_not_called()
+
+        mock_encode.reset_mock()
+        self.assertEqual(
+            OTLPSpanExporter(wire_format_encoding=True)._serialize(spans),
+            [b"serialized"],
+        )
+        mock_serialize.assert_called_once_with(spans)
+        mock_encode.assert_not_called()
+
+    @responses.activate
+    def test_wire_format_encoding_same_requests(self):
+        responses.add(
+            responses.POST, "http://traces.example.com/export", status=200
+        )
+        spans = [_create_span() for _ in range(3)]
+
+        for wire_format_encoding in (False, True):
+            OTLPSpanExporter(
+                endpoint="http://traces.example.com/export",
+                wire_format_encoding=wire_format_encoding,
+            ).export(spans)
+
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual(
+            responses.calls[0].request.body, responses.calls[1].request.body
+        )
+
+
+def _create_span():
+    return _Span(
+        "abc",
+        context=Mock(
+            **{
+                "trace_state": OrderedDict([("a", "b"), ("c", "d")]),
+                "span_id": 10217189687419569865,
+                "trace_id": 67545097771067222548457157018666467027,
+            }
+        ),
+    )
+
+
+# pylint: disable=protected-access
+class TestAsyncOTLPSpanExporter(unittest.TestCase):
+    @responses.activate
+    def test_export(self):
+        responses.add(
+            responses.POST, "http://traces.example.com/export", status=200
+        )
+
+        exporter = AsyncOTLPSpanExporter(
+            endpoint="http://traces.example.com/export"
+        )
+        self.assertEqual(
+            asyncio.run(exporter.export([_create_span()])),
+            SpanExportResult.SUCCESS,
+        )
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_encodes_outside_of_event_loop(self):
+        responses.add(
+            responses.POST, "http://traces.example.com/export", status=200
+        )
+        exporter = AsyncOTLPSpanExporter(
+            endpoint="http://traces.example.com/export"
+        )
+        serialize = exporter._exporter._serialize
+        threads = []
+
+        def record_thread(spans):
+            threads.append(threading.current_thread())
+            return serialize(spans)
+
+        exporter._exporter._serialize = record_thread
+
+        self.assertEqual(
+            asyncio.run(exporter.export([_create_span()])),
+            SpanExportResult.SUCCESS,
+        )
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    @responses.activate
+    def test_splits_large_requests(self):
+        responses.add(
+            responses.POST, "http://traces.example.com/export", status=200
+        )
+
+        exporter = AsyncOTLPSpanExporter(
+            endpoint="http://traces.example.com/export",
+            max_request_size=300,
+        )
+        self.assertEqual(
+            asyncio.run(exporter.export([_create_span() for _ in range(5)])),
+            SpanExportResult.SUCCESS,
+        )
+        self.assertGreater(len(responses.calls), 1)
+        for call in responses.calls:
+            self.assertLessEqual(len(call.request.body), 300)
+
+    @responses.activate
+    @patch("opentelemetry.exporter.otlp.proto.common._internal.backoff")
+    @patch(
+        "opentelemetry.exporter.otlp.proto.http.trace_exporter.asyncio.sleep"
+    )
+    def test_retry_sleeps_asynchronously(self, mock_sleep, mock_backoff):
+        def generate_delays(*args, **kwargs):
+            if _is_backoff_v2:
+                yield None
+            yield 1
+            yield OTLPSpanExporter._MAX_RETRY_TIMEOUT
+
+        mock_backoff.expo.configure_mock(**{"side_effect": generate_delays})
+
+        async def sleep(delay):
+            pass
+
+        mock_sleep.side_effect = sleep
+
+        # return a retryable error
+        responses.add(
+            responses.POST,
+            "http://traces.example.com/export",
+            json={"error": "something exploded"},
+            status=500,
+        )
+
+        exporter = AsyncOTLPSpanExporter(
+            endpoint="http://traces.example.com/export"
+        )
+        self.assertEqual(
+            asyncio.run(exporter.export([_create_span()])),
+            SpanExportResult.FAILURE,
+        )
+        mock_sleep.assert_called_once_with(1)
+
+    @patch(
+        "opentelemetry.exporter.otlp.proto.http.trace_exporter._create_exp_backoff_generator"
+    )
+    @patch(
+        "opentelemetry.exporter.otlp.proto.http.trace_exporter.asyncio.sleep"
+    )
+    def test_spools_unreachable_endpoint(self, mock_sleep, mock_expo):
+        mock_expo.configure_mock(
+            **{"return_value": [1, OTLPSpanExporter._MAX_RETRY_TIMEOUT]}
+        )
+
+        async def sleep(delay):
+            pass
+
+        mock_sleep.side_effect = sleep
+        session = Mock()
+        session.post.side_effect = requests.exceptions.Timeout()
+        spool = Mock()
+        exporter = AsyncOTLPSpanExporter(session=session, spool=spool)
+
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(
+                asyncio.run(exporter.export([_create_span()])),
+                SpanExportResult.FAILURE,
+            )
+        mock_sleep.assert_called_once_with(1)
+        spool.append.assert_called_once()
+
+    def test_shutdown(self):
+        exporter = AsyncOTLPSpanExporter()
+        asyncio.run(exporter.shutdown())
+
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(
+                asyncio.run(exporter.export([_create_span()])),
+                SpanExportResult.FAILURE,
+            )
@@ -58,17 +58,35 @@ metrics to `Prometheus`_.
     counter.add(25, labels)
     input("Press any key to exit...")
 
+Instead of ``prometheus_client.start_http_server``, the metrics of a reader
+can be served with `start_exposition_server`, that writes the responses
+directly from the collected data points and supports the OpenMetrics format
+and gzip encoding:
+
+.. code:: python
+
+    from opentelemetry.exporter.prometheus import (
+        PrometheusMetricReader,
+        start_exposition_server,
+    )
+
+    reader = PrometheusMetricReader()
+    start_exposition_server(reader, port=8000, addr="localhost")
+
 API
 ---
 """
 
 from collections import deque
+from functools import lru_cache
+from http.server import ThreadingHTTPServer
 from itertools import chain
 from json import dumps
 from logging import getLogger
 from os import environ
 from re import IGNORECASE, UNICODE, compile
-from typing import Dict, Sequence, Tuple, Union
+from threading import Lock
+from typing import Dict, Iterator, Sequence, Tuple, Union
 
 from prometheus_client import start_http_server
 from prometheus_client.core import (
@@ -80,6 +98,14 @@ from prometheus_client.core import (
 )
 from prometheus_client.core import Metric as PrometheusMetric
 
+from opentelemetry.exporter.prometheus._exposition import (
+    _COUNTER,
+    _GAUGE,
+    _INFO,
+    _ExpositionWriter,
+    _render_labels,
+    _start_exposition_server,
+)
 from opentelemetry.sdk.environment_variables import (
     OTEL_EXPORTER_PROMETHEUS_HOST,
     OTEL_EXPORTER_PROMETHEUS_PORT,
@@ -96,7 +122,6 @@ from opentelemetry.sdk.metrics.export import (
     AggregationTemporality,
     Gauge,
     Histogram,
-    HistogramDataPoint,
     MetricReader,
     MetricsData,
     Sum,
@@ -107,6 +132,20 @@ _logger = getLogger(__name__)
 _TARGET_INFO_NAME = "target"
 _TARGET_INFO_DESCRIPTION = "Target metadata"
 
+# the exposition types of the metric families that are not histograms
+_FAMILY_TYPES = {CounterMetricFamily: _COUNTER, GaugeMetricFamily: _GAUGE}
+
+_NON_LETTERS_DIGITS_UNDERSCORE_RE = compile(r"[^\w]", UNICODE | IGNORECASE)
+
+# Metric names and attribute keys are few compared to the number of series,
+# this is enough to sanitize every one of them once.
+_SANITIZE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_SANITIZE_CACHE_SIZE)
+def _sanitize(key: str) -> str:
+    return _NON_LETTERS_DIGITS_UNDERSCORE_RE.sub("_", key)
+
 
 def _convert_buckets(
     bucket_counts: Sequence[int], explicit_bounds: Sequence[float]
@@ -151,10 +190,32 @@ class PrometheusMetricReader(MetricReader):
             return
         self._collector.add_metrics_data(metrics_data)
 
+    def generate_latest(self, openmetrics: bool = False) -> bytes:
+        """Collects the metrics and returns them in the Prometheus text
+        format, or in the OpenMetrics text format if ``openmetrics`` is
+        true, without going through the ``prometheus_client`` registry."""
+        return self._collector.generate_latest(openmetrics)
+
     def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
         REGISTRY.unregister(self._collector)
 
 
+def start_exposition_server(
+    metric_reader: PrometheusMetricReader,
+    port: int = 9464,
+    addr: str = "localhost",
+) -> ThreadingHTTPServer:
+    """Starts an HTTP server in a daemon thread that serves the metrics of
+    ``metric_reader``.
+
+    The response is written directly from the collected data points with
+    `PrometheusMetricReader.generate_latest`, in the OpenMetrics text format
+    if the scraper accepts it and gzip encoded if the scraper accepts gzip.
+    The returned server can be stopped with its ``shutdown`` method.
+    """
+    return _start_exposition_server(metric_reader.generate_latest, port, addr)
+
+
 class _CustomCollector:
     """_CustomCollector represents the Prometheus Collector object
 
@@ -165,11 +226,15 @@ class _CustomCollector:
     def __init__(self, disable_target_info: bool = False):
         self._callback = None
         self._metrics_datas = deque()
-        self._non_letters_digits_underscore_re = compile(
-            r"[^\w]", UNICODE | IGNORECASE
-        )
+        # the labels of the exported series, keyed by the id of their
+        # attributes
+        self._series_labels: Dict[int, tuple] = {}
+        # the metric family ids of the exported metric families
+        self._metric_family_ids: Dict[tuple, str] = {}
         self._disable_target_info = disable_target_info
         self._target_info = None
+        self._target_info_labels = None
+        self._lock = Lock()
 
     def add_metrics_data(self, metrics_data: MetricsData) -> None:
         """Add metrics to Prometheus data"""
@@ -181,40 +246,126 @@ class _CustomCollector:
         Collect is invoked every time a ``prometheus.Gatherer`` is run
         for example when the HTTP endpoint is invoked by Prometheus.
         """
-        if self._callback is not None:
-            self._callback()
+        # The metric families are created under the lock that
+        # generate_latest takes too, both consume the same metrics data and
+        # caches. They are yielded once it is released.
+        metric_families = []
+        with self._lock:
+            if self._callback is not None:
+                self._callback()
+
+            metric_family_id_metric_family = {}
+
+            if len(self._metrics_datas):
+                if not self._disable_target_info:
+                    if self._target_info is None:
+                        attributes = {}
+                        for res in self._metrics_datas[0].resource_metrics:
+                            attributes = {
+                                **attributes,
+                                **res.resource.attributes,
+                            }
+
+                        self._target_info = self._create_info_metric(
+                            _TARGET_INFO_NAME,
+                            _TARGET_INFO_DESCRIPTION,
+                            attributes,
+                        )
+                    metric_family_id_metric_family[
+                        _TARGET_INFO_NAME
+                    ] = self._target_info
 
-        metric_family_id_metric_family = {}
+            while self._metrics_datas:
+                self._translate_to_prometheus(
+                    self._metrics_datas.popleft(),
+                    metric_family_id_metric_family,
+                )
+
+                if metric_family_id_metric_family:
+                    metric_families.extend(
+                        metric_family_id_metric_family.values()
+                    )
 
-        if len(self._metrics_datas):
-            if not self._disable_target_info:
-                if self._target_info is None:
-                    attributes = {}
-                    for res in self._metrics_datas[0].resource_metrics:
-                        attributes = {**attributes, **res.resource.attributes}
+        yield from metric_families
 
-                    self._target_info = self._create_info_metric(
-                        _TARGET_INFO_NAME, _TARGET_INFO_DESCRIPTION, attributes
+    def generate_latest(self, openmetrics: bool = False) -> bytes:
+        """Writes the metrics in the Prometheus text format, or in the
+        OpenMetrics text format, directly from the collected data points.
+
+        The output is the same that ``prometheus_client.generate_latest``
+        returns for the metric families of `collect`, without creating them.
+        """
+        with self._lock:
+            if self._callback is not None:
+                self._callback()
+
+            writer = _ExpositionWriter(openmetrics)
+
+            if len(self._metrics_datas):
+                if not self._disable_target_info:
+                    if self._target_info_labels is None:
+                        attributes = {}
+                        for res in self._metrics_datas[0].resource_metrics:
+                            attributes = {
+                                **attributes,
+                                **res.resource.attributes,
+                            }
+                        self._target_info_labels = _render_labels(
+                            [self._sanitize(key) for key in attributes],
+                            [str(value) for value in attributes.values()],
+                        )
+                    writer.add_value(
+                        _TARGET_INFO_NAME,
+                        _TARGET_INFO_NAME,
+                        _INFO,
+                        _TARGET_INFO_DESCRIPTION,
+                        "",
+                        self._target_info_labels,
+                        1,
                     )
-                metric_family_id_metric_family[
-                    _TARGET_INFO_NAME
-                ] = self._target_info
 
-        while self._metrics_datas:
-            self._translate_to_prometheus(
-                self._metrics_datas.popleft(), metric_family_id_metric_family
-            )
+            while self._metrics_datas:
+                for (
+                    metric,
+                    metric_name,
+                    metric_description,
+                    metric_family_class,
+                    metric_family_id,
+                    labels,
+                    data_point,
+                ) in self._iter_series(self._metrics_datas.popleft()):
+                    if labels[4] is None:
+                        labels[4] = _render_labels(labels[2], labels[3])
+                    if metric_family_class is HistogramMetricFamily:
+                        writer.add_histogram(
+                            metric_family_id,
+                            metric_name,
+                            metric_description,
+                            metric.unit,
+                            labels[4],
+                            _convert_buckets(
+                                data_point.bucket_counts,
+                                data_point.explicit_bounds,
+                            ),
+                            data_point.sum,
+                        )
+                    else:
+                        writer.add_value(
+                            metric_family_id,
+                            metric_name,
+                            _FAMILY_TYPES[metric_family_class],
+                            metric_description,
+                            metric.unit,
+                            labels[4],
+                            data_point.value,
+                        )
 
-            if metric_family_id_metric_family:
-                for metric_family in metric_family_id_metric_family.values():
-                    yield metric_family
+            return writer.write().encode("utf-8")
 
-    # pylint: disable=too-many-locals,too-many-branches
-    def _translate_to_prometheus(
-        self,
-        metrics_data: MetricsData,
-        metric_family_id_metric_family: Dict[str, PrometheusMetric],
-    ):
+    # pylint: disable=too-many-locals
+    def _iter_series(self, metrics_data: MetricsData) -> Iterator[tuple]:
+        """Yields the metric, its sanitized name, description, family class
+        and family id, the labels and the data point of every series."""
         metrics = []
 
         for resource_metrics in metrics_data.resource_metrics:
@@ -222,150 +373,148 @@ class _CustomCollector:
                 for metric in scope_metrics.metrics:
                     metrics.append(metric)
 
-        for metric in metrics:
-            label_valuess = []
-            values = []
-
-            pre_metric_family_ids = []
-
-            metric_name = ""
-            metric_name += self._sanitize(metric.name)
+        # The series and families of the previous translation are kept until
+        # this one ends, only the ones that are still exported are cached
+        # afterwards.
+        previous_series_labels = self._series_labels
+        series_labels = {}
+        previous_metric_family_ids = self._metric_family_ids
+        metric_family_ids = {}
 
+        for metric in metrics:
+            metric_name = self._sanitize(metric.name)
             metric_description = metric.description or ""
 
-            for number_data_point in metric.data.data_points:
-                label_keys = []
-                label_values = []
+            if isinstance(metric.data, Sum):
+                # The prometheus compatibility spec for sums says: If the
+                # aggregation temporality is cumulative and the sum is
+                # non-monotonic, it MUST be converted to a Prometheus Gauge.
+                if (
+                    metric.data.is_monotonic is False
+                    and metric.data.aggregation_temporality
+                    == AggregationTemporality.CUMULATIVE
+                ):
+                    metric_family_class = GaugeMetricFamily
+                else:
+                    metric_family_class = CounterMetricFamily
+            elif isinstance(metric.data, Gauge):
+                metric_family_class = GaugeMetricFamily
+            elif isinstance(metric.data, Histogram):
+                metric_family_class = HistogramMetricFamily
+            else:
+                metric_family_class = None
 
-                for key, value in number_data_point.attributes.items():
-                    label_keys.append(self._sanitize(key))
-                    label_values.append(self._check_value(value))
+            for number_data_point in metric.data.data_points:
+                if metric_family_class is None:
+                    _logger.warning(
+                        "Unsupported metric data. %s", type(metric.data)
+                    )
+                    continue
 
-                pre_metric_family_ids.append(
-                    "|".join(
+                attributes = number_data_point.attributes
+                labels = previous_series_labels.get(id(attributes))
+                # the cached labels are used only if the attributes were
+                # not modified since they were translated, the last item
+                # holds the labels rendered by generate_latest
+                if (
+                    labels is None
+                    or labels[0] is not attributes
+                    or labels[1] != attributes
+                ):
+                    labels = [
+                        attributes,
+                        dict(attributes),
+                        tuple(self._sanitize(key) for key in attributes),
+                        [
+                            self._check_value(value)
+                            for value in attributes.values()
+                        ],
+                        None,
+                    ]
+                series_labels[id(attributes)] = labels
+
+                metric_family_key = (
+                    metric_name,
+                    metric_description,
+                    labels[2],
+                    metric.unit,
+                    metric_family_class,
+                )
+                metric_family_id = previous_metric_family_ids.get(
+                    metric_family_key
+                )
+                if metric_family_id is None:
+                    metric_family_id = "|".join(
                         [
                             metric_name,
                             metric_description,
-                            "%".join(label_keys),
+                            "%".join(labels[2]),
                             metric.unit,
+                            metric_family_class.__name__,
                         ]
                     )
+                metric_family_ids[metric_family_key] = metric_family_id
+
+                yield (
+                    metric,
+                    metric_name,
+                    metric_description,
+                    metric_family_class,
+                    metric_family_id,
+                    labels,
+                    number_data_point,
                 )
 
-                label_valuess.append(label_values)
-                if isinstance(number_data_point, HistogramDataPoint):
-                    values.append(
-                        {
-                            "bucket_counts": number_data_point.bucket_counts,
-                            "explicit_bounds": (
-                                number_data_point.explicit_bounds
-                            ),
-                            "sum": number_data_point.sum,
-                        }
-                    )
-                else:
-                    values.append(number_data_point.value)
-
-            for pre_metric_family_id, label_values, value in zip(
-                pre_metric_family_ids, label_valuess, values
-            ):
-                is_non_monotonic_sum = (
-                    isinstance(metric.data, Sum)
-                    and metric.data.is_monotonic is False
+        self._series_labels = series_labels
+        self._metric_family_ids = metric_family_ids
+
+    def _translate_to_prometheus(
+        self,
+        metrics_data: MetricsData,
+        metric_family_id_metric_family: Dict[str, PrometheusMetric],
+    ):
+        for (
+            metric,
+            metric_name,
+            metric_description,
+            metric_family_class,
+            metric_family_id,
+            labels,
+            number_data_point,
+        ) in self._iter_series(metrics_data):
+            metric_family = metric_family_id_metric_family.get(
+                metric_family_id
+            )
+            if metric_family is None:
+                metric_family = metric_family_class(
+                    name=metric_name,
+                    documentation=metric_description,
+                    labels=labels[2],
+                    unit=metric.unit,
                 )
-                is_cumulative = (
-                    isinstance(metric.data, Sum)
-                    and metric.data.aggregation_temporality
-                    == AggregationTemporality.CUMULATIVE
+                metric_family_id_metric_family[
+                    metric_family_id
+                ] = metric_family
+
+            if metric_family_class is HistogramMetricFamily:
+                metric_family.add_metric(
+                    labels=labels[3],
+                    buckets=_convert_buckets(
+                        number_data_point.bucket_counts,
+                        number_data_point.explicit_bounds,
+                    ),
+                    sum_value=number_data_point.sum,
                 )
-
-                # The prometheus compatibility spec for sums says: If the aggregation temporality is cumulative and the sum is non-monotonic, it MUST be converted to a Prometheus Gauge.
-                should_convert_sum_to_gauge = (
-                    is_non_monotonic_sum and is_cumulative
+            else:
+                metric_family.add_metric(
+                    labels=labels[3], value=number_data_point.value
                 )
 
-                if (
-                    isinstance(metric.data, Sum)
-                    and not should_convert_sum_to_gauge
-                ):
-
-                    metric_family_id = "|".join(
-                        [pre_metric_family_id, CounterMetricFamily.__name__]
-                    )
-
-                    if metric_family_id not in metric_family_id_metric_family:
-                        metric_family_id_metric_family[
-                            metric_family_id
-                        ] = CounterMetricFamily(
-                            name=metric_name,
-                            documentation=metric_description,
-                            labels=label_keys,
-                            unit=metric.unit,
-                        )
-                    metric_family_id_metric_family[
-                        metric_family_id
-                    ].add_metric(labels=label_values, value=value)
-                elif (
-                    isinstance(metric.data, Gauge)
-                    or should_convert_sum_to_gauge
-                ):
-
-                    metric_family_id = "|".join(
-                        [pre_metric_family_id, GaugeMetricFamily.__name__]
-                    )
-
-                    if (
-                        metric_family_id
-                        not in metric_family_id_metric_family.keys()
-                    ):
-                        metric_family_id_metric_family[
-                            metric_family_id
-                        ] = GaugeMetricFamily(
-                            name=metric_name,
-                            documentation=metric_description,
-                            labels=label_keys,
-                            unit=metric.unit,
-                        )
-                    metric_family_id_metric_family[
-                        metric_family_id
-                    ].add_metric(labels=label_values, value=value)
-                elif isinstance(metric.data, Histogram):
-
-                    metric_family_id = "|".join(
-                        [pre_metric_family_id, HistogramMetricFamily.__name__]
-                    )
-
-                    if (
-                        metric_family_id
-                        not in metric_family_id_metric_family.keys()
-                    ):
-                        metric_family_id_metric_family[
-                            metric_family_id
-                        ] = HistogramMetricFamily(
-                            name=metric_name,
-                            documentation=metric_description,
-                            labels=label_keys,
-                            unit=metric.unit,
-                        )
-                    metric_family_id_metric_family[
-                        metric_family_id
-                    ].add_metric(
-                        labels=label_values,
-                        buckets=_convert_buckets(
-                            value["bucket_counts"], value["explicit_bounds"]
-                        ),
-                        sum_value=value["sum"],
-                    )
-                else:
-                    _logger.warning(
-                        "Unsupported metric data. %s", type(metric.data)
-                    )
-
     def _sanitize(self, key: str) -> str:
         """sanitize the given metric name or label according to Prometheus rule.
         Replace all characters other than [A-Za-z0-9_] with '_'.
         """
-        return self._non_letters_digits_underscore_re.sub("_", key)
+        return _sanitize(key)
 
     # pylint: disable=no-self-use
     def _check_value(self, value: Union[int, float, str, Sequence]) -> str:
@@ -0,0 +1,240 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Writer of the Prometheus and OpenMetrics text exposition formats.
+
+The samples are written as text as soon as they are added, the output is the
+same that ``prometheus_client`` generates for the metric families that
+``_CustomCollector`` creates, without creating them.
+"""
+
+from gzip import compress
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+from prometheus_client.utils import floatToGoString
+
+_TEXT_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+_OPENMETRICS_CONTENT_TYPE = (
+    "application/openmetrics-text; version=1.0.0; charset=utf-8"
+)
+
+_COUNTER = "counter"
+_GAUGE = "gauge"
+_HISTOGRAM = "histogram"
+_INFO = "info"
+
+# the label that holds the upper bound of histogram buckets
+_LE = "le"
+
+# The labels of a series, all of them and the ones that are sorted before and
+# after the le label of the histogram buckets.
+_RenderedLabels = Tuple[str, str, str]
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _render_labels(
+    label_keys: Sequence[str], label_values: Sequence[str]
+) -> _RenderedLabels:
+    """Renders the labels of a series sorted by their name, like
+    ``prometheus_client`` does."""
+    labels = sorted(dict(zip(label_keys, label_values)).items())
+    rendered = [
+        f'{key}="{_escape_label_value(value)}"' for key, value in labels
+    ]
+    before_le = "".join(
+        f"{label}," for (key, _), label in zip(labels, rendered) if key < _LE
+    )
+    after_le = "".join(
+        f",{label}" for (key, _), label in zip(labels, rendered) if key > _LE
+    )
+    if rendered:
+        return "{" + ",".join(rendered) + "}", before_le, after_le
+    return "", before_le, after_le
+
+
+class _MetricFamily:
+    __slots__ = ("name", "type", "documentation", "unit", "lines")
+
+    def __init__(
+        self, name: str, type_: str, documentation: str, unit: str
+    ) -> None:
+        # the name is built like prometheus_client.Metric builds it
+        if type_ == _COUNTER and name.endswith("_total"):
+            name = name[:-6]
+        if unit and not name.endswith("_" + unit):
+            name += "_" + unit
+        self.name = name
+        self.type = type_
+        self.documentation = documentation
+        self.unit = unit
+        self.lines: List[str] = []
+
+
+class _ExpositionWriter:
+    """Writes samples in the Prometheus text format, or in the OpenMetrics
+    text format, grouped by metric family."""
+
+    def __init__(self, openmetrics: bool = False) -> None:
+        self._openmetrics = openmetrics
+        self._families: Dict[str, _MetricFamily] = {}
+
+    def _family(
+        self,
+        family_id: str,
+        name: str,
+        type_: str,
+        documentation: str,
+        unit: str,
+    ) -> _MetricFamily:
+        family = self._families.get(family_id)
+        if family is None:
+            family = _MetricFamily(name, type_, documentation, unit)
+            self._families[family_id] = family
+        return family
+
+    def add_value(
+        self,
+        family_id: str,
+        name: str,
+        type_: str,
+        documentation: str,
+        unit: str,
+        labels: _RenderedLabels,
+        value: Union[int, float],
+    ) -> None:
+        """Adds a sample of a counter, gauge or info metric family."""
+        family = self._family(family_id, name, type_, documentation, unit)
+        sample_name = family.name
+        if type_ == _COUNTER:
+            sample_name += "_total"
+        elif type_ == _INFO:
+            sample_name += "_info"
+        family.lines.append(
+            f"{sample_name}{labels[0]} {floatToGoString(value)}\n"
+        )
+
+    # pylint: disable=too-many-arguments
+    def add_histogram(
+        self,
+        family_id: str,
+        name: str,
+        documentation: str,
+        unit: str,
+        labels: _RenderedLabels,
+        buckets: Sequence[Tuple[str, int]],
+        sum_value: Union[int, float],
+    ) -> None:
+        """Adds the samples of a histogram, ``buckets`` are the upper bounds
+        and cumulative counts of its buckets."""
+        family = self._family(family_id, name, _HISTOGRAM, documentation, unit)
+        all_labels, before_le, after_le = labels
+        name = family.name
+        lines = family.lines
+        for upper_bound, count in buckets:
+            lines.append(
+                f'{name}_bucket{{{before_le}le="{upper_bound}"{after_le}}} '
+                f"{floatToGoString(count)}\n"
+            )
+        lines.append(
+            f"{name}_count{all_labels} {floatToGoString(buckets[-1][1])}\n"
+        )
+        lines.append(f"{name}_sum{all_labels} {floatToGoString(sum_value)}\n")
+
+    def write(self) -> str:
+        output = []
+        for family in self._families.values():
+            name = family.name
+            type_ = family.type
+            if self._openmetrics:
+                documentation = _escape_label_value(family.documentation)
+            else:
+                documentation = family.documentation.replace(
+                    "\\", r"\\"
+                ).replace("\n", r"\n")
+                if type_ == _COUNTER:
+                    name += "_total"
+                elif type_ == _INFO:
+                    name += "_info"
+                    type_ = _GAUGE
+            output.append(f"# HELP {name} {documentation}\n")
+            output.append(f"# TYPE {name} {type_}\n")
+            if self._openmetrics and family.unit:
+                output.append(f"# UNIT {name} {family.unit}\n")
+            output.extend(family.lines)
+        if self._openmetrics:
+            output.append("# EOF\n")
+        return "".join(output)
+
+
+def _accepts_openmetrics(accept_header: str) -> bool:
+    return any(
+        accepted.split(";")[0].strip() == "application/openmetrics-text"
+        for accepted in accept_header.split(",")
+    )
+
+
+def _accepts_gzip(accept_encoding_header: str) -> bool:
+    return "gzip" in (
+        encoding.split(";")[0].strip()
+        for encoding in accept_encoding_header.split(",")
+    )
+
+
+class _ExpositionHandler(BaseHTTPRequestHandler):
+    """Serves the exposition that ``generate`` writes, in the format and
+    with the encoding that the scraper accepts."""
+
+    generate: Callable[[bool], bytes]
+
+    # pylint: disable=invalid-name
+    def do_GET(self) -> None:
+        openmetrics = _accepts_openmetrics(self.headers.get("Accept", ""))
+        try:
+            body = self.generate(openmetrics)
+        except Exception:  # pylint: disable=broad-except
+            self.send_error(500, "error generating metric output")
+            raise
+        self.send_response(200)
+        self.send_header(
+            "Content-Type",
+            _OPENMETRICS_CONTENT_TYPE if openmetrics else _TEXT_CONTENT_TYPE,
+        )
+        if _accepts_gzip(self.headers.get("Accept-Encoding", "")):
+            body = compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:  # pylint: disable=W0622
+        """Scrapes are not logged."""
+
+
+def _start_exposition_server(
+    generate: Callable[[bool], bytes], port: int, addr: str
+) -> ThreadingHTTPServer:
+    handler = type(
+        "_ExpositionHandler",
+        (_ExpositionHandler,),
+        {"generate": staticmethod(generate)},
+    )
+    server = ThreadingHTTPServer((addr, port), handler)
+    server.daemon_threads = True
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server
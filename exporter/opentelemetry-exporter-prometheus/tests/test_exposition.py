@@ -0,0 +1,215 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from gzip import decompress
+from threading import Thread
+from unittest import TestCase
+from unittest.mock import patch
+from urllib.request import Request, urlopen
+
+from prometheus_client import generate_latest
+from prometheus_client.openmetrics.exposition import (
+    generate_latest as generate_latest_openmetrics,
+)
+
+from opentelemetry.exporter.prometheus import (
+    PrometheusMetricReader,
+    _CustomCollector,
+    start_exposition_server,
+)
+from opentelemetry.sdk.metrics.export import (
+    AggregationTemporality,
+    Histogram,
+    HistogramDataPoint,
+    Metric,
+    MetricsData,
+    ResourceMetrics,
+    ScopeMetrics,
+)
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.test.metrictestutil import _generate_gauge, _generate_sum
+
+
+def _histogram(attributes):
+    return Metric(
+        name="test@histogram",
+        description='histogram "description"\nwith \\ newline',
+        unit="s",
+        data=Histogram(
+            data_points=[
+                HistogramDataPoint(
+                    attributes=attributes,
+                    start_time_unix_nano=1641946016139533244,
+                    time_unix_nano=1641946016139533244,
+                    count=6,
+                    sum=579.0,
+                    bucket_counts=[1, 3, 2],
+                    explicit_bounds=[123.0, 456.0],
+                    min=1,
+                    max=457,
+                )
+            ],
+            aggregation_temporality=AggregationTemporality.CUMULATIVE,
+        ),
+    )
+
+
+def _metrics_data():
+    return MetricsData(
+        resource_metrics=[
+            ResourceMetrics(
+                resource=Resource({"os": "Unix", "host.name": "host"}),
+                scope_metrics=[
+                    ScopeMetrics(
+                        scope=None,
+                        metrics=[
+                            _histogram({"z": 1, "a": "first", "le": "x"}),
+                            _histogram({"z": 2, "a": "second", "le": "x"}),
+                            _generate_sum(
+                                "requests_total",
+                                3,
+                                attributes={"path": '/"quoted"\npath\\'},
+                                unit="1",
+                            ),
+                            _generate_sum(
+                                "updown",
+                                -1.5,
+                                attributes={"values": [1, 2]},
+                                is_monotonic=False,
+                            ),
+                            _generate_gauge("temperature", 2.5e-7),
+                            _generate_gauge(
+                                "temperature", 3, attributes={"room": "a"}
+                            ),
+                        ],
+                        schema_url="schema_url",
+                    )
+                ],
+                schema_url="schema_url",
+            )
+        ]
+    )
+
+
+class TestExpositionWriter(TestCase):
+    def _assert_same_exposition(self, collector, openmetrics):
+        generate = (
+            generate_latest_openmetrics if openmetrics else generate_latest
+        )
+        for _ in range(2):
+            collector.add_metrics_data(_metrics_data())
+            expected = generate(collector)
+            collector.add_metrics_data(_metrics_data())
+            self.assertEqual(collector.generate_latest(openmetrics), expected)
+
+    def test_text_format(self):
+        self._assert_same_exposition(_CustomCollector(), False)
+
+    def test_openmetrics_format(self):
+        self._assert_same_exposition(_CustomCollector(), True)
+
+    def test_target_info_disabled(self):
+        collector = _CustomCollector(disable_target_info=True)
+        self._assert_same_exposition(collector, False)
+
+        collector.add_metrics_data(_metrics_data())
+        self.assertNotIn(b"target_info", collector.generate_latest())
+
+    def test_no_metrics(self):
+        collector = _CustomCollector()
+
+        self.assertEqual(collector.generate_latest(), b"")
+        self.assertEqual(collector.generate_latest(True), b"# EOF\n")
+
+    def test_labels_rendered_once(self):
+        collector = _CustomCollector(disable_target_info=True)
+        metrics_data = _metrics_data()
+
+        with patch(
+            "opentelemetry.exporter.prometheus._render_labels",
+        ) as render_labels:
+            render_labels.return_value = ("", "", "")
+            for _ in range(2):
+                collector.add_metrics_data(metrics_data)
+                collector.generate_latest()
+        # one call for each of the six series
+        self.assertEqual(render_labels.call_count, 6)
+
+    def test_collect_takes_lock(self):
+        collector = _CustomCollector()
+        collector.add_metrics_data(_metrics_data())
+        metric_families = []
+        thread = Thread(
+            target=lambda: metric_families.extend(collector.collect())
+        )
+
+        with collector._lock:
+            thread.start()
+            thread.join(0.1)
+            self.assertTrue(thread.is_alive())
+            self.assertEqual(len(collector._metrics_datas), 1)
+        thread.join()
+
+        self.assertTrue(metric_families)
+        self.assertFalse(collector._metrics_datas)
+
+
+class TestExpositionServer(TestCase):
+    def setUp(self):
+        self._registry_patch = patch(
+            "prometheus_client.core.REGISTRY.register"
+        )
+        self._registry_patch.start()
+        self.addCleanup(self._registry_patch.stop)
+        self._metric_reader = PrometheusMetricReader()
+        self._server = start_exposition_server(self._metric_reader, port=0)
+        self.addCleanup(self._server.server_close)
+        self.addCleanup(self._server.shutdown)
+        self._url = f"http://localhost:{self._server.server_port}/metrics"
+
+    def _scrape(self, headers):
+        self._metric_reader._collector.add_metrics_data(_metrics_data())
+        with urlopen(Request(self._url, headers=headers)) as response:
+            return response.headers, response.read()
+
+    def test_text_format(self):
+        headers, body = self._scrape({})
+
+        self.assertEqual(
+            headers["Content-Type"], "text/plain; version=0.0.4; charset=utf-8"
+        )
+        self.assertIsNone(headers["Content-Encoding"])
+        self.assertEqual(int(headers["Content-Length"]), len(body))
+        self.assertIn(b"# TYPE requests_1_total counter\n", body)
+
+    def test_openmetrics_format(self):
+        headers, body = self._scrape(
+            {
+                "Accept": "application/openmetrics-text; version=1.0.0,"
+                "text/plain;version=0.0.4;q=0.5"
+            }
+        )
+
+        self.assertEqual(
+            headers["Content-Type"],
+            "application/openmetrics-text; version=1.0.0; charset=utf-8",
+        )
+        self.assertTrue(body.endswith(b"# EOF\n"))
+
+    def test_gzip(self):
+        headers, body = self._scrape({"Accept-Encoding": "gzip, deflate"})
+
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+        self.assertEqual(int(headers["Content-Length"]), len(body))
+        self.assertIn(b"# TYPE requests_1_total counter\n", decompress(body))
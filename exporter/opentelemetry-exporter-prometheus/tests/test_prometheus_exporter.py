@@ -389,3 +389,73 @@ class TestPrometheusMetricReader(TestCase):
             )
             self.assertNotIn("os", prometheus_metric.samples[0].labels)
             self.assertNotIn("histo", prometheus_metric.samples[0].labels)
+
+    def test_series_labels_cached(self):
+        attributes = {"environment@": "staging", "os": "Unix"}
+        metrics_data = MetricsData(
+            resource_metrics=[
+                ResourceMetrics(
+                    resource=Mock(),
+                    scope_metrics=[
+                        ScopeMetrics(
+                            scope=Mock(),
+                            metrics=[
+                                _generate_sum(
+                                    "test@sum", 123, attributes=attributes
+                                )
+                            ],
+                            schema_url="schema_url",
+                        )
+                    ],
+                    schema_url="schema_url",
+                )
+            ]
+        )
+        collector = _CustomCollector(disable_target_info=True)
+
+        with patch.object(
+            collector, "_check_value", wraps=collector._check_value
+        ) as check_value:
+            for _ in range(2):
+                collector.add_metrics_data(metrics_data)
+                (prometheus_metric,) = collector.collect()
+                self.assertEqual(
+                    prometheus_metric.samples[0].labels,
+                    {"environment_": "staging", "os": "Unix"},
+                )
+            self.assertEqual(check_value.call_count, 2)
+
+            attributes["os"] = "Windows"
+            collector.add_metrics_data(metrics_data)
+            (prometheus_metric,) = collector.collect()
+            self.assertEqual(
+                prometheus_metric.samples[0].labels,
+                {"environment_": "staging", "os": "Windows"},
+            )
+            self.assertEqual(check_value.call_count, 4)
+
+        collector.add_metrics_data(
+            MetricsData(
+                resource_metrics=[
+                    ResourceMetrics(
+                        resource=Mock(),
+                        scope_metrics=[
+                            ScopeMetrics(
+                                scope=Mock(),
+                                metrics=[
+                                    _generate_sum(
+                                        "test@sum", 1, attributes={"a": "b"}
+                                    )
+                                ],
+                                schema_url="schema_url",
+                            )
+                        ],
+                        schema_url="schema_url",
+                    )
+                ]
+            )
+        )
+        list(collector.collect())
+        # only the series that were exported last are cached
+        self.assertEqual(len(collector._series_labels), 1)
+        self.assertEqual(len(collector._metric_family_ids), 1)
@@ -16,7 +16,7 @@
 import logging
 import threading
 from collections import OrderedDict
-from collections.abc import MutableMapping
+from collections.abc import Mapping, MutableMapping
 from typing import Optional, Sequence, Union
 
 from opentelemetry.util import types
@@ -25,6 +25,10 @@ from opentelemetry.util import types
 # decoded to strings internally.
 _VALID_ATTR_VALUE_TYPES = (bool, str, bytes, int, float)
 
+# Exact types whose values never need cleaning, checked with ``type(value)``
+# before falling back to the slower ``isinstance`` based validation.
+_NO_CLEANING_ATTR_VALUE_TYPES = frozenset((bool, int, float))
+
 
 _logger = logging.getLogger(__name__)
 
@@ -51,6 +55,19 @@ def _clean_attribute(
         _logger.warning("invalid key `%s`. must be non-empty string.", key)
         return None
 
+    value_type = type(value)
+
+    if value_type in _NO_CLEANING_ATTR_VALUE_TYPES:
+        return value
+
+    if value_type is str:
+        if max_len is None:
+            return value
+        return value[:max_len]
+
+    if value_type is tuple and _is_clean_tuple(value, max_len):
+        return value
+
     if isinstance(value, _VALID_ATTR_VALUE_TYPES):
         return _clean_attribute_value(value, max_len)
 
@@ -107,6 +124,33 @@ def _clean_attribute(
     return None
 
 
+def _is_clean_tuple(value: tuple, max_len: Optional[int]) -> bool:
+    """Checks if a tuple is a valid attribute value that needs no cleaning.
+
+    That is the case for homogeneous tuples of ``bool``, ``int``, ``float``
+    or ``str`` values, as long as no string exceeds ``max_len``. Such tuples
+    are already immutable and can be used as they are.
+    """
+    # pylint: disable=unidiomatic-typecheck
+    if not value:
+        return True
+
+    first_type = type(value[0])
+
+    if first_type is str:
+        if max_len is None:
+            return all(type(element) is str for element in value)
+        return all(
+            type(element) is str and len(element) <= max_len
+            for element in value
+        )
+
+    if first_type in _NO_CLEANING_ATTR_VALUE_TYPES:
+        return all(type(element) is first_type for element in value)
+
+    return False
+
+
 def _clean_attribute_value(
     value: types.AttributeValue, limit: Optional[int]
 ) -> Union[types.AttributeValue, None]:
@@ -150,8 +194,9 @@ class BoundedAttributes(MutableMapping):
         self._dict = OrderedDict()  # type: OrderedDict
         self._lock = threading.Lock()  # type: threading.Lock
         if attributes:
-            for key, value in attributes.items():
-                self[key] = value
+            # the attributes are not shared with other threads yet, so they
+            # are added without taking the lock
+            self._update(attributes)
         self._immutable = immutable
 
     def __repr__(self):
@@ -166,21 +211,43 @@ class BoundedAttributes(MutableMapping):
         if getattr(self, "_immutable", False):
             raise TypeError
         with self._lock:
-            if self.maxlen is not None and self.maxlen == 0:
-                self.dropped += 1
-                return
+            self._set_item(key, value)
 
-            value = _clean_attribute(key, value, self.max_value_len)
-            if value is not None:
-                if key in self._dict:
-                    del self._dict[key]
-                elif (
-                    self.maxlen is not None and len(self._dict) == self.maxlen
-                ):
-                    self._dict.popitem(last=False)
-                    self.dropped += 1
+    def update(self, attributes: types.Attributes = None, **kwargs):
+        """Adds all of the given attributes while holding the lock once."""
+        if getattr(self, "_immutable", False):
+            raise TypeError
+        if attributes and not isinstance(attributes, Mapping):
+            attributes = dict(attributes)
+        with self._lock:
+            if attributes:
+                self._update(attributes)
+            if kwargs:
+                self._update(kwargs)
+
+    def _update(self, attributes: types.Attributes) -> None:
+        if self.maxlen is not None and self.maxlen == 0:
+            self.dropped += len(attributes)
+            return
+
+        for key, value in attributes.items():
+            self._set_item(key, value)
+
+    def _set_item(self, key, value) -> None:
+        # callers are responsible for holding the lock when needed
+        if self.maxlen is not None and self.maxlen == 0:
+            self.dropped += 1
+            return
+
+        value = _clean_attribute(key, value, self.max_value_len)
+        if value is not None:
+            if key in self._dict:
+                del self._dict[key]
+            elif self.maxlen is not None and len(self._dict) == self.maxlen:
+                self._dict.popitem(last=False)
+                self.dropped += 1
 
-                self._dict[key] = value
+            self._dict[key] = value
 
     def __delitem__(self, key):
         if getattr(self, "_immutable", False):
@@ -189,6 +256,9 @@ class BoundedAttributes(MutableMapping):
             del self._dict[key]
 
     def __iter__(self):
+        if getattr(self, "_immutable", False):
+            # immutable attributes can't change while being iterated over
+            return iter(self._dict)
         with self._lock:
             return iter(self._dict.copy())
 
@@ -57,6 +57,10 @@ def _is_valid_pair(key: str, value: str) -> bool:
 class Span(abc.ABC):
     """A span represents a single operation within a trace."""
 
+    # no instance state is kept here, so that implementations can use
+    # __slots__ for theirs
+    __slots__ = ()
+
     @abc.abstractmethod
     def end(self, end_time: typing.Optional[int] = None) -> None:
         """Sets the current time as the span's end time.
@@ -17,6 +17,7 @@
 import collections
 import unittest
 from typing import MutableSequence
+from unittest.mock import MagicMock, patch
 
 from opentelemetry.attributes import BoundedAttributes, _clean_attribute
 
@@ -88,6 +89,35 @@ class TestAttributes(unittest.TestCase):
             _clean_attribute("headers", seq, None), tuple(expected)
         )
 
+    def test_clean_tuple_not_copied(self):
+        for value in [(1, 2), (1.2, 2.3), (True, False), ("a", "b"), ()]:
+            self.assertIs(_clean_attribute("k", value, None), value)
+
+        value = ("ab", "cd")
+        self.assertIs(_clean_attribute("k", value, 2), value)
+        self.assertEqual(_clean_attribute("k", value, 1), ("a", "c"))
+        self.assertEqual(_clean_attribute("k", ("a", None), None), ("a", None))
+        self.assertEqual(_clean_attribute("k", (b"a", b"b"), None), ("a", "b"))
+        self.assertIsNone(_clean_attribute("k", (1, True), None))
+        self.assertIsNone(_clean_attribute("k", (1, "a"), None))
+
+    def test_clean_attribute_truncation(self):
+        self.assertEqual(_clean_attribute("k", "abc", 2), "ab")
+        self.assertEqual(_clean_attribute("k", "abc", None), "abc")
+        self.assertEqual(_clean_attribute("k", b"abc", 2), "ab")
+        self.assertEqual(_clean_attribute("k", ["abc", "d"], 2), ("ab", "d"))
+
+    def test_clean_attribute_subclasses(self):
+        class MyInt(int):
+            pass
+
+        class MyStr(str):
+            pass
+
+        self.assertValid(MyInt(1))
+        self.assertValid(MyStr("a"))
+        self.assertEqual(_clean_attribute("k", MyStr("abc"), 2), "ab")
+
 
 class TestBoundedAttributes(unittest.TestCase):
     base = collections.OrderedDict(
@@ -183,3 +213,42 @@ class TestBoundedAttributes(unittest.TestCase):
         bdict = BoundedAttributes()
         with self.assertRaises(TypeError):
             bdict["should-not-work"] = "dict immutable"
+
+    def test_update(self):
+        bdict = BoundedAttributes(3, {"name": "Bruno"}, immutable=False)
+        # pylint: disable=protected-access
+        bdict._lock = MagicMock()
+
+        bdict.update(self.base)
+        bdict._lock.__enter__.assert_called_once()
+        self.assertEqual(list(bdict), ["age", "weight", "vaccinated"])
+        self.assertEqual(bdict.dropped, 1)
+
+        # invalid values are not added and not considered for `dropped`
+        bdict.update([("invalid-seq", [None, 1, "2"])], age=8)
+        self.assertEqual(list(bdict), ["weight", "vaccinated", "age"])
+        self.assertEqual(bdict["age"], 8)
+        self.assertEqual(bdict.dropped, 1)
+
+        with self.assertRaises(TypeError):
+            BoundedAttributes().update(self.base)
+
+    def test_update_zero_maxlen(self):
+        bdict = BoundedAttributes(0, self.base, immutable=False)
+        self.assertEqual(len(bdict), 0)
+        self.assertEqual(bdict.dropped, len(self.base))
+
+        bdict.update(self.base)
+        self.assertEqual(bdict.dropped, 2 * len(self.base))
+
+    def test_init_does_not_lock(self):
+        with patch("opentelemetry.attributes.threading.Lock") as mock_lock:
+            BoundedAttributes(attributes=self.base)
+        mock_lock.return_value.__enter__.assert_not_called()
+
+    def test_immutable_iter_does_not_lock(self):
+        bdict = BoundedAttributes(attributes=self.base)
+        # pylint: disable=protected-access
+        bdict._lock = MagicMock()
+        self.assertEqual(list(bdict), list(self.base))
+        bdict._lock.__enter__.assert_not_called()
@@ -0,0 +1,58 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from opentelemetry.attributes import BoundedAttributes, _clean_attribute
+
+LONG_STRING = "a" * 256
+
+
+@pytest.mark.parametrize(
+    "value",
+    [True, 10, 1.5, "value"],
+    ids=["bool", "int", "float", "str"],
+)
+def test_clean_scalar_attribute(benchmark, value):
+    benchmark(_clean_attribute, "key", value, None)
+
+
+@pytest.mark.parametrize("max_len", [None, 128])
+def test_clean_string_attribute_truncation(benchmark, max_len):
+    benchmark(_clean_attribute, "key", LONG_STRING, max_len)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        (1, 2, 3, 4, 5, 6, 7, 8),
+        ("a", "b", "c", "d", "e", "f", "g", "h"),
+        [1, 2, 3, 4, 5, 6, 7, 8],
+        ["a", "b", "c", "d", "e", "f", "g", "h"],
+    ],
+    ids=["int_tuple", "str_tuple", "int_list", "str_list"],
+)
+def test_clean_sequence_attribute(benchmark, value):
+    benchmark(_clean_attribute, "key", value, None)
+
+
+def test_bounded_attributes_set_item(benchmark):
+    attributes = BoundedAttributes(128, immutable=False)
+
+    def benchmark_set_item():
+        attributes["http.method"] = "GET"
+        attributes["http.status_code"] = 200
+        attributes["http.route"] = "/users/{id}"
+
+    benchmark(benchmark_set_item)
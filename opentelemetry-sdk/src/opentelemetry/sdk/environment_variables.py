@@ -130,6 +130,14 @@ The :envvar:`OTEL_BSP_MAX_EXPORT_BATCH_SIZE` represents the maximum batch size f
 Default: 512
 """
 
+OTEL_BSP_MAX_CONCURRENT_EXPORTS = "OTEL_BSP_MAX_CONCURRENT_EXPORTS"
+"""
+.. envvar:: OTEL_BSP_MAX_CONCURRENT_EXPORTS
+
+The :envvar:`OTEL_BSP_MAX_CONCURRENT_EXPORTS` represents the maximum number of batches the BatchSpanProcessor exports concurrently.
+Default: 1
+"""
+
 OTEL_ATTRIBUTE_COUNT_LIMIT = "OTEL_ATTRIBUTE_COUNT_LIMIT"
 """
 .. envvar:: OTEL_ATTRIBUTE_COUNT_LIMIT
@@ -650,6 +658,37 @@ OTEL_METRICS_EXEMPLAR_FILTER = "OTEL_METRICS_EXEMPLAR_FILTER"
 The :envvar:`OTEL_METRICS_EXEMPLAR_FILTER` is the filter for which measurements can become Exemplars.
 """
 
+OTEL_PYTHON_METRICS_CARDINALITY_LIMIT = "OTEL_PYTHON_METRICS_CARDINALITY_LIMIT"
+"""
+.. envvar:: OTEL_PYTHON_METRICS_CARDINALITY_LIMIT
+
+The :envvar:`OTEL_PYTHON_METRICS_CARDINALITY_LIMIT` is the maximum number of data points that a metric stream
+collects when its view does not set ``aggregation_cardinality_limit``, measurements with sets of attributes past
+the limit are aggregated into a single overflow data point. Default: 2000
+"""
+
+OTEL_PYTHON_METRICS_CALLBACK_MAX_WORKERS = (
+    "OTEL_PYTHON_METRICS_CALLBACK_MAX_WORKERS"
+)
+"""
+.. envvar:: OTEL_PYTHON_METRICS_CALLBACK_MAX_WORKERS
+
+The :envvar:`OTEL_PYTHON_METRICS_CALLBACK_MAX_WORKERS` is the maximum number of threads that run the callbacks of
+asynchronous instruments concurrently during a collection. When it is not set, the callbacks run one after the other
+in the collecting thread and a collection that does not finish them before its timeout fails with
+``MetricsTimeoutError``. Default: not set
+"""
+
+OTEL_PYTHON_METRICS_CALLBACK_TIMEOUT = "OTEL_PYTHON_METRICS_CALLBACK_TIMEOUT"
+"""
+.. envvar:: OTEL_PYTHON_METRICS_CALLBACK_TIMEOUT
+
+The :envvar:`OTEL_PYTHON_METRICS_CALLBACK_TIMEOUT` is the maximum time (in milliseconds) that the collection waits
+for a single callback of an asynchronous instrument when they run concurrently, the measurements of callbacks that
+take longer are skipped. Callbacks are always bounded by the timeout of the collection itself. Default: no timeout
+besides the one of the collection
+"""
+
 OTEL_EXPORTER_OTLP_METRICS_DEFAULT_HISTOGRAM_AGGREGATION = (
     "OTEL_EXPORTER_OTLP_METRICS_DEFAULT_HISTOGRAM_AGGREGATION"
 )
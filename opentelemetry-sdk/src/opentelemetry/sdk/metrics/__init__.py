@@ -16,6 +16,9 @@
 from opentelemetry.sdk.metrics._internal import Meter, MeterProvider
 from opentelemetry.sdk.metrics._internal.exceptions import MetricsTimeoutError
 from opentelemetry.sdk.metrics._internal.instrument import (
+    BoundCounter,
+    BoundHistogram,
+    BoundUpDownCounter,
     Counter,
     Histogram,
     ObservableCounter,
@@ -28,6 +31,9 @@ __all__ = [
     "Meter",
     "MeterProvider",
     "MetricsTimeoutError",
+    "BoundCounter",
+    "BoundHistogram",
+    "BoundUpDownCounter",
     "Counter",
     "Histogram",
     "ObservableCounter",
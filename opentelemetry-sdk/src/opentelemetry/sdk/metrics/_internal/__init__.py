@@ -448,6 +448,8 @@ class MeterProvider(APIMeterProvider):
 
                 metric_reader_error[metric_reader] = error
 
+        self._measurement_consumer.shutdown()
+
         if self._atexit_handler is not None:
             unregister(self._atexit_handler)
             self._atexit_handler = None
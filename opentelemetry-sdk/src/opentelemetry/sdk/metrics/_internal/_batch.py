@@ -0,0 +1,130 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers to aggregate batches of measurement values.
+
+Large batches are processed as NumPy arrays when NumPy is installed, batches
+are processed as plain Python sequences otherwise. Both give the same
+results for the same amounts, except for the sums of float amounts: NumPy
+adds floats pairwise and Python one after the other, they round differently
+and the sums may differ in their last bits.
+"""
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import Iterable, List, Tuple, Union
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+# Converting smaller batches to arrays costs more than it saves.
+_MIN_ARRAY_SIZE = 64
+
+_Batch = Union[Sequence, "numpy.ndarray"]
+
+
+def _is_array(batch: _Batch) -> bool:
+    return numpy is not None and isinstance(batch, numpy.ndarray)
+
+
+def _to_batch(amounts: Iterable[Union[int, float]]) -> _Batch:
+    """Returns the amounts as a batch that the helpers in this module
+    accept."""
+    if _is_array(amounts):
+        return amounts.ravel()
+    if not isinstance(amounts, Sequence):
+        amounts = list(amounts)
+    if numpy is not None and len(amounts) >= _MIN_ARRAY_SIZE:
+        array = numpy.asarray(amounts)
+        # integers, unsigned integers and floats, amounts that do not fit
+        # in a numeric array are kept as they are
+        if array.ndim == 1 and array.dtype.kind in "iuf":
+            return array
+    return amounts
+
+
+def _validate(
+    amounts: Iterable[Union[int, float]], non_negative: bool = False
+) -> Tuple[_Batch, bool]:
+    """Returns the amounts as a batch without its NaN amounts, and without
+    its negative amounts if ``non_negative`` is true, and whether any amount
+    was dropped."""
+    batch = _to_batch(amounts)
+    if _is_array(batch):
+        invalid = None
+        if batch.dtype.kind == "f":
+            invalid = numpy.isnan(batch)
+        if non_negative and batch.dtype.kind != "u":
+            negative = batch < 0
+            invalid = negative if invalid is None else invalid | negative
+        if invalid is not None and invalid.any():
+            return batch[~invalid], True
+        return batch, False
+    # NaN is the only amount that is not equal to itself
+    # pylint: disable=comparison-with-itself
+    if non_negative:
+        valid = [amount for amount in batch if amount >= 0]
+    else:
+        valid = [amount for amount in batch if amount == amount]
+    if len(valid) != len(batch):
+        return valid, True
+    return batch, False
+
+
+def _sum(batch: _Batch) -> Union[int, float]:
+    """Returns the sum of the amounts, exact for integer amounts and rounded
+    differently for float amounts whether the batch is an array or not."""
+    if _is_array(batch):
+        if batch.dtype.kind in "iu" and len(batch):
+            # integer arrays are summed with integers of their size, which
+            # wrap around instead of growing like Python integers do
+            largest = max(abs(batch.min().item()), abs(batch.max().item()))
+            if largest * len(batch) >= 2**63:
+                return sum(batch.tolist())
+        return batch.sum().item()
+    return sum(batch)
+
+
+def _min_max(batch: _Batch) -> Tuple[Union[int, float], Union[int, float]]:
+    if _is_array(batch):
+        return batch.min().item(), batch.max().item()
+    return min(batch), max(batch)
+
+
+def _last(batch: _Batch) -> Union[int, float]:
+    if _is_array(batch):
+        return batch[-1].item()
+    return batch[-1]
+
+
+def _to_list(batch: _Batch) -> List[Union[int, float]]:
+    if _is_array(batch):
+        return batch.tolist()
+    return batch
+
+
+def _bucket_counts(boundaries: Sequence[float], batch: _Batch) -> List[int]:
+    """Returns the number of amounts in every bucket delimited by
+    ``boundaries``, like ``bisect_left`` does for a single amount."""
+    if _is_array(batch):
+        return numpy.bincount(
+            numpy.searchsorted(boundaries, batch, side="left"),
+            minlength=len(boundaries) + 1,
+        ).tolist()
+    bucket_counts = [0] * (len(boundaries) + 1)
+    for amount in batch:
+        bucket_counts[bisect_left(boundaries, amount)] += 1
+    return bucket_counts
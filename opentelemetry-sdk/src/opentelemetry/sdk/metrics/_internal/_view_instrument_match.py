@@ -14,11 +14,15 @@
 
 
 from logging import getLogger
+from os import environ
 from threading import Lock
 from time import time_ns
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from opentelemetry.metrics import Instrument
+from opentelemetry.sdk.environment_variables import (
+    OTEL_PYTHON_METRICS_CARDINALITY_LIMIT,
+)
 from opentelemetry.sdk.metrics._internal.aggregation import (
     Aggregation,
     DefaultAggregation,
@@ -29,9 +33,35 @@ from opentelemetry.sdk.metrics._internal.export import AggregationTemporality
 from opentelemetry.sdk.metrics._internal.measurement import Measurement
 from opentelemetry.sdk.metrics._internal.point import DataPointT
 from opentelemetry.sdk.metrics._internal.view import View
+from opentelemetry.util.types import Attributes
 
 _logger = getLogger(__name__)
 
+_DEFAULT_CARDINALITY_LIMIT = 2000
+_OVERFLOW_ATTRIBUTES = {"otel.metric.overflow": True}
+_OVERFLOW_KEY = frozenset(_OVERFLOW_ATTRIBUTES.items())
+
+
+def _get_cardinality_limit(view: View) -> int:
+    # pylint: disable=protected-access
+    if view._aggregation_cardinality_limit is not None:
+        return view._aggregation_cardinality_limit
+    try:
+        cardinality_limit = int(
+            environ.get(
+                OTEL_PYTHON_METRICS_CARDINALITY_LIMIT,
+                _DEFAULT_CARDINALITY_LIMIT,
+            )
+        )
+    except ValueError:
+        cardinality_limit = 0
+    if cardinality_limit < 1:
+        _logger.warning(
+            "Found invalid value for cardinality limit, using default"
+        )
+        cardinality_limit = _DEFAULT_CARDINALITY_LIMIT
+    return cardinality_limit
+
 
 class _ViewInstrumentMatch:
     def __init__(
@@ -44,6 +74,14 @@ class _ViewInstrumentMatch:
         self._view = view
         self._instrument = instrument
         self._attributes_aggregation: Dict[frozenset, _Aggregation] = {}
+        self._cardinality_limit = _get_cardinality_limit(view)
+        if view._series_ttl_millis is None:
+            self._series_ttl_nanos = None
+        else:
+            self._series_ttl_nanos = view._series_ttl_millis * 1e6
+        # start time of the last collection in which each set of attributes
+        # received measurements, only tracked when a series TTL is set
+        self._attributes_last_active: Dict[frozenset, int] = {}
         self._lock = Lock()
         self._instrument_class_aggregation = instrument_class_aggregation
         self._name = self._view._name or self._instrument.name
@@ -80,64 +118,233 @@ class _ViewInstrumentMatch:
 
         return result
 
-    # pylint: disable=protected-access
     def consume_measurement(self, measurement: Measurement) -> None:
+        while not self.get_aggregation(measurement.attributes).aggregate(
+            measurement
+        ):
+            # The aggregation was evicted by a concurrent collection, the
+            # measurement goes to the aggregation that replaces it.
+            pass
+
+    # pylint: disable=protected-access
+    def get_aggregation(self, attributes: Attributes) -> _Aggregation:
+        """Returns the aggregation for the given measurement attributes,
+        creating it if needed."""
 
         if self._view._attribute_keys is not None:
 
-            attributes = {}
+            view_attributes = {}
 
-            for key, value in (measurement.attributes or {}).items():
+            for key, value in (attributes or {}).items():
                 if key in self._view._attribute_keys:
-                    attributes[key] = value
-        elif measurement.attributes is not None:
-            attributes = measurement.attributes
-        else:
+                    view_attributes[key] = value
+            attributes = view_attributes
+        elif attributes is None:
             attributes = {}
 
         aggr_key = frozenset(attributes.items())
 
-        if aggr_key not in self._attributes_aggregation:
+        aggregation = self._attributes_aggregation.get(aggr_key)
+        if aggregation is None:
             with self._lock:
-                if aggr_key not in self._attributes_aggregation:
-                    if not isinstance(
-                        self._view._aggregation, DefaultAggregation
+                aggregation = self._attributes_aggregation.get(aggr_key)
+                if aggregation is None:
+                    # The overflow data point counts towards the limit.
+                    if (
+                        len(self._attributes_aggregation)
+                        < self._cardinality_limit - 1
                     ):
-                        aggregation = (
-                            self._view._aggregation._create_aggregation(
-                                self._instrument,
-                                attributes,
-                                self._start_time_unix_nano,
-                            )
-                        )
+                        aggregation = self._create_aggregation(attributes)
+                        self._attributes_aggregation[aggr_key] = aggregation
                     else:
-                        aggregation = self._instrument_class_aggregation[
-                            self._instrument.__class__
-                        ]._create_aggregation(
-                            self._instrument,
-                            attributes,
-                            self._start_time_unix_nano,
-                        )
-                    self._attributes_aggregation[aggr_key] = aggregation
+                        aggregation = self._get_overflow_aggregation()
+
+        return aggregation
 
-        self._attributes_aggregation[aggr_key].aggregate(measurement)
+    def _merge_state(self, attributes: Attributes, state) -> None:
+        while not self.get_aggregation(attributes)._merge_state(state):
+            pass
+
+    def drain(
+        self,
+        view_instrument_matches: Sequence["_ViewInstrumentMatch"],
+        collection_start_nanos: int,
+    ) -> None:
+        """Moves the measurements aggregated since the last drain into the
+        aggregations for the same attributes of ``view_instrument_matches``.
+
+        The aggregations must be mergeable, the ones that are idle are
+        evicted.
+        """
+        idle = []
+        for aggr_key, aggregation in self._get_attributes_aggregations(
+            collection_start_nanos, False
+        ):
+            if aggregation._is_idle():
+                idle.append((aggr_key, aggregation))
+                continue
+            self._move_state(aggregation, view_instrument_matches)
+
+        for aggregation in self._evict(idle):
+            self._move_state(aggregation, view_instrument_matches)
+
+    @staticmethod
+    def _move_state(
+        aggregation: _Aggregation,
+        view_instrument_matches: Sequence["_ViewInstrumentMatch"],
+    ) -> None:
+        state = aggregation._take_state()
+        if state is None:
+            return
+        for view_instrument_match in view_instrument_matches:
+            view_instrument_match._merge_state(aggregation._attributes, state)
+
+    def _get_overflow_aggregation(self) -> _Aggregation:
+        # must be called while holding self._lock
+        aggregation = self._attributes_aggregation.get(_OVERFLOW_KEY)
+        if aggregation is None:
+            _logger.warning(
+                "Cardinality limit of %s reached for metric %s, aggregating "
+                "measurements with new attributes into the overflow data "
+                "point.",
+                self._cardinality_limit,
+                self._name,
+            )
+            aggregation = self._create_aggregation(dict(_OVERFLOW_ATTRIBUTES))
+            self._attributes_aggregation[_OVERFLOW_KEY] = aggregation
+        return aggregation
+
+    def _create_aggregation(self, attributes: Attributes) -> _Aggregation:
+        if not isinstance(self._view._aggregation, DefaultAggregation):
+            return self._view._aggregation._create_aggregation(
+                self._instrument,
+                attributes,
+                self._start_time_unix_nano,
+            )
+        return self._instrument_class_aggregation[
+            self._instrument.__class__
+        ]._create_aggregation(
+            self._instrument,
+            attributes,
+            self._start_time_unix_nano,
+        )
 
     def collect(
         self,
         collection_aggregation_temporality: AggregationTemporality,
         collection_start_nanos: int,
+        changed_only: bool = False,
     ) -> Optional[Sequence[DataPointT]]:
+        """Collects the data points of the metric stream.
+
+        With ``changed_only``, cumulative data points are only collected for
+        the attributes that received measurements since the last collection.
+        """
 
+        changed_only = (
+            changed_only
+            and collection_aggregation_temporality
+            is AggregationTemporality.CUMULATIVE
+        )
         data_points: List[DataPointT] = []
-        with self._lock:
-            for aggregation in self._attributes_aggregation.values():
-                data_point = aggregation.collect(
-                    collection_aggregation_temporality, collection_start_nanos
-                )
-                if data_point is not None:
-                    data_points.append(data_point)
+        idle = []
+        for aggr_key, aggregation in self._get_attributes_aggregations(
+            collection_start_nanos,
+            collection_aggregation_temporality is AggregationTemporality.DELTA
+            or self._series_ttl_nanos is not None,
+        ):
+            if self._is_evictable(
+                aggr_key,
+                aggregation,
+                collection_aggregation_temporality,
+                collection_start_nanos,
+            ):
+                idle.append((aggr_key, aggregation))
+                continue
+            if changed_only and aggregation._is_idle():
+                continue
+            data_point = aggregation.collect(
+                collection_aggregation_temporality, collection_start_nanos
+            )
+            if data_point is not None:
+                data_points.append(data_point)
+
+        for aggregation in self._evict(idle):
+            data_point = aggregation.collect(
+                collection_aggregation_temporality, collection_start_nanos
+            )
+            if data_point is not None:
+                data_points.append(data_point)
 
         # Returning here None instead of an empty list because the caller
         # does not consume a sequence and to be consistent with the rest of
         # collect methods that also return None.
         return data_points or None
+
+    def _get_attributes_aggregations(
+        self, collection_start_nanos: int, restart: bool
+    ) -> List[Tuple[frozenset, _Aggregation]]:
+        """Returns the aggregations of the metric stream for a collection.
+
+        The lock is only held to copy them, measurements with new attributes
+        do not wait for the whole collection. Every aggregation swaps its
+        state out under its own lock when collected.
+        """
+        with self._lock:
+            if restart:
+                # Aggregations created from now on, including the ones that
+                # replace evicted aggregations, start with the next
+                # collection interval and are not part of this collection.
+                self._start_time_unix_nano = collection_start_nanos
+            return list(self._attributes_aggregation.items())
+
+    def _is_evictable(
+        self,
+        aggr_key: frozenset,
+        aggregation: _Aggregation,
+        collection_aggregation_temporality: AggregationTemporality,
+        collection_start_nanos: int,
+    ) -> bool:
+        # Idle aggregations of measurements that are deltas are evicted with
+        # delta temporality, they hold no state that the next collection
+        # needs. With cumulative temporality, or when the measurements are
+        # cumulative like the observations of asynchronous counters, the
+        # aggregations keep the value that the next data point is computed
+        # from. They are only evicted once idle for the series TTL, which
+        # resets that value.
+        if (
+            collection_aggregation_temporality
+            is AggregationTemporality.CUMULATIVE
+            or getattr(
+                aggregation, "_instrument_aggregation_temporality", None
+            )
+            is AggregationTemporality.CUMULATIVE
+        ):
+            if self._series_ttl_nanos is None:
+                return False
+            last_active = self._attributes_last_active.get(aggr_key)
+            if last_active is None or not aggregation._is_idle():
+                self._attributes_last_active[aggr_key] = collection_start_nanos
+                return False
+            return (
+                collection_start_nanos - last_active >= self._series_ttl_nanos
+            )
+
+        return aggregation._is_idle()
+
+    def _evict(
+        self, idle: List[Tuple[frozenset, _Aggregation]]
+    ) -> List[_Aggregation]:
+        """Evicts the idle aggregations, returns the ones that received
+        measurements after they were found idle instead."""
+        not_evicted = []
+        if not idle:
+            return not_evicted
+        with self._lock:
+            for aggr_key, aggregation in idle:
+                if aggregation._evict_if_idle():
+                    del self._attributes_aggregation[aggr_key]
+                    self._attributes_last_active.pop(aggr_key, None)
+                else:
+                    not_evicted.append(aggregation)
+        return not_evicted
@@ -16,11 +16,21 @@
 
 from abc import ABC, abstractmethod
 from bisect import bisect_left
+from contextlib import contextmanager
 from enum import IntEnum
 from logging import getLogger
 from math import inf
-from threading import Lock
-from typing import Generic, List, Optional, Sequence, TypeVar
+from threading import Lock, current_thread, local
+from typing import (
+    Callable,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
 
 from opentelemetry.metrics import (
     Asynchronous,
@@ -33,6 +43,14 @@ from opentelemetry.metrics import (
     Synchronous,
     UpDownCounter,
 )
+from opentelemetry.sdk.metrics._internal._batch import (
+    _Batch,
+    _bucket_counts,
+    _last,
+    _min_max,
+    _sum,
+    _to_list,
+)
 from opentelemetry.sdk.metrics._internal.exponential_histogram.buckets import (
     Buckets,
 )
@@ -76,14 +94,63 @@ class AggregationTemporality(IntEnum):
 
 
 class _Aggregation(ABC, Generic[_DataPointVarT]):
+    # Whether the aggregated measurements can be moved into another
+    # aggregation of the same kind with _take_state and _merge_state.
+    _mergeable = False
+
     def __init__(self, attributes: Attributes):
         self._lock = Lock()
         self._attributes = attributes
         self._previous_point = None
+        # Set once the aggregation is removed from its metric stream because
+        # it was idle, measurements must then go to a new aggregation.
+        self._evicted = False
 
     @abstractmethod
-    def aggregate(self, measurement: Measurement) -> None:
-        pass
+    def aggregate(self, measurement: Measurement) -> bool:
+        """Aggregates the measurement.
+
+        Returns:
+            False if the aggregation was evicted and the measurement was not
+            aggregated.
+        """
+
+    @abstractmethod
+    def aggregate_batch(self, batch: _Batch) -> bool:
+        """Aggregates a batch of measurement values at once.
+
+        Returns:
+            False if the aggregation was evicted and the batch was not
+            aggregated.
+        """
+
+    def _is_idle(self) -> bool:
+        """Returns whether no measurement was aggregated since the last
+        collection."""
+        return False
+
+    def _evict_if_idle(self) -> bool:
+        """Evicts the aggregation if it is idle, returns whether it is
+        evicted."""
+        with self._lock:
+            if not self._evicted and self._is_idle():
+                self._evicted = True
+            return self._evicted
+
+    def _take_state(self):
+        """Returns the measurements aggregated since the state was last taken
+        and resets them, None if no measurement was aggregated."""
+        raise NotImplementedError
+
+    def _merge_state(self, state) -> bool:
+        """Aggregates a state returned by `_take_state` of another aggregation
+        of the same kind.
+
+        Returns:
+            False if the aggregation was evicted and the state was not
+            aggregated.
+        """
+        raise NotImplementedError
 
     @abstractmethod
     def collect(
@@ -95,8 +162,22 @@ class _Aggregation(ABC, Generic[_DataPointVarT]):
 
 
 class _DropAggregation(_Aggregation):
-    def aggregate(self, measurement: Measurement) -> None:
-        pass
+    _mergeable = True
+
+    def aggregate(self, measurement: Measurement) -> bool:
+        return True
+
+    def aggregate_batch(self, batch: _Batch) -> bool:
+        return True
+
+    def _is_idle(self) -> bool:
+        return True
+
+    def _take_state(self):
+        return None
+
+    def _merge_state(self, state) -> bool:
+        return True
 
     def collect(
         self,
@@ -107,6 +188,8 @@ class _DropAggregation(_Aggregation):
 
 
 class _SumAggregation(_Aggregation[Sum]):
+    _mergeable = True
+
     def __init__(
         self,
         attributes: Attributes,
@@ -127,12 +210,48 @@ class _SumAggregation(_Aggregation[Sum]):
         self._previous_collection_start_nano = self._start_time_unix_nano
         self._previous_cumulative_value = 0
 
-    def aggregate(self, measurement: Measurement) -> None:
+    def aggregate(self, measurement: Measurement) -> bool:
         with self._lock:
+            if self._evicted:
+                return False
+
             if self._current_value is None:
                 self._current_value = 0
 
             self._current_value = self._current_value + measurement.value
+        return True
+
+    def aggregate_batch(self, batch: _Batch) -> bool:
+        value = _sum(batch)
+        with self._lock:
+            if self._evicted:
+                return False
+
+            if self._current_value is None:
+                self._current_value = 0
+
+            self._current_value = self._current_value + value
+        return True
+
+    def _is_idle(self) -> bool:
+        return self._current_value is None
+
+    def _take_state(self) -> Optional[Union[int, float]]:
+        with self._lock:
+            current_value = self._current_value
+            self._current_value = None
+        return current_value
+
+    def _merge_state(self, state: Union[int, float]) -> bool:
+        with self._lock:
+            if self._evicted:
+                return False
+
+            if self._current_value is None:
+                self._current_value = 0
+
+            self._current_value = self._current_value + state
+        return True
 
     def collect(
         self,
@@ -341,14 +460,177 @@ class _SumAggregation(_Aggregation[Sum]):
             )
 
 
+class _ThreadCells:
+    """Accumulator cells, one for every thread that records measurements.
+
+    Every cell is guarded by its own lock, only the collection contends with
+    the thread that owns the cell for it. The cells of threads that ended are
+    dropped once collected.
+    """
+
+    def __init__(self, create_cell: Callable[[], object]):
+        self._create_cell = create_cell
+        self._local = local()
+        self._lock = Lock()
+        self._cells = []
+
+    def get(self):
+        """Returns the cell of the current thread."""
+        try:
+            return self._local.cell
+        except AttributeError:
+            pass
+        cell = self._create_cell()
+        cell.lock = Lock()
+        cell.thread = current_thread()
+        with self._lock:
+            self._cells.append(cell)
+        self._local.cell = cell
+        return cell
+
+    def __iter__(self):
+        return iter(list(self._cells))
+
+    def drain(self, drain_cell: Callable[[object], None]) -> None:
+        """Calls ``drain_cell`` with every cell while holding its lock."""
+        for cell in self:
+            with cell.lock:
+                drain_cell(cell)
+            if not cell.thread.is_alive():
+                with self._lock:
+                    self._cells.remove(cell)
+
+    @contextmanager
+    def locked(self) -> Iterator[List[object]]:
+        """Holds the locks of all the cells, no cell can be added meanwhile."""
+        with self._lock:
+            cells = list(self._cells)
+            for cell in cells:
+                cell.lock.acquire()
+            try:
+                yield cells
+            finally:
+                for cell in cells:
+                    cell.lock.release()
+
+
+class _SumCell:
+    __slots__ = ("lock", "thread", "value")
+
+    def __init__(self):
+        self.value = None
+
+
+class _PerThreadSumAggregation(_SumAggregation):
+    """`_SumAggregation` that accumulates the measurements of every thread
+    in its own cell, the cells are added up when collected."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cells = _ThreadCells(_SumCell)
+
+    def aggregate(self, measurement: Measurement) -> bool:
+        cell = self._cells.get()
+        with cell.lock:
+            if self._evicted:
+                return False
+
+            if cell.value is None:
+                cell.value = measurement.value
+            else:
+                cell.value = cell.value + measurement.value
+        return True
+
+    def aggregate_batch(self, batch: _Batch) -> bool:
+        value = _sum(batch)
+        cell = self._cells.get()
+        with cell.lock:
+            if self._evicted:
+                return False
+
+            if cell.value is None:
+                cell.value = value
+            else:
+                cell.value = cell.value + value
+        return True
+
+    def _is_idle(self) -> bool:
+        return self._current_value is None and all(
+            cell.value is None for cell in self._cells
+        )
+
+    def _evict_if_idle(self) -> bool:
+        with self._lock, self._cells.locked():
+            if not self._evicted and self._is_idle():
+                self._evicted = True
+            return self._evicted
+
+    def _drain_cell(self, cell: _SumCell) -> None:
+        # must be called while holding self._lock
+        if cell.value is not None:
+            if self._current_value is None:
+                self._current_value = cell.value
+            else:
+                self._current_value = self._current_value + cell.value
+            cell.value = None
+
+    def _take_state(self) -> Optional[Union[int, float]]:
+        with self._lock:
+            self._cells.drain(self._drain_cell)
+        return super()._take_state()
+
+    def collect(
+        self,
+        collection_aggregation_temporality: AggregationTemporality,
+        collection_start_nano: int,
+    ) -> Optional[NumberDataPoint]:
+        with self._lock:
+            self._cells.drain(self._drain_cell)
+        return super().collect(
+            collection_aggregation_temporality, collection_start_nano
+        )
+
+
 class _LastValueAggregation(_Aggregation[Gauge]):
+    _mergeable = True
+
     def __init__(self, attributes: Attributes):
         super().__init__(attributes)
         self._value = None
 
-    def aggregate(self, measurement: Measurement):
+    def aggregate(self, measurement: Measurement) -> bool:
         with self._lock:
+            if self._evicted:
+                return False
+
             self._value = measurement.value
+        return True
+
+    def aggregate_batch(self, batch: _Batch) -> bool:
+        value = _last(batch)
+        with self._lock:
+            if self._evicted:
+                return False
+
+            self._value = value
+        return True
+
+    def _is_idle(self) -> bool:
+        return self._value is None
+
+    def _take_state(self) -> Optional[Union[int, float]]:
+        with self._lock:
+            value = self._value
+            self._value = None
+        return value
+
+    def _merge_state(self, state: Union[int, float]) -> bool:
+        with self._lock:
+            if self._evicted:
+                return False
+
+            self._value = state
+        return True
 
     def collect(
         self,
@@ -373,6 +655,8 @@ class _LastValueAggregation(_Aggregation[Gauge]):
 
 
 class _ExplicitBucketHistogramAggregation(_Aggregation[HistogramPoint]):
+    _mergeable = True
+
     def __init__(
         self,
         attributes: Attributes,
@@ -413,17 +697,82 @@ class _ExplicitBucketHistogramAggregation(_Aggregation[HistogramPoint]):
     def _get_empty_bucket_counts(self) -> List[int]:
         return [0] * (len(self._boundaries) + 1)
 
-    def aggregate(self, measurement: Measurement) -> None:
+    def aggregate(self, measurement: Measurement) -> bool:
 
         value = measurement.value
+        # the bucket is found before taking the lock
+        bucket_index = bisect_left(self._boundaries, value)
+
+        with self._lock:
+            if self._evicted:
+                return False
+
+            if self._record_min_max:
+                self._min = min(self._min, value)
+                self._max = max(self._max, value)
 
+            self._sum += value
+
+            self._bucket_counts[bucket_index] += 1
+        return True
+
+    def aggregate_batch(self, batch: _Batch) -> bool:
+        # The batch is bucketed before taking the lock.
+        batch_bucket_counts = _bucket_counts(self._boundaries, batch)
+        batch_sum = _sum(batch)
         if self._record_min_max:
-            self._min = min(self._min, value)
-            self._max = max(self._max, value)
+            batch_min, batch_max = _min_max(batch)
 
-        self._sum += value
+        with self._lock:
+            if self._evicted:
+                return False
+
+            if self._record_min_max:
+                self._min = min(self._min, batch_min)
+                self._max = max(self._max, batch_max)
 
-        self._bucket_counts[bisect_left(self._boundaries, value)] += 1
+            self._sum += batch_sum
+
+            bucket_counts = self._bucket_counts
+            for index, count in enumerate(batch_bucket_counts):
+                if count:
+                    bucket_counts[index] += count
+        return True
+
+    def _is_idle(self) -> bool:
+        return not any(self._bucket_counts)
+
+    def _take_state(self) -> Optional[tuple]:
+        # The state is a (bucket_counts, sum, min, max) tuple.
+        with self._lock:
+            if not any(self._bucket_counts):
+                return None
+
+            state = (self._bucket_counts, self._sum, self._min, self._max)
+
+            self._bucket_counts = self._get_empty_bucket_counts()
+            self._sum = 0
+            self._min = inf
+            self._max = -inf
+        return state
+
+    def _merge_state(self, state: tuple) -> bool:
+        state_bucket_counts, state_sum, state_min, state_max = state
+        with self._lock:
+            if self._evicted:
+                return False
+
+            if self._record_min_max:
+                self._min = min(self._min, state_min)
+                self._max = max(self._max, state_max)
+
+            self._sum += state_sum
+
+            bucket_counts = self._bucket_counts
+            for index, count in enumerate(state_bucket_counts):
+                if count:
+                    bucket_counts[index] += count
+        return True
 
     def collect(
         self,
@@ -514,6 +863,114 @@ class _ExplicitBucketHistogramAggregation(_Aggregation[HistogramPoint]):
 
 
 # pylint: disable=protected-access
+class _HistogramCell:
+    __slots__ = ("lock", "thread", "bucket_counts", "sum", "min", "max")
+
+
+class _PerThreadExplicitBucketHistogramAggregation(
+    _ExplicitBucketHistogramAggregation
+):
+    """`_ExplicitBucketHistogramAggregation` that accumulates the
+    measurements of every thread in its own cell, the cells are merged when
+    collected."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cells = _ThreadCells(self._create_cell)
+
+    def _create_cell(self) -> _HistogramCell:
+        cell = _HistogramCell()
+        cell.bucket_counts = self._get_empty_bucket_counts()
+        cell.sum = 0
+        cell.min = inf
+        cell.max = -inf
+        return cell
+
+    def aggregate(self, measurement: Measurement) -> bool:
+        value = measurement.value
+        cell = self._cells.get()
+        with cell.lock:
+            if self._evicted:
+                return False
+
+            if self._record_min_max:
+                if value < cell.min:
+                    cell.min = value
+                if value > cell.max:
+                    cell.max = value
+
+            cell.sum += value
+
+            cell.bucket_counts[bisect_left(self._boundaries, value)] += 1
+        return True
+
+    def aggregate_batch(self, batch: _Batch) -> bool:
+        batch_bucket_counts = _bucket_counts(self._boundaries, batch)
+        batch_sum = _sum(batch)
+        if self._record_min_max:
+            batch_min, batch_max = _min_max(batch)
+
+        cell = self._cells.get()
+        with cell.lock:
+            if self._evicted:
+                return False
+
+            if self._record_min_max:
+                cell.min = min(cell.min, batch_min)
+                cell.max = max(cell.max, batch_max)
+
+            cell.sum += batch_sum
+
+            bucket_counts = cell.bucket_counts
+            for index, count in enumerate(batch_bucket_counts):
+                if count:
+                    bucket_counts[index] += count
+        return True
+
+    def _is_idle(self) -> bool:
+        return super()._is_idle() and not any(
+            any(cell.bucket_counts) for cell in self._cells
+        )
+
+    def _evict_if_idle(self) -> bool:
+        with self._lock, self._cells.locked():
+            if not self._evicted and self._is_idle():
+                self._evicted = True
+            return self._evicted
+
+    def _drain_cell(self, cell: _HistogramCell) -> None:
+        # must be called while holding self._lock
+        if not any(cell.bucket_counts):
+            return
+        bucket_counts = self._bucket_counts
+        for index, count in enumerate(cell.bucket_counts):
+            bucket_counts[index] += count
+        self._sum += cell.sum
+        self._min = min(self._min, cell.min)
+        self._max = max(self._max, cell.max)
+
+        cell.bucket_counts = self._get_empty_bucket_counts()
+        cell.sum = 0
+        cell.min = inf
+        cell.max = -inf
+
+    def _take_state(self) -> Optional[tuple]:
+        with self._lock:
+            self._cells.drain(self._drain_cell)
+        return super()._take_state()
+
+    def collect(
+        self,
+        collection_aggregation_temporality: AggregationTemporality,
+        collection_start_nano: int,
+    ) -> Optional[HistogramDataPoint]:
+        with self._lock:
+            self._cells.drain(self._drain_cell)
+        return super().collect(
+            collection_aggregation_temporality, collection_start_nano
+        )
+
+
 class _ExponentialBucketHistogramAggregation(_Aggregation[HistogramPoint]):
     # _min_max_size and _max_max_size are the smallest and largest values
     # the max_size parameter may have, respectively.
@@ -599,113 +1056,130 @@ class _ExponentialBucketHistogramAggregation(_Aggregation[HistogramPoint]):
         self._previous_positive = None
         self._previous_negative = None
 
-    def aggregate(self, measurement: Measurement) -> None:
-        # pylint: disable=too-many-branches,too-many-statements, too-many-locals
+    def aggregate(self, measurement: Measurement) -> bool:
+        with self._lock:
+            if self._evicted:
+                return False
 
+            self._aggregate_value(measurement.value)
+        return True
+
+    def aggregate_batch(self, batch: _Batch) -> bool:
         with self._lock:
+            if self._evicted:
+                return False
 
-            value = measurement.value
+            for value in _to_list(batch):
+                self._aggregate_value(value)
+        return True
 
-            # 0. Set the following attributes:
-            # _min
-            # _max
-            # _count
-            # _zero_count
-            # _sum
-            if value < self._min:
-                self._min = value
+    def _aggregate_value(self, value: Union[int, float]) -> None:
+        # must be called while holding self._lock
+        # pylint: disable=too-many-branches,too-many-statements, too-many-locals
 
-            if value > self._max:
-                self._max = value
+        # 0. Set the following attributes:
+        # _min
+        # _max
+        # _count
+        # _zero_count
+        # _sum
+        if value < self._min:
+            self._min = value
 
-            self._count += 1
+        if value > self._max:
+            self._max = value
 
-            if value == 0:
-                self._zero_count += 1
-                # No need to do anything else if value is zero, just increment the
-                # zero count.
-                return
+        self._count += 1
 
-            self._sum += value
+        if value == 0:
+            self._zero_count += 1
+            # No need to do anything else if value is zero, just increment the
+            # zero count.
+            return
 
-            # 1. Use the positive buckets for positive values and the negative
-            # buckets for negative values.
-            if value > 0:
-                buckets = self._positive
+        self._sum += value
 
-            else:
-                # Both exponential and logarithm mappings use only positive values
-                # so the absolute value is used here.
-                value = -value
-                buckets = self._negative
+        # 1. Use the positive buckets for positive values and the negative
+        # buckets for negative values.
+        if value > 0:
+            buckets = self._positive
 
-            # 2. Compute the index for the value at the current scale.
-            index = self._mapping.map_to_index(value)
+        else:
+            # Both exponential and logarithm mappings use only positive values
+            # so the absolute value is used here.
+            value = -value
+            buckets = self._negative
 
-            # IncrementIndexBy starts here
+        # 2. Compute the index for the value at the current scale.
+        index = self._mapping.map_to_index(value)
 
-            # 3. Determine if a change of scale is needed.
-            is_rescaling_needed = False
+        # IncrementIndexBy starts here
 
-            if len(buckets) == 0:
-                buckets.index_start = index
-                buckets.index_end = index
-                buckets.index_base = index
+        # 3. Determine if a change of scale is needed.
+        is_rescaling_needed = False
 
-            elif (
-                index < buckets.index_start
-                and (buckets.index_end - index) >= self._max_size
-            ):
-                is_rescaling_needed = True
-                low = index
-                high = buckets.index_end
+        if len(buckets) == 0:
+            buckets.index_start = index
+            buckets.index_end = index
+            buckets.index_base = index
 
-            elif (
-                index > buckets.index_end
-                and (index - buckets.index_start) >= self._max_size
-            ):
-                is_rescaling_needed = True
-                low = buckets.index_start
-                high = index
+        elif (
+            index < buckets.index_start
+            and (buckets.index_end - index) >= self._max_size
+        ):
+            is_rescaling_needed = True
+            low = index
+            high = buckets.index_end
 
-            # 4. Rescale the mapping if needed.
-            if is_rescaling_needed:
+        elif (
+            index > buckets.index_end
+            and (index - buckets.index_start) >= self._max_size
+        ):
+            is_rescaling_needed = True
+            low = buckets.index_start
+            high = index
 
-                self._downscale(
-                    self._get_scale_change(low, high),
-                    self._positive,
-                    self._negative,
-                )
+        # 4. Rescale the mapping if needed.
+        if is_rescaling_needed:
 
-                index = self._mapping.map_to_index(value)
+            self._downscale(
+                self._get_scale_change(low, high),
+                self._positive,
+                self._negative,
+            )
 
-            # 5. If the index is outside
-            # [buckets.index_start, buckets.index_end] readjust the buckets
-            # boundaries or add more buckets.
-            if index < buckets.index_start:
-                span = buckets.index_end - index
+            index = self._mapping.map_to_index(value)
 
-                if span >= len(buckets.counts):
-                    buckets.grow(span + 1, self._max_size)
+        # 5. If the index is outside
+        # [buckets.index_start, buckets.index_end] readjust the buckets
+        # boundaries or add more buckets.
+        if index < buckets.index_start:
+            span = buckets.index_end - index
 
-                buckets.index_start = index
+            if span >= len(buckets.counts):
+                buckets.grow(span + 1, self._max_size)
 
-            elif index > buckets.index_end:
-                span = index - buckets.index_start
+            buckets.index_start = index
 
-                if span >= len(buckets.counts):
-                    buckets.grow(span + 1, self._max_size)
+        elif index > buckets.index_end:
+            span = index - buckets.index_start
 
-                buckets.index_end = index
+            if span >= len(buckets.counts):
+                buckets.grow(span + 1, self._max_size)
 
-            # 6. Compute the index of the bucket to be incremented.
-            bucket_index = index - buckets.index_base
+            buckets.index_end = index
 
-            if bucket_index < 0:
-                bucket_index += len(buckets.counts)
+        # 6. Compute the index of the bucket to be incremented.
+        bucket_index = index - buckets.index_base
+
+        if bucket_index < 0:
+            bucket_index += len(buckets.counts)
 
-            # 7. Increment the bucket.
-            buckets.increment_bucket(bucket_index)
+        # 7. Increment the bucket.
+        buckets.increment_bucket(bucket_index)
+
+    def _is_idle(self) -> bool:
+        return self._count == 0
 
     def collect(
         self,
@@ -759,11 +1233,11 @@ class _ExponentialBucketHistogramAggregation(_Aggregation[HistogramPoint]):
                 zero_count=current_zero_count,
                 positive=BucketsPoint(
                     offset=current_positive.offset,
-                    bucket_counts=current_positive.counts,
+                    bucket_counts=current_positive.counts.tolist(),
                 ),
                 negative=BucketsPoint(
                     offset=current_negative.offset,
-                    bucket_counts=current_negative.counts,
+                    bucket_counts=current_negative.counts.tolist(),
                 ),
                 # FIXME: Find the right value for flags
                 flags=0,
@@ -869,11 +1343,11 @@ class _ExponentialBucketHistogramAggregation(_Aggregation[HistogramPoint]):
                 zero_count=current_zero_count,
                 positive=BucketsPoint(
                     offset=current_positive.offset,
-                    bucket_counts=current_positive.counts,
+                    bucket_counts=current_positive.counts.tolist(),
                 ),
                 negative=BucketsPoint(
                     offset=current_negative.offset,
-                    bucket_counts=current_negative.counts,
+                    bucket_counts=current_negative.counts.tolist(),
                 ),
                 # FIXME: Find the right value for flags
                 flags=0,
@@ -915,7 +1389,7 @@ class _ExponentialBucketHistogramAggregation(_Aggregation[HistogramPoint]):
         return low, high
 
     def _get_low_high(self, buckets, min_scale):
-        if buckets.counts == [0]:
+        if buckets.is_empty():
             return 0, -1
 
         shift = self._mapping._scale - min_scale
@@ -965,12 +1439,7 @@ class _ExponentialBucketHistogramAggregation(_Aggregation[HistogramPoint]):
 
         current_change = current_scale - min_scale
 
-        for current_bucket_index, current_bucket in enumerate(
-            current_buckets.counts
-        ):
-
-            if current_bucket == 0:
-                continue
+        for current_bucket_index, current_bucket in current_buckets.nonzero():
 
             # Not considering the case where len(previous_buckets) == 0. This
             # would not happen because self._previous_point is only assigned to
@@ -1142,6 +1611,10 @@ class ExplicitBucketHistogramAggregation(Aggregation):
     Args:
         boundaries: Array of increasing values representing explicit bucket boundary values.
         record_min_max: Whether to record min and max.
+        per_thread: Whether every thread records into its own accumulator,
+            the accumulators are merged when collected. This removes the lock
+            contention between threads that record into the same attributes
+            at the cost of one accumulator per thread and set of attributes.
     """
 
     def __init__(
@@ -1164,9 +1637,11 @@ class ExplicitBucketHistogramAggregation(Aggregation):
             10000.0,
         ),
         record_min_max: bool = True,
+        per_thread: bool = False,
     ) -> None:
         self._boundaries = boundaries
         self._record_min_max = record_min_max
+        self._per_thread = per_thread
 
     def _create_aggregation(
         self,
@@ -1174,6 +1649,13 @@ class ExplicitBucketHistogramAggregation(Aggregation):
         attributes: Attributes,
         start_time_unix_nano: int,
     ) -> _Aggregation:
+        if self._per_thread:
+            return _PerThreadExplicitBucketHistogramAggregation(
+                attributes,
+                start_time_unix_nano,
+                self._boundaries,
+                self._record_min_max,
+            )
         return _ExplicitBucketHistogramAggregation(
             attributes,
             start_time_unix_nano,
@@ -1186,8 +1668,18 @@ class SumAggregation(Aggregation):
     """This aggregation informs the SDK to collect:
 
     - The arithmetic sum of Measurement values.
+
+    Args:
+        per_thread: Whether every thread records into its own accumulator,
+            the accumulators are added up when collected. This removes the
+            lock contention between threads that record into the same
+            attributes at the cost of one accumulator per thread and set of
+            attributes.
     """
 
+    def __init__(self, per_thread: bool = False) -> None:
+        self._per_thread = per_thread
+
     def _create_aggregation(
         self,
         instrument: Instrument,
@@ -1201,6 +1693,13 @@ class SumAggregation(Aggregation):
         elif isinstance(instrument, Asynchronous):
             temporality = AggregationTemporality.CUMULATIVE
 
+        if self._per_thread:
+            return _PerThreadSumAggregation(
+                attributes,
+                isinstance(instrument, (Counter, ObservableCounter)),
+                temporality,
+                start_time_unix_nano,
+            )
         return _SumAggregation(
             attributes,
             isinstance(instrument, (Counter, ObservableCounter)),
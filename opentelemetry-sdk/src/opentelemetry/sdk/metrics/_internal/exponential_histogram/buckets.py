@@ -12,7 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from array import array
 from math import ceil, log2
+from typing import Iterator, Tuple
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+# Signed, the counts of previous buckets are decremented when converting
+# cumulative measurements to delta.
+_COUNT_TYPECODE = "q"
+
+# Smaller backing arrays are downscaled without NumPy, converting them costs
+# more than it saves.
+_MIN_ARRAY_SIZE = 64
+
+
+def _zeros(size: int) -> array:
+    return array(_COUNT_TYPECODE, bytes(8 * size))
 
 
 class Buckets:
@@ -20,8 +39,11 @@ class Buckets:
     # No method of this class is protected by locks because instances of this
     # class are only used in methods that are protected by locks themselves.
 
+    # The counts are kept in an array of 64 bit integers, NumPy operates on
+    # it in place when installed.
+
     def __init__(self):
-        self._counts = [0]
+        self._counts = _zeros(1)
 
         # The term index refers to the number of the exponential histogram bucket
         # used to determine its boundaries. The lower boundary of a bucket is
@@ -93,7 +115,7 @@ class Buckets:
 
         new_positive_limit = new_size - bias
 
-        tmp = [0] * new_size
+        tmp = _zeros(new_size)
         tmp[new_positive_limit:] = self._counts[old_positive_limit:]
         tmp[0:old_positive_limit] = self._counts[0:old_positive_limit]
         self._counts = tmp
@@ -143,30 +165,35 @@ class Buckets:
             # [3, 4, 0, 1, 2] This is a rotation of the backing array.
 
         size = 1 + self.__index_end - self.__index_start
-        each = 1 << amount
-        inpos = 0
-        outpos = 0
-
-        pos = self.__index_start
 
-        while pos <= self.__index_end:
-            mod = pos % each
-            if mod < 0:
-                mod += each
-
-            index = mod
-
-            while index < each and inpos < size:
-
-                if outpos != inpos:
-                    self._counts[outpos] += self._counts[inpos]
-                    self._counts[inpos] = 0
-
-                inpos += 1
-                pos += 1
-                index += 1
-
-            outpos += 1
+        # The count at position inpos, for the index
+        # self.__index_start + inpos, is added to the count at the position
+        # of the index shifted by amount.
+        if numpy is not None and size >= _MIN_ARRAY_SIZE:
+            counts = numpy.frombuffer(self._counts, dtype=numpy.int64)
+            outpos = (
+                numpy.arange(
+                    self.__index_start,
+                    self.__index_start + size,
+                    dtype=numpy.int64,
+                )
+                >> amount
+            ) - (self.__index_start >> amount)
+            # outpos is sorted, reduceat adds up every run of equal values
+            starts = numpy.flatnonzero(numpy.diff(outpos, prepend=-1))
+            sums = numpy.add.reduceat(counts[:size], starts)
+            counts[:size] = 0
+            counts[: len(sums)] = sums
+        else:
+            counts = self._counts
+            start_outpos = self.__index_start >> amount
+            for inpos in range(size):
+                outpos = (
+                    (self.__index_start + inpos) >> amount
+                ) - start_outpos
+                if outpos != inpos and counts[inpos]:
+                    counts[outpos] += counts[inpos]
+                    counts[inpos] = 0
 
         self.__index_start >>= amount
         self.__index_end >>= amount
@@ -174,3 +201,21 @@ class Buckets:
 
     def increment_bucket(self, bucket_index: int, increment: int = 1) -> None:
         self._counts[bucket_index] += increment
+
+    def is_empty(self) -> bool:
+        """Returns whether nothing was ever counted in the buckets, like for
+        new buckets."""
+        return len(self._counts) == 1 and self._counts[0] == 0
+
+    def nonzero(self) -> Iterator[Tuple[int, int]]:
+        """Returns the positions in the backing array that have a count,
+        with their count."""
+        if numpy is not None and len(self._counts) >= _MIN_ARRAY_SIZE:
+            counts = numpy.frombuffer(self._counts, dtype=numpy.int64)
+            positions = numpy.flatnonzero(counts)
+            return zip(positions.tolist(), counts[positions].tolist())
+        return (
+            (position, count)
+            for position, count in enumerate(self._counts)
+            if count
+        )
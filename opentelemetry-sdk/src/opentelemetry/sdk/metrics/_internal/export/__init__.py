@@ -15,13 +15,14 @@
 import math
 import os
 from abc import ABC, abstractmethod
+from dataclasses import replace
 from enum import Enum
 from logging import getLogger
 from os import environ, linesep
 from sys import stdout
 from threading import Event, Lock, RLock, Thread
 from time import time_ns
-from typing import IO, Callable, Dict, Iterable, Optional
+from typing import IO, Callable, Dict, Iterable, List, Optional, Tuple
 
 from typing_extensions import final
 
@@ -56,7 +57,14 @@ from opentelemetry.sdk.metrics._internal.instrument import (
     _ObservableUpDownCounter,
     _UpDownCounter,
 )
-from opentelemetry.sdk.metrics._internal.point import MetricsData
+from opentelemetry.sdk.metrics._internal.point import (
+    DataPointT,
+    Metric,
+    MetricsData,
+    ResourceMetrics,
+    ScopeMetrics,
+)
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
 from opentelemetry.util._once import Once
 
 _logger = getLogger(__name__)
@@ -200,6 +208,12 @@ class MetricReader(ABC):
             default aggregations. The aggregation defined here will be
             overridden by an aggregation defined by a view that is not
             `DefaultAggregation`.
+        incremental_collection: Only collect the cumulative data points of
+            the attributes that received measurements since the previous
+            collection, the cost of a collection then depends on the active
+            attributes instead of all of them. The reader must keep the data
+            points of the other attributes, `IncrementalMetricsState` does
+            that.
 
     .. document protected _receive_metrics which is a intended to be overridden by subclass
     .. automethod:: _receive_metrics
@@ -211,6 +225,7 @@ class MetricReader(ABC):
         preferred_aggregation: Dict[
             type, "opentelemetry.sdk.metrics.view.Aggregation"
         ] = None,
+        incremental_collection: bool = False,
     ) -> None:
         self._collect: Callable[
             [
@@ -267,6 +282,7 @@ class MetricReader(ABC):
                     raise Exception(f"Invalid instrument class found {typ}")
 
         self._preferred_temporality = preferred_temporality
+        self._incremental_collection = incremental_collection
         self._instrument_class_aggregation = {
             _Counter: DefaultAggregation(),
             _UpDownCounter: DefaultAggregation(),
@@ -384,10 +400,12 @@ class InMemoryMetricReader(MetricReader):
         preferred_aggregation: Dict[
             type, "opentelemetry.sdk.metrics.view.Aggregation"
         ] = None,
+        incremental_collection: bool = False,
     ) -> None:
         super().__init__(
             preferred_temporality=preferred_temporality,
             preferred_aggregation=preferred_aggregation,
+            incremental_collection=incremental_collection,
         )
         self._lock = RLock()
         self._metrics_data: (
@@ -417,6 +435,136 @@ class InMemoryMetricReader(MetricReader):
         pass
 
 
+class IncrementalMetricsState:
+    """The latest data point of every cumulative series collected by a
+    reader with ``incremental_collection`` set.
+
+    Such a reader only receives the cumulative data points that changed since
+    its previous collection. `update` merges them with the data points
+    received before, the data points of the unchanged series are reused with
+    the time of the collection.
+
+    Args:
+        series_ttl_millis: The ``series_ttl_millis`` of the views the metrics
+            are collected with. The views evict the series that receive no
+            measurements for that long, their data points are dropped from
+            the state too. If `None`, data points are kept forever.
+    """
+
+    def __init__(self, series_ttl_millis: Optional[float] = None) -> None:
+        self._lock = Lock()
+        if series_ttl_millis is None:
+            self._series_ttl_nanos = None
+        else:
+            self._series_ttl_nanos = series_ttl_millis * 1e6
+        self._resource_metrics: Optional[ResourceMetrics] = None
+        # metric name and data points by attributes, for every scope
+        self._scope_metrics: Dict[
+            InstrumentationScope,
+            Dict[str, Tuple[Metric, Dict[frozenset, DataPointT]]],
+        ] = {}
+
+    def update(self, metrics_data: MetricsData) -> MetricsData:
+        """Merges ``metrics_data`` into the state, returns the latest data
+        point of every series.
+
+        The data points of metrics that are not cumulative are returned only
+        this time, they are not kept.
+        """
+        with self._lock:
+            collection_time_unix_nano = None
+            not_kept: Dict[InstrumentationScope, List[Metric]] = {}
+            for resource_metrics in metrics_data.resource_metrics:
+                self._resource_metrics = resource_metrics
+                for scope_metrics in resource_metrics.scope_metrics:
+                    metrics = self._scope_metrics.setdefault(
+                        scope_metrics.scope, {}
+                    )
+                    for metric in scope_metrics.metrics:
+                        # every data point of a collection has its time
+                        for data_point in metric.data.data_points:
+                            collection_time_unix_nano = max(
+                                collection_time_unix_nano or 0,
+                                data_point.time_unix_nano,
+                            )
+                        if (
+                            getattr(
+                                metric.data, "aggregation_temporality", None
+                            )
+                            is not AggregationTemporality.CUMULATIVE
+                        ):
+                            not_kept.setdefault(
+                                scope_metrics.scope, []
+                            ).append(metric)
+                            continue
+                        data_points = metrics.get(metric.name, (None, {}))[1]
+                        for data_point in metric.data.data_points:
+                            data_points[
+                                frozenset(data_point.attributes.items())
+                            ] = data_point
+                        metrics[metric.name] = (metric, data_points)
+
+            if self._resource_metrics is None:
+                return metrics_data
+
+            if collection_time_unix_nano is None:
+                collection_time_unix_nano = time_ns()
+            if self._series_ttl_nanos is not None:
+                self._drop_evicted(collection_time_unix_nano)
+
+            scope_metrics = []
+            for scope, metrics in self._scope_metrics.items():
+                scope_metric_list = [
+                    replace(
+                        metric,
+                        data=replace(
+                            metric.data,
+                            data_points=[
+                                replace(
+                                    data_point,
+                                    time_unix_nano=collection_time_unix_nano,
+                                )
+                                for data_point in data_points.values()
+                            ],
+                        ),
+                    )
+                    for metric, data_points in metrics.values()
+                ]
+                scope_metric_list.extend(not_kept.get(scope, ()))
+                if scope_metric_list:
+                    scope_metrics.append(
+                        ScopeMetrics(
+                            scope=scope,
+                            metrics=scope_metric_list,
+                            schema_url=scope.schema_url,
+                        )
+                    )
+
+            return MetricsData(
+                resource_metrics=[
+                    replace(
+                        self._resource_metrics, scope_metrics=scope_metrics
+                    )
+                ]
+            )
+
+    def _drop_evicted(self, collection_time_unix_nano: int) -> None:
+        # must be called while holding self._lock
+        for metrics in self._scope_metrics.values():
+            for metric_name, (metric, data_points) in list(metrics.items()):
+                # The time of a kept data point is the time of the last
+                # collection its series changed in, the view evicts the
+                # series on the same terms.
+                for attributes_key, data_point in list(data_points.items()):
+                    if (
+                        collection_time_unix_nano - data_point.time_unix_nano
+                        >= self._series_ttl_nanos
+                    ):
+                        del data_points[attributes_key]
+                if not data_points:
+                    del metrics[metric_name]
+
+
 class PeriodicExportingMetricReader(MetricReader):
     """`PeriodicExportingMetricReader` is an implementation of `MetricReader`
     that collects metrics based on a user-configurable time interval, and passes the
@@ -29,8 +29,10 @@ from opentelemetry.metrics import (
 )
 from opentelemetry.metrics import UpDownCounter as APIUpDownCounter
 from opentelemetry.metrics._internal.instrument import CallbackOptions
+from opentelemetry.sdk.metrics._internal._batch import _Batch, _validate
 from opentelemetry.sdk.metrics._internal.measurement import Measurement
 from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+from opentelemetry.util.types import Attributes
 
 _logger = getLogger(__name__)
 
@@ -70,6 +72,44 @@ class _Synchronous:
         super().__init__(name, unit=unit, description=description)
 
 
+class _BoundInstrument:
+    """Synchronous instrument bound to a fixed set of attributes.
+
+    The aggregations that the measurements are recorded into are resolved
+    once, when the instrument is bound, so that recording a measurement does
+    not need to look them up again for every reader and view. They are only
+    resolved again when an aggregation is evicted after being idle.
+    """
+
+    def __init__(self, instrument: _Synchronous, attributes: Attributes):
+        self._instrument = instrument
+        self._attributes = dict(attributes) if attributes else None
+        self._aggregations = self._get_aggregations()
+
+    def _get_aggregations(self):
+        # pylint: disable=protected-access
+        return self._instrument._measurement_consumer.get_aggregations(
+            self._instrument, self._attributes
+        )
+
+    def _aggregate(self, amount: Union[int, float]) -> None:
+        measurement = Measurement(amount, self._instrument, self._attributes)
+        for index, aggregation in enumerate(self._aggregations):
+            while not aggregation.aggregate(measurement):
+                # The aggregations are returned in the same order every time,
+                # the one at index replaces the evicted aggregation.
+                self._aggregations = self._get_aggregations()
+                aggregation = self._aggregations[index]
+
+    def _aggregate_batch(self, batch: _Batch) -> None:
+        if not len(batch):  # pylint: disable=use-implicit-booleaness-not-len
+            return
+        for index, aggregation in enumerate(self._aggregations):
+            while not aggregation.aggregate_batch(batch):
+                self._aggregations = self._get_aggregations()
+                aggregation = self._aggregations[index]
+
+
 class _Asynchronous:
     def __init__(
         self,
@@ -128,17 +168,26 @@ class _Asynchronous:
         self, callback_options: CallbackOptions
     ) -> Iterable[Measurement]:
         for callback in self._callbacks:
-            try:
-                for api_measurement in callback(callback_options):
-                    yield Measurement(
+            yield from self._run_callback(callback, callback_options)
+
+    def _run_callback(
+        self, callback: CallbackT, callback_options: CallbackOptions
+    ) -> List[Measurement]:
+        """Runs one of the callbacks of the instrument and returns its
+        measurements."""
+        measurements = []
+        try:
+            for api_measurement in callback(callback_options):
+                measurements.append(
+                    Measurement(
                         api_measurement.value,
                         instrument=self,
                         attributes=api_measurement.attributes,
                     )
-            except Exception:  # pylint: disable=broad-except
-                _logger.exception(
-                    "Callback failed for instrument %s.", self.name
                 )
+        except Exception:  # pylint: disable=broad-except
+            _logger.exception("Callback failed for instrument %s.", self.name)
+        return measurements
 
 
 class Counter(_Synchronous, APICounter):
@@ -159,6 +208,46 @@ class Counter(_Synchronous, APICounter):
             Measurement(amount, self, attributes)
         )
 
+    def bind(self, attributes: Dict[str, str] = None) -> "BoundCounter":
+        """Returns this counter bound to the given attributes.
+
+        Use it to add to the same attributes repeatedly, the bound counter
+        skips the lookups that `add` does on every call.
+        """
+        return BoundCounter(self, attributes)
+
+    def add_batch(
+        self,
+        amounts: Iterable[Union[int, float]],
+        attributes: Dict[str, str] = None,
+    ):
+        """Adds every amount in ``amounts`` with the same attributes.
+
+        The amounts can be any sequence or a NumPy array, they are aggregated
+        in a single step instead of one `add` call each.
+        """
+        self.bind(attributes).add_batch(amounts)
+
+
+class BoundCounter(_BoundInstrument):
+    def add(self, amount: Union[int, float]):
+        if amount < 0:
+            _logger.warning(
+                "Add amount must be non-negative on Counter %s.",
+                self._instrument.name,
+            )
+            return
+        self._aggregate(amount)
+
+    def add_batch(self, amounts: Iterable[Union[int, float]]):
+        batch, dropped = _validate(amounts, non_negative=True)
+        if dropped:
+            _logger.warning(
+                "Add amount must be non-negative and not NaN on Counter %s.",
+                self._instrument.name,
+            )
+        self._aggregate_batch(batch)
+
 
 class UpDownCounter(_Synchronous, APIUpDownCounter):
     def __new__(cls, *args, **kwargs):
@@ -173,6 +262,40 @@ class UpDownCounter(_Synchronous, APIUpDownCounter):
             Measurement(amount, self, attributes)
         )
 
+    def bind(self, attributes: Dict[str, str] = None) -> "BoundUpDownCounter":
+        """Returns this up down counter bound to the given attributes.
+
+        Use it to add to the same attributes repeatedly, the bound up down
+        counter skips the lookups that `add` does on every call.
+        """
+        return BoundUpDownCounter(self, attributes)
+
+    def add_batch(
+        self,
+        amounts: Iterable[Union[int, float]],
+        attributes: Dict[str, str] = None,
+    ):
+        """Adds every amount in ``amounts`` with the same attributes.
+
+        The amounts can be any sequence or a NumPy array, they are aggregated
+        in a single step instead of one `add` call each.
+        """
+        self.bind(attributes).add_batch(amounts)
+
+
+class BoundUpDownCounter(_BoundInstrument):
+    def add(self, amount: Union[int, float]):
+        self._aggregate(amount)
+
+    def add_batch(self, amounts: Iterable[Union[int, float]]):
+        batch, dropped = _validate(amounts)
+        if dropped:
+            _logger.warning(
+                "Add amount must not be NaN on UpDownCounter %s.",
+                self._instrument.name,
+            )
+        self._aggregate_batch(batch)
+
 
 class ObservableCounter(_Asynchronous, APIObservableCounter):
     def __new__(cls, *args, **kwargs):
@@ -211,6 +334,47 @@ class Histogram(_Synchronous, APIHistogram):
             Measurement(amount, self, attributes)
         )
 
+    def bind(self, attributes: Dict[str, str] = None) -> "BoundHistogram":
+        """Returns this histogram bound to the given attributes.
+
+        Use it to record with the same attributes repeatedly, the bound
+        histogram skips the lookups that `record` does on every call.
+        """
+        return BoundHistogram(self, attributes)
+
+    def record_batch(
+        self,
+        amounts: Iterable[Union[int, float]],
+        attributes: Dict[str, str] = None,
+    ):
+        """Records every amount in ``amounts`` with the same attributes.
+
+        The amounts can be any sequence or a NumPy array, they are aggregated
+        in a single step instead of one `record` call each.
+        """
+        self.bind(attributes).record_batch(amounts)
+
+
+class BoundHistogram(_BoundInstrument):
+    def record(self, amount: Union[int, float]):
+        if amount < 0:
+            _logger.warning(
+                "Record amount must be non-negative on Histogram %s.",
+                self._instrument.name,
+            )
+            return
+        self._aggregate(amount)
+
+    def record_batch(self, amounts: Iterable[Union[int, float]]):
+        batch, dropped = _validate(amounts, non_negative=True)
+        if dropped:
+            _logger.warning(
+                "Record amount must be non-negative and not NaN on "
+                "Histogram %s.",
+                self._instrument.name,
+            )
+        self._aggregate_batch(batch)
+
 
 class ObservableGauge(_Asynchronous, APIObservableGauge):
     def __new__(cls, *args, **kwargs):
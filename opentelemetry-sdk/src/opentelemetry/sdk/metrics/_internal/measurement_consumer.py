@@ -14,22 +14,37 @@
 
 # pylint: disable=unused-import
 
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextvars import copy_context
+from logging import getLogger
 from threading import Lock
-from time import time_ns
-from typing import Iterable, List, Mapping, Optional
+from time import perf_counter_ns, time_ns
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 # This kind of import is needed to avoid Sphinx errors.
 import opentelemetry.sdk.metrics
+import opentelemetry.sdk.metrics._internal.aggregation
 import opentelemetry.sdk.metrics._internal.instrument
 import opentelemetry.sdk.metrics._internal.sdk_configuration
+from opentelemetry.metrics import CallbackT
 from opentelemetry.metrics._internal.instrument import CallbackOptions
+from opentelemetry.sdk.environment_variables import (
+    OTEL_PYTHON_METRICS_CALLBACK_MAX_WORKERS,
+    OTEL_PYTHON_METRICS_CALLBACK_TIMEOUT,
+)
 from opentelemetry.sdk.metrics._internal.exceptions import MetricsTimeoutError
 from opentelemetry.sdk.metrics._internal.measurement import Measurement
 from opentelemetry.sdk.metrics._internal.metric_reader_storage import (
     MetricReaderStorage,
+    _SharedMetricReaderStorage,
 )
 from opentelemetry.sdk.metrics._internal.point import Metric
+from opentelemetry.util.types import Attributes
+
+_logger = getLogger(__name__)
 
 
 class MeasurementConsumer(ABC):
@@ -37,6 +52,16 @@ class MeasurementConsumer(ABC):
     def consume_measurement(self, measurement: Measurement) -> None:
         pass
 
+    @abstractmethod
+    def get_aggregations(
+        self,
+        instrument: (
+            "opentelemetry.sdk.metrics._internal.instrument._Synchronous"
+        ),
+        attributes: Attributes,
+    ) -> List["opentelemetry.sdk.metrics._internal.aggregation._Aggregation"]:
+        pass
+
     @abstractmethod
     def register_asynchronous_instrument(
         self,
@@ -55,6 +80,68 @@ class MeasurementConsumer(ABC):
         pass
 
 
+def _get_positive_int_env(env_var: str) -> Optional[int]:
+    value = os.environ.get(env_var)
+    if value is None:
+        return None
+    try:
+        value = int(value)
+    except ValueError:
+        value = 0
+    if value < 1:
+        _logger.warning("Found invalid value for %s, ignoring it", env_var)
+        return None
+    return value
+
+
+def _callback_name(callback: CallbackT) -> str:
+    return getattr(callback, "__qualname__", repr(callback))
+
+
+def _run_timed(
+    async_instrument: (
+        "opentelemetry.sdk.metrics._internal.instrument._Asynchronous"
+    ),
+    callback: CallbackT,
+    callback_options: CallbackOptions,
+) -> Tuple[List[Measurement], int]:
+    start_ns = perf_counter_ns()
+    # pylint: disable=protected-access
+    measurements = async_instrument._run_callback(callback, callback_options)
+    return measurements, perf_counter_ns() - start_ns
+
+
+def _have_same_aggregations(
+    reader: "opentelemetry.sdk.metrics.MetricReader",
+    other_reader: "opentelemetry.sdk.metrics.MetricReader",
+) -> bool:
+    # pylint: disable=protected-access
+    aggregations = reader._instrument_class_aggregation
+    other_aggregations = other_reader._instrument_class_aggregation
+    if aggregations.keys() != other_aggregations.keys():
+        return False
+    return all(
+        type(aggregation) is type(other_aggregations[instrument_class])
+        and vars(aggregation) == vars(other_aggregations[instrument_class])
+        for instrument_class, aggregation in aggregations.items()
+    )
+
+
+def _group_readers(
+    metric_readers: Iterable["opentelemetry.sdk.metrics.MetricReader"],
+) -> List[List["opentelemetry.sdk.metrics.MetricReader"]]:
+    """Groups the readers that use the same aggregations."""
+    groups = []
+    for reader in metric_readers:
+        for group in groups:
+            if _have_same_aggregations(group[0], reader):
+                group.append(reader)
+                break
+        else:
+            groups.append([reader])
+    return groups
+
+
 class SynchronousMeasurementConsumer(MeasurementConsumer):
     def __init__(
         self,
@@ -70,16 +157,71 @@ class SynchronousMeasurementConsumer(MeasurementConsumer):
                 sdk_config,
                 reader._instrument_class_temporality,
                 reader._instrument_class_aggregation,
+                reader._incremental_collection,
             )
             for reader in sdk_config.metric_readers
         }
+        # Readers that use the same aggregations share the aggregation of the
+        # measurements of synchronous instruments, a measurement is then
+        # aggregated once no matter how many of them there are.
+        self._storages: List[
+            Union[MetricReaderStorage, _SharedMetricReaderStorage]
+        ] = []
+        self._shared_storages: Dict[
+            "opentelemetry.sdk.metrics.MetricReader",
+            _SharedMetricReaderStorage,
+        ] = {}
+        for readers in _group_readers(sdk_config.metric_readers):
+            if len(readers) == 1:
+                self._storages.append(self._reader_storages[readers[0]])
+                continue
+            shared_storage = _SharedMetricReaderStorage(
+                sdk_config,
+                readers[0]._instrument_class_aggregation,
+                [self._reader_storages[reader] for reader in readers],
+            )
+            self._storages.append(shared_storage)
+            for reader in readers:
+                self._shared_storages[reader] = shared_storage
         self._async_instruments: List[
             "opentelemetry.sdk.metrics._internal.instrument._Asynchronous"
         ] = []
+        self._callback_max_workers = _get_positive_int_env(
+            OTEL_PYTHON_METRICS_CALLBACK_MAX_WORKERS
+        )
+        self._callback_timeout_millis = _get_positive_int_env(
+            OTEL_PYTHON_METRICS_CALLBACK_TIMEOUT
+        )
+        # Callbacks run in the collecting thread unless a number of workers
+        # is set, the executor is then created on the first collection that
+        # runs callbacks.
+        self._callback_executor: Optional[ThreadPoolExecutor] = None
+        # the last run of every callback, keyed by instrument and callback
+        self._callback_runs: Dict[tuple, Future] = {}
+        if self._callback_max_workers is not None and hasattr(
+            os, "register_at_fork"
+        ):
+            os.register_at_fork(
+                after_in_child=self._at_fork_reinit
+            )  # pylint: disable=protected-access
 
     def consume_measurement(self, measurement: Measurement) -> None:
-        for reader_storage in self._reader_storages.values():
-            reader_storage.consume_measurement(measurement)
+        for storage in self._storages:
+            storage.consume_measurement(measurement)
+
+    def get_aggregations(
+        self,
+        instrument: (
+            "opentelemetry.sdk.metrics._internal.instrument._Synchronous"
+        ),
+        attributes: Attributes,
+    ) -> List["opentelemetry.sdk.metrics._internal.aggregation._Aggregation"]:
+        aggregations = []
+        for storage in self._storages:
+            aggregations.extend(
+                storage.get_aggregations(instrument, attributes)
+            )
+        return aggregations
 
     def register_asynchronous_instrument(
         self,
@@ -98,31 +240,174 @@ class SynchronousMeasurementConsumer(MeasurementConsumer):
 
         with self._lock:
             metric_reader_storage = self._reader_storages[metric_reader]
-            # for now, just use the defaults
-            callback_options = CallbackOptions()
+            shared_storage = self._shared_storages.get(metric_reader)
+            if shared_storage is not None:
+                shared_storage.drain()
             deadline_ns = time_ns() + timeout_millis * 10**6
 
-            default_timeout_millis = 10000 * 10**6
+            if self._callback_max_workers is None:
+                callback_measurements = self._run_callbacks_serially(
+                    deadline_ns
+                )
+            else:
+                callback_measurements = self._run_callbacks(deadline_ns)
+            for measurements in callback_measurements:
+                for measurement in measurements:
+                    metric_reader_storage.consume_measurement(measurement)
 
-            for async_instrument in self._async_instruments:
+            result = self._reader_storages[metric_reader].collect()
 
-                remaining_time = deadline_ns - time_ns()
+        return result
 
-                if remaining_time < default_timeout_millis:
+    def _get_callback_options(
+        self, deadline_ns: int
+    ) -> Tuple[int, CallbackOptions]:
+        """Returns the deadline of a callback and the options it is run
+        with."""
+        callback_deadline_ns = deadline_ns
+        if self._callback_timeout_millis is not None:
+            callback_deadline_ns = min(
+                deadline_ns,
+                time_ns() + self._callback_timeout_millis * 10**6,
+            )
+        return callback_deadline_ns, CallbackOptions(
+            timeout_millis=max(callback_deadline_ns - time_ns(), 0) / 10**6
+        )
 
-                    callback_options = CallbackOptions(
-                        timeout_millis=remaining_time
-                    )
+    def _run_callbacks_serially(
+        self, deadline_ns: int
+    ) -> List[List[Measurement]]:
+        """Runs the callbacks of the asynchronous instruments one after the
+        other in the collecting thread.
 
-                measurements = async_instrument.callback(callback_options)
+        Raises ``MetricsTimeoutError`` when they do not finish before the
+        deadline of the collection.
+        """
+        # must be called while holding self._lock
+        callback_measurements = []
+        for async_instrument in self._async_instruments:
+            # pylint: disable=protected-access
+            for callback in async_instrument._callbacks:
+                _, callback_options = self._get_callback_options(deadline_ns)
+                measurements, duration_ns = _run_timed(
+                    async_instrument, callback, callback_options
+                )
+                _logger.debug(
+                    "Callback %s of instrument %s took %.3f ms.",
+                    _callback_name(callback),
+                    async_instrument.name,
+                    duration_ns / 10**6,
+                )
                 if time_ns() >= deadline_ns:
                     raise MetricsTimeoutError(
                         "Timed out while executing callback"
                     )
+                callback_measurements.append(measurements)
+        return callback_measurements
 
-                for measurement in measurements:
-                    metric_reader_storage.consume_measurement(measurement)
+    def _run_callbacks(self, deadline_ns: int) -> List[List[Measurement]]:
+        """Runs the callbacks of the asynchronous instruments concurrently.
 
-            result = self._reader_storages[metric_reader].collect()
+        Returns the measurements of every callback that finishes before its
+        deadline. The callbacks that do not are skipped, and are not run
+        again until their previous run finishes.
+        """
+        # must be called while holding self._lock
+        runs = []
+        for async_instrument in self._async_instruments:
+            # pylint: disable=protected-access
+            for callback in async_instrument._callbacks:
+                run_key = (async_instrument, callback)
+                previous_run = self._callback_runs.get(run_key)
+                if previous_run is not None and not previous_run.done():
+                    _logger.warning(
+                        "Skipping callback %s of instrument %s, its run "
+                        "from a previous collection has not finished.",
+                        _callback_name(callback),
+                        async_instrument.name,
+                    )
+                    continue
 
-        return result
+                (
+                    callback_deadline_ns,
+                    callback_options,
+                ) = self._get_callback_options(deadline_ns)
+
+                run = self._submit_callback(
+                    async_instrument, callback, callback_options
+                )
+                self._callback_runs[run_key] = run
+                runs.append(
+                    (async_instrument, callback, run, callback_deadline_ns)
+                )
+
+        callback_measurements = []
+        for async_instrument, callback, run, callback_deadline_ns in runs:
+            try:
+                measurements, duration_ns = run.result(
+                    timeout=max(callback_deadline_ns - time_ns(), 0) / 10**9
+                )
+            except FutureTimeoutError:
+                _logger.warning(
+                    "Callback %s of instrument %s did not finish before its "
+                    "deadline, its measurements are skipped.",
+                    _callback_name(callback),
+                    async_instrument.name,
+                )
+                continue
+            _logger.debug(
+                "Callback %s of instrument %s took %.3f ms.",
+                _callback_name(callback),
+                async_instrument.name,
+                duration_ns / 10**6,
+            )
+            callback_measurements.append(measurements)
+        return callback_measurements
+
+    def _submit_callback(
+        self,
+        async_instrument: (
+            "opentelemetry.sdk.metrics._internal.instrument._Asynchronous"
+        ),
+        callback: CallbackT,
+        callback_options: CallbackOptions,
+    ) -> Future:
+        try:
+            # The callback runs in the context of the collection.
+            return self._get_callback_executor().submit(
+                copy_context().run,
+                _run_timed,
+                async_instrument,
+                callback,
+                callback_options,
+            )
+        except RuntimeError:
+            # The executor does not take callbacks anymore once the
+            # interpreter is shutting down, the collections that happen
+            # meanwhile run them in the collecting thread.
+            run = Future()
+            run.set_result(
+                _run_timed(async_instrument, callback, callback_options)
+            )
+            return run
+
+    def _get_callback_executor(self) -> ThreadPoolExecutor:
+        if self._callback_executor is None:
+            self._callback_executor = ThreadPoolExecutor(
+                max_workers=self._callback_max_workers,
+                thread_name_prefix="OtelMetricsCallback",
+            )
+        return self._callback_executor
+
+    def _at_fork_reinit(self) -> None:
+        # The threads of the executor do not exist in the child process.
+        self._callback_executor = None
+        self._callback_runs = {}
+
+    def shutdown(self) -> None:
+        """Stops the threads that run the callbacks, without waiting for the
+        callbacks that are still running."""
+        with self._lock:
+            if self._callback_executor is not None:
+                self._callback_executor.shutdown(wait=False)
+                self._callback_executor = None
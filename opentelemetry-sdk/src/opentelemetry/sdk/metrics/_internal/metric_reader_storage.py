@@ -15,7 +15,7 @@
 from logging import getLogger
 from threading import RLock
 from time import time_ns
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from opentelemetry.metrics import (
     Asynchronous,
@@ -29,6 +29,7 @@ from opentelemetry.sdk.metrics._internal._view_instrument_match import (
 from opentelemetry.sdk.metrics._internal.aggregation import (
     Aggregation,
     ExplicitBucketHistogramAggregation,
+    _Aggregation,
     _DropAggregation,
     _ExplicitBucketHistogramAggregation,
     _ExponentialBucketHistogramAggregation,
@@ -52,6 +53,7 @@ from opentelemetry.sdk.metrics._internal.sdk_configuration import (
 )
 from opentelemetry.sdk.metrics._internal.view import View
 from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+from opentelemetry.util.types import Attributes
 
 _logger = getLogger(__name__)
 
@@ -66,6 +68,7 @@ class MetricReaderStorage:
         sdk_config: SdkConfiguration,
         instrument_class_temporality: Dict[type, AggregationTemporality],
         instrument_class_aggregation: Dict[type, Aggregation],
+        incremental_collection: bool = False,
     ) -> None:
         self._lock = RLock()
         self._sdk_config = sdk_config
@@ -74,6 +77,8 @@ class MetricReaderStorage:
         ] = {}
         self._instrument_class_temporality = instrument_class_temporality
         self._instrument_class_aggregation = instrument_class_aggregation
+        # only collect the cumulative data points that changed
+        self._incremental_collection = incremental_collection
 
     def _get_or_init_view_instrument_match(
         self, instrument: Instrument
@@ -119,132 +124,150 @@ class MetricReaderStorage:
         ):
             view_instrument_match.consume_measurement(measurement)
 
+    def get_aggregations(
+        self, instrument: Instrument, attributes: Attributes
+    ) -> List[_Aggregation]:
+        """Returns the aggregations that measurements of the instrument with
+        the given attributes are recorded into, one per matching view."""
+        return [
+            view_instrument_match.get_aggregation(attributes)
+            for view_instrument_match in (
+                self._get_or_init_view_instrument_match(instrument)
+            )
+        ]
+
     def collect(self) -> Optional[MetricsData]:
         # Use a list instead of yielding to prevent a slow reader from holding
         # SDK locks
 
-        # While holding the lock, new _ViewInstrumentMatch can't be added from
-        # another thread (so we are sure we collect all existing view).
-        # However, instruments can still send measurements that will make it
-        # into the individual aggregations; collection will acquire those locks
-        # iteratively to keep locking as fine-grained as possible. One side
-        # effect is that end times can be slightly skewed among the metric
-        # streams produced by the SDK, but we still align the output timestamps
-        # for a single instrument.
+        # The lock is only held to copy the view instrument matches, so that
+        # instruments created meanwhile do not wait for the whole collection;
+        # they are part of the next one. Each _ViewInstrumentMatch also holds
+        # its own lock only to copy its aggregations, and every aggregation
+        # swaps its state out under its own lock, so measurements keep being
+        # recorded, even for new attributes, while the collection runs. One
+        # side effect is that end times can be slightly skewed among the
+        # metric streams produced by the SDK, but we still align the output
+        # timestamps for a single instrument.
 
         collection_start_nanos = time_ns()
 
         with self._lock:
+            instrument_view_instrument_matches = list(
+                self._instrument_view_instrument_matches.items()
+            )
 
-            instrumentation_scope_scope_metrics: (
-                Dict[InstrumentationScope, ScopeMetrics]
-            ) = {}
-
-            for (
-                instrument,
-                view_instrument_matches,
-            ) in self._instrument_view_instrument_matches.items():
-                aggregation_temporality = self._instrument_class_temporality[
-                    instrument.__class__
-                ]
+        instrumentation_scope_scope_metrics: (
+            Dict[InstrumentationScope, ScopeMetrics]
+        ) = {}
 
-                metrics: List[Metric] = []
+        for (
+            instrument,
+            view_instrument_matches,
+        ) in instrument_view_instrument_matches:
+            aggregation_temporality = self._instrument_class_temporality[
+                instrument.__class__
+            ]
 
-                for view_instrument_match in view_instrument_matches:
+            metrics: List[Metric] = []
 
-                    data_points = view_instrument_match.collect(
-                        aggregation_temporality, collection_start_nanos
-                    )
+            for view_instrument_match in view_instrument_matches:
 
-                    if data_points is None:
-                        continue
+                data_points = view_instrument_match.collect(
+                    aggregation_temporality,
+                    collection_start_nanos,
+                    self._incremental_collection,
+                )
 
-                    if isinstance(
-                        # pylint: disable=protected-access
-                        view_instrument_match._aggregation,
-                        _SumAggregation,
-                    ):
-                        data = Sum(
-                            aggregation_temporality=aggregation_temporality,
-                            data_points=data_points,
-                            is_monotonic=isinstance(
-                                instrument, (Counter, ObservableCounter)
-                            ),
-                        )
-                    elif isinstance(
-                        # pylint: disable=protected-access
-                        view_instrument_match._aggregation,
-                        _LastValueAggregation,
-                    ):
-                        data = Gauge(data_points=data_points)
-                    elif isinstance(
-                        # pylint: disable=protected-access
-                        view_instrument_match._aggregation,
-                        _ExplicitBucketHistogramAggregation,
-                    ):
-                        data = Histogram(
-                            data_points=data_points,
-                            aggregation_temporality=aggregation_temporality,
-                        )
-                    elif isinstance(
-                        # pylint: disable=protected-access
-                        view_instrument_match._aggregation,
-                        _DropAggregation,
-                    ):
-                        continue
+                if data_points is None:
+                    continue
+
+                if isinstance(
+                    # pylint: disable=protected-access
+                    view_instrument_match._aggregation,
+                    _SumAggregation,
+                ):
+                    data = Sum(
+                        aggregation_temporality=aggregation_temporality,
+                        data_points=data_points,
+                        is_monotonic=isinstance(
+                            instrument, (Counter, ObservableCounter)
+                        ),
+                    )
+                elif isinstance(
+                    # pylint: disable=protected-access
+                    view_instrument_match._aggregation,
+                    _LastValueAggregation,
+                ):
+                    data = Gauge(data_points=data_points)
+                elif isinstance(
+                    # pylint: disable=protected-access
+                    view_instrument_match._aggregation,
+                    _ExplicitBucketHistogramAggregation,
+                ):
+                    data = Histogram(
+                        data_points=data_points,
+                        aggregation_temporality=aggregation_temporality,
+                    )
+                elif isinstance(
+                    # pylint: disable=protected-access
+                    view_instrument_match._aggregation,
+                    _DropAggregation,
+                ):
+                    continue
+
+                elif isinstance(
+                    # pylint: disable=protected-access
+                    view_instrument_match._aggregation,
+                    _ExponentialBucketHistogramAggregation,
+                ):
+                    data = ExponentialHistogram(
+                        data_points=data_points,
+                        aggregation_temporality=aggregation_temporality,
+                    )
 
-                    elif isinstance(
+                metrics.append(
+                    Metric(
                         # pylint: disable=protected-access
-                        view_instrument_match._aggregation,
-                        _ExponentialBucketHistogramAggregation,
-                    ):
-                        data = ExponentialHistogram(
-                            data_points=data_points,
-                            aggregation_temporality=aggregation_temporality,
-                        )
-
-                    metrics.append(
-                        Metric(
-                            # pylint: disable=protected-access
-                            name=view_instrument_match._name,
-                            description=view_instrument_match._description,
-                            unit=view_instrument_match._instrument.unit,
-                            data=data,
-                        )
+                        name=view_instrument_match._name,
+                        description=view_instrument_match._description,
+                        unit=view_instrument_match._instrument.unit,
+                        data=data,
                     )
-
-                if metrics:
-
-                    if instrument.instrumentation_scope not in (
-                        instrumentation_scope_scope_metrics
-                    ):
-                        instrumentation_scope_scope_metrics[
-                            instrument.instrumentation_scope
-                        ] = ScopeMetrics(
-                            scope=instrument.instrumentation_scope,
-                            metrics=metrics,
-                            schema_url=instrument.instrumentation_scope.schema_url,
-                        )
-                    else:
-                        instrumentation_scope_scope_metrics[
-                            instrument.instrumentation_scope
-                        ].metrics.extend(metrics)
-
-            if instrumentation_scope_scope_metrics:
-
-                return MetricsData(
-                    resource_metrics=[
-                        ResourceMetrics(
-                            resource=self._sdk_config.resource,
-                            scope_metrics=list(
-                                instrumentation_scope_scope_metrics.values()
-                            ),
-                            schema_url=self._sdk_config.resource.schema_url,
-                        )
-                    ]
                 )
 
-            return None
+            if metrics:
+
+                if instrument.instrumentation_scope not in (
+                    instrumentation_scope_scope_metrics
+                ):
+                    instrumentation_scope_scope_metrics[
+                        instrument.instrumentation_scope
+                    ] = ScopeMetrics(
+                        scope=instrument.instrumentation_scope,
+                        metrics=metrics,
+                        schema_url=instrument.instrumentation_scope.schema_url,
+                    )
+                else:
+                    instrumentation_scope_scope_metrics[
+                        instrument.instrumentation_scope
+                    ].metrics.extend(metrics)
+
+        if instrumentation_scope_scope_metrics:
+
+            return MetricsData(
+                resource_metrics=[
+                    ResourceMetrics(
+                        resource=self._sdk_config.resource,
+                        scope_metrics=list(
+                            instrumentation_scope_scope_metrics.values()
+                        ),
+                        schema_url=self._sdk_config.resource.schema_url,
+                    )
+                ]
+            )
+
+        return None
 
     def _handle_view_instrument_match(
         self,
@@ -313,3 +336,102 @@ class MetricReaderStorage:
             result = False
 
         return result
+
+
+class _SharedMetricReaderStorage:
+    """Storage that aggregates the measurements of synchronous instruments
+    once for several readers that use the same aggregations.
+
+    The aggregated measurements are moved into the storage of every reader
+    when one of them collects, each reader storage then applies its own
+    temporality. The measurements of instruments with aggregations that can
+    not be merged are consumed by every reader storage instead.
+    """
+
+    def __init__(
+        self,
+        sdk_config: SdkConfiguration,
+        instrument_class_aggregation: Dict[type, Aggregation],
+        reader_storages: Sequence[MetricReaderStorage],
+    ) -> None:
+        self._storage = MetricReaderStorage(
+            sdk_config, {}, instrument_class_aggregation
+        )
+        self._reader_storages = reader_storages
+        self._instrument_shared: Dict[Instrument, bool] = {}
+
+    def _is_shared(self, instrument: Instrument) -> bool:
+        shared = self._instrument_shared.get(instrument)
+        if shared is None:
+            shared = all(
+                # pylint: disable=protected-access
+                view_instrument_match._aggregation._mergeable
+                for view_instrument_match in (
+                    self._storage._get_or_init_view_instrument_match(
+                        instrument
+                    )
+                )
+            )
+            if shared:
+                # The reader storages match the instrument now, their
+                # cumulative data points start when the shared ones do and
+                # not with the first drain.
+                for reader_storage in self._reader_storages:
+                    reader_storage._get_or_init_view_instrument_match(
+                        instrument
+                    )
+            self._instrument_shared[instrument] = shared
+        return shared
+
+    def consume_measurement(self, measurement: Measurement) -> None:
+        if self._is_shared(measurement.instrument):
+            self._storage.consume_measurement(measurement)
+        else:
+            for reader_storage in self._reader_storages:
+                reader_storage.consume_measurement(measurement)
+
+    def get_aggregations(
+        self, instrument: Instrument, attributes: Attributes
+    ) -> List[_Aggregation]:
+        if self._is_shared(instrument):
+            return self._storage.get_aggregations(instrument, attributes)
+        aggregations = []
+        for reader_storage in self._reader_storages:
+            aggregations.extend(
+                reader_storage.get_aggregations(instrument, attributes)
+            )
+        return aggregations
+
+    def drain(self) -> None:
+        """Moves the measurements aggregated since the last drain into the
+        storage of every reader."""
+        collection_start_nanos = time_ns()
+
+        # pylint: disable=protected-access
+        with self._storage._lock:
+            instrument_view_instrument_matches = list(
+                self._storage._instrument_view_instrument_matches.items()
+            )
+
+        for (
+            instrument,
+            view_instrument_matches,
+        ) in instrument_view_instrument_matches:
+            if not self._is_shared(instrument):
+                continue
+            # Every reader storage matches the instrument with the same
+            # views, in the same order.
+            reader_view_instrument_matches = [
+                reader_storage._get_or_init_view_instrument_match(instrument)
+                for reader_storage in self._reader_storages
+            ]
+            for index, view_instrument_match in enumerate(
+                view_instrument_matches
+            ):
+                view_instrument_match.drain(
+                    [
+                        reader_matches[index]
+                        for reader_matches in reader_view_instrument_matches
+                    ],
+                    collection_start_nanos,
+                )
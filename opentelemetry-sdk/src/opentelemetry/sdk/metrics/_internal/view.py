@@ -79,6 +79,26 @@ class View:
         instrument_unit: This is an instrument matching attribute: the unit the
             instrument must have to match the view.
 
+        aggregation_cardinality_limit: This is a metric stream customizing
+            attribute: the maximum number of data points, one per set of
+            attributes, that the metric stream collects. Once the limit is
+            reached, measurements with new sets of attributes are aggregated
+            into a single overflow data point with the
+            ``otel.metric.overflow=true`` attribute. If `None`, the value of
+            :envvar:`OTEL_PYTHON_METRICS_CARDINALITY_LIMIT` is used, 2000 if
+            it is not set either.
+
+        series_ttl_millis: This is a metric stream customizing attribute: the
+            time in milliseconds after which a data point, a set of
+            attributes, that receives no measurements is dropped from the
+            metric stream when it is collected with cumulative temporality.
+            If `None`, data points are kept forever. Data points collected
+            with delta temporality are always dropped after a collection
+            interval without measurements, except the ones of asynchronous
+            counters and up down counters. Their observations are cumulative,
+            they follow the TTL like data points collected with cumulative
+            temporality.
+
     This class is not intended to be subclassed by the user.
     """
 
@@ -96,6 +116,8 @@ class View:
         attribute_keys: Optional[Set[str]] = None,
         aggregation: Optional[Aggregation] = None,
         instrument_unit: Optional[str] = None,
+        aggregation_cardinality_limit: Optional[int] = None,
+        series_ttl_millis: Optional[float] = None,
     ):
         if (
             instrument_type
@@ -122,7 +144,22 @@ class View:
                 "characters in instrument_name"
             )
 
-        # _name, _description, _aggregation and _attribute_keys will be
+        if (
+            aggregation_cardinality_limit is not None
+            and aggregation_cardinality_limit < 1
+        ):
+            raise ValueError(
+                f"View {name} declared with an aggregation_cardinality_limit "
+                "lower than 1"
+            )
+
+        if series_ttl_millis is not None and series_ttl_millis <= 0:
+            raise ValueError(
+                f"View {name} declared with a non positive series_ttl_millis"
+            )
+
+        # _name, _description, _aggregation, _attribute_keys,
+        # _aggregation_cardinality_limit and _series_ttl_millis will be
         # accessed when instantiating a _ViewInstrumentMatch.
         self._name = name
         self._instrument_type = instrument_type
@@ -135,6 +172,8 @@ class View:
         self._description = description
         self._attribute_keys = attribute_keys
         self._aggregation = aggregation or self._default_aggregation
+        self._aggregation_cardinality_limit = aggregation_cardinality_limit
+        self._series_ttl_millis = series_ttl_millis
 
     # pylint: disable=too-many-return-statements
     # pylint: disable=too-many-branches
@@ -16,6 +16,7 @@
 from opentelemetry.sdk.metrics._internal.export import (
     AggregationTemporality,
     ConsoleMetricExporter,
+    IncrementalMetricsState,
     InMemoryMetricReader,
     MetricExporter,
     MetricExportResult,
@@ -44,6 +45,7 @@ from opentelemetry.sdk.metrics._internal.point import (  # noqa: F401
 __all__ = [
     "AggregationTemporality",
     "ConsoleMetricExporter",
+    "IncrementalMetricsState",
     "InMemoryMetricReader",
     "MetricExporter",
     "MetricExportResult",
@@ -79,6 +79,9 @@ _DEFAULT_OTEL_SPAN_LINK_COUNT_LIMIT = 128
 
 _ENV_VALUE_UNSET = ""
 
+# Shared placeholder for span events and links that have not been recorded yet.
+_EMPTY_SEQUENCE = ()
+
 
 class SpanProcessor:
     """Interface which allows hooks for SDK's `Span` start and end method
@@ -351,6 +354,22 @@ class ReadableSpan:
 
     """
 
+    __slots__ = (
+        "_name",
+        "_context",
+        "_kind",
+        "_instrumentation_info",
+        "_instrumentation_scope",
+        "_parent",
+        "_start_time",
+        "_end_time",
+        "_attributes",
+        "_events",
+        "_links",
+        "_resource",
+        "_status",
+    )
+
     def __init__(
         self,
         name: str = None,
@@ -439,11 +458,11 @@ class ReadableSpan:
 
     @property
     def events(self) -> Sequence[Event]:
-        return tuple(event for event in self._events)
+        return tuple(self._events)
 
     @property
     def links(self) -> Sequence[trace_api.Link]:
-        return tuple(link for link in self._links)
+        return tuple(self._links)
 
     @property
     def resource(self) -> Resource:
@@ -740,6 +759,16 @@ class Span(trace_api.Span, ReadableSpan):
         limits: `SpanLimits` instance that was passed to the `TracerProvider`
     """
 
+    __slots__ = (
+        "_sampler",
+        "_trace_config",
+        "_record_exception",
+        "_set_status_on_exception",
+        "_span_processor",
+        "_limits",
+        "_lock",
+    )
+
     def __new__(cls, *args, **kwargs):
         if cls is Span:
             raise TypeError("Span must be instantiated via a tracer.")
@@ -789,8 +818,11 @@ class Span(trace_api.Span, ReadableSpan):
             immutable=False,
             max_value_len=self._limits.max_span_attribute_length,
         )
-        self._events = self._new_events()
+        # Event and link containers are only created once there is something
+        # to put in them, most spans never record either.
+        self._events = _EMPTY_SEQUENCE
         if events:
+            self._events = self._new_events()
             for event in events:
                 event._attributes = BoundedAttributes(
                     self._limits.max_event_attributes,
@@ -799,9 +831,8 @@ class Span(trace_api.Span, ReadableSpan):
                 )
                 self._events.append(event)
 
-        if links is None:
-            self._links = self._new_links()
-        else:
+        self._links = _EMPTY_SEQUENCE
+        if links:
             for link in links:
                 link._attributes = BoundedAttributes(
                     self._limits.max_link_attributes,
@@ -830,14 +861,15 @@ class Span(trace_api.Span, ReadableSpan):
                 logger.warning("Setting attribute on ended span.")
                 return
 
-            for key, value in attributes.items():
-                self._attributes[key] = value
+            self._attributes.update(attributes)
 
     def set_attribute(self, key: str, value: types.AttributeValue) -> None:
         return self.set_attributes({key: value})
 
     @_check_span_ended
     def _add_event(self, event: EventBase) -> None:
+        if self._events is _EMPTY_SEQUENCE:
+            self._events = self._new_events()
         self._events.append(event)
 
     def add_event(
@@ -859,6 +891,18 @@ class Span(trace_api.Span, ReadableSpan):
             )
         )
 
+    def _freeze(self) -> None:
+        # An ended span can't be modified anymore, so its attributes, events
+        # and links are shared with the ReadableSpan passed to the span
+        # processors and can be read by all of them without copies or locks.
+        # pylint: disable=protected-access
+        if isinstance(self._attributes, BoundedAttributes):
+            self._attributes._immutable = True
+        if isinstance(self._events, BoundedList):
+            self._events._immutable = True
+        if isinstance(self._links, BoundedList):
+            self._links._immutable = True
+
     def _readable_span(self) -> ReadableSpan:
         return ReadableSpan(
             name=self._name,
@@ -900,6 +944,7 @@ class Span(trace_api.Span, ReadableSpan):
                 return
 
             self._end_time = end_time if end_time is not None else time_ns()
+            self._freeze()
 
         self._span_processor.on_end(self._readable_span())
 
@@ -999,6 +1044,8 @@ class _Span(Span):
     by other mechanisms than through the `Tracer`.
     """
 
+    __slots__ = ()
+
 
 class Tracer(trace_api.Tracer):
     """See `opentelemetry.trace.Tracer`."""
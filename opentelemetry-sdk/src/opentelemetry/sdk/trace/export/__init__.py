@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import collections
+import concurrent.futures
+import itertools
 import logging
 import os
 import sys
@@ -32,6 +35,7 @@ from opentelemetry.context import (
 )
 from opentelemetry.sdk.environment_variables import (
     OTEL_BSP_EXPORT_TIMEOUT,
+    OTEL_BSP_MAX_CONCURRENT_EXPORTS,
     OTEL_BSP_MAX_EXPORT_BATCH_SIZE,
     OTEL_BSP_MAX_QUEUE_SIZE,
     OTEL_BSP_SCHEDULE_DELAY,
@@ -43,6 +47,7 @@ _DEFAULT_SCHEDULE_DELAY_MILLIS = 5000
 _DEFAULT_MAX_EXPORT_BATCH_SIZE = 512
 _DEFAULT_EXPORT_TIMEOUT_MILLIS = 30000
 _DEFAULT_MAX_QUEUE_SIZE = 2048
+_DEFAULT_MAX_CONCURRENT_EXPORTS = 1
 _ENV_VAR_INT_VALUE_ERROR_MESSAGE = (
     "Unable to parse value for %s as integer. Defaulting to %s."
 )
@@ -134,6 +139,82 @@ class _FlushRequest:
         self.num_spans = 0
 
 
+class _ShardedSpanQueue:
+    """A bounded span queue split into several deques.
+
+    Every producer thread is assigned one shard the first time it appends a
+    span and keeps using it, so threads ending spans concurrently append to
+    different deques. The shards share the capacity of the queue, once it
+    is full the oldest span of the longest shard is dropped for every span
+    added, like a single deque with a ``maxlen`` drops its oldest span.
+
+    Spans are consumed by a single thread which pops from the shards in
+    turn, spans from different shards are not exported in the order they
+    were added.
+    """
+
+    def __init__(self, maxlen: int, num_shards: int):
+        self.maxlen = maxlen
+        self.shards = [
+            collections.deque() for _ in range(num_shards)
+        ]  # type: typing.List[typing.Deque[Span]]
+        self._next_shard_index = itertools.count()
+        self._local = threading.local()
+        self._pop_index = 0
+        # only taken to drop spans once the queue is full
+        self._drop_lock = threading.Lock()
+
+    def shard_index(self) -> int:
+        """Returns the index of the shard of the calling thread."""
+        index = getattr(self._local, "shard_index", None)
+        if index is None:
+            index = next(self._next_shard_index) % len(self.shards)
+            self._local.shard_index = index
+        return index
+
+    def appendleft(self, span: Span, shard_index: int) -> int:
+        """Appends a span to a shard and returns the number of spans that
+        were dropped to keep the queue within its capacity."""
+        self.shards[shard_index].appendleft(span)
+        if len(self) <= self.maxlen:
+            return 0
+        # Threads append without holding the lock, so the queue can go over
+        # its capacity by a few spans. Every thread that sees it over
+        # capacity drops spans until it is not anymore.
+        dropped = 0
+        with self._drop_lock:
+            while len(self) > self.maxlen:
+                try:
+                    max(self.shards, key=len).pop()
+                except IndexError:
+                    # emptied by the consumer in the meantime
+                    continue
+                dropped += 1
+        return dropped
+
+    def pop(self) -> Span:
+        for _ in range(len(self.shards)):
+            shard = self.shards[self._pop_index]
+            self._pop_index = (self._pop_index + 1) % len(self.shards)
+            try:
+                return shard.pop()
+            except IndexError:
+                # empty, or emptied by a producer dropping spans
+                continue
+        raise IndexError("pop from an empty queue")
+
+    def clear(self) -> None:
+        for shard in self.shards:
+            shard.clear()
+
+    def _at_fork_reinit(self) -> None:
+        # the lock may have been held by a thread of the parent process
+        self._drop_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self.shards)
+
+
 _BSP_RESET_ONCE = Once()
 
 
@@ -150,6 +231,19 @@ class BatchSpanProcessor(SpanProcessor):
     - :envvar:`OTEL_BSP_MAX_QUEUE_SIZE`
     - :envvar:`OTEL_BSP_MAX_EXPORT_BATCH_SIZE`
     - :envvar:`OTEL_BSP_EXPORT_TIMEOUT`
+    - :envvar:`OTEL_BSP_MAX_CONCURRENT_EXPORTS`
+
+    With ``max_concurrent_exports`` greater than 1, batches are exported from
+    a pool of that many threads, so the `SpanExporter` must support
+    concurrent calls to `SpanExporter.export`. Once all of them are busy the
+    worker thread waits for an export to finish before taking the next batch
+    from the queue. Batches may finish exporting in any order.
+
+    When many threads end spans concurrently, ``queue_shards`` can be set to
+    split the queue into that many shards. Each producer thread then appends
+    to its own shard, the shards together hold up to ``max_queue_size``
+    spans. The number of spans dropped because the queue was full is available in
+    `dropped_spans`.
     """
 
     def __init__(
@@ -159,6 +253,8 @@ class BatchSpanProcessor(SpanProcessor):
         schedule_delay_millis: float = None,
         max_export_batch_size: int = None,
         export_timeout_millis: float = None,
+        queue_shards: int = 1,
+        max_concurrent_exports: int = None,
     ):
         if max_queue_size is None:
             max_queue_size = BatchSpanProcessor._default_max_queue_size()
@@ -178,14 +274,30 @@ class BatchSpanProcessor(SpanProcessor):
                 BatchSpanProcessor._default_export_timeout_millis()
             )
 
+        if max_concurrent_exports is None:
+            max_concurrent_exports = (
+                BatchSpanProcessor._default_max_concurrent_exports()
+            )
+
         BatchSpanProcessor._validate_arguments(
-            max_queue_size, schedule_delay_millis, max_export_batch_size
+            max_queue_size,
+            schedule_delay_millis,
+            max_export_batch_size,
+            queue_shards,
+            max_concurrent_exports,
         )
 
         self.span_exporter = span_exporter
-        self.queue = collections.deque(
-            [], max_queue_size
-        )  # type: typing.Deque[Span]
+        if queue_shards == 1:
+            self.queue = collections.deque(
+                [], max_queue_size
+            )  # type: typing.Union[typing.Deque[Span], _ShardedSpanQueue]
+        else:
+            self.queue = _ShardedSpanQueue(max_queue_size, queue_shards)
+        # number of queued spans in a deque that wakes up the worker thread
+        self._notify_queue_size = -(-max_export_batch_size // queue_shards)
+        self._dropped_spans = 0
+        self._dropped_spans_lock = threading.Lock()
         self.worker_thread = threading.Thread(
             name="OtelBatchSpanProcessor", target=self.worker, daemon=True
         )
@@ -195,6 +307,11 @@ class BatchSpanProcessor(SpanProcessor):
         self.max_export_batch_size = max_export_batch_size
         self.max_queue_size = max_queue_size
         self.export_timeout_millis = export_timeout_millis
+        self.queue_shards = queue_shards
+        self.max_concurrent_exports = max_concurrent_exports
+        self._export_executor = None
+        self._export_slots = None
+        self._init_export_executor()
         self.done = False
         # flag that indicates that spans are being dropped
         self._spans_dropped = False
@@ -224,20 +341,57 @@ class BatchSpanProcessor(SpanProcessor):
         if self._pid != os.getpid():
             _BSP_RESET_ONCE.do_once(self._at_fork_reinit)
 
-        if len(self.queue) == self.max_queue_size:
+        if isinstance(self.queue, _ShardedSpanQueue):
+            shard_index = self.queue.shard_index()
+            queue = self.queue.shards[shard_index]
+            dropped = self.queue.appendleft(span, shard_index)
+        else:
+            queue = self.queue
+            dropped = int(len(queue) == queue.maxlen)
+            queue.appendleft(span)
+
+        if dropped:
+            with self._dropped_spans_lock:
+                self._dropped_spans += dropped
             if not self._spans_dropped:
                 logger.warning("Queue is full, likely spans will be dropped.")
                 self._spans_dropped = True
 
-        self.queue.appendleft(span)
-
-        if len(self.queue) >= self.max_export_batch_size:
+        queue_size = len(queue)
+        if queue_size >= self._notify_queue_size and (
+            # a shard is mostly appended to by a single thread, only wake up
+            # the worker thread once when the shard fills up instead of for
+            # every span, it wakes up on its own after schedule_delay_millis
+            # otherwise
+            queue is self.queue
+            or queue_size == self._notify_queue_size
+        ):
             with self.condition:
                 self.condition.notify()
 
+    @property
+    def dropped_spans(self) -> int:
+        """The number of spans dropped because the queue was full."""
+        return self._dropped_spans
+
+    def _init_export_executor(self):
+        if self.max_concurrent_exports > 1:
+            self._export_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_concurrent_exports,
+                thread_name_prefix="OtelBatchSpanProcessorExport",
+            )
+            self._export_slots = threading.Semaphore(
+                self.max_concurrent_exports
+            )
+
     def _at_fork_reinit(self):
         self.condition = threading.Condition(threading.Lock())
+        self._dropped_spans_lock = threading.Lock()
+        if isinstance(self.queue, _ShardedSpanQueue):
+            self.queue._at_fork_reinit()
         self.queue.clear()
+        # the export threads don't exist in the child process either
+        self._init_export_executor()
 
         # worker_thread is local to a process, only the thread that issued fork continues
         # to exist. A new worker thread must be started in child process.
@@ -276,6 +430,8 @@ class BatchSpanProcessor(SpanProcessor):
             # subtract the duration of this export call to the next timeout
             start = time_ns()
             self._export(flush_request)
+            if flush_request is not None:
+                self._wait_for_exports()
             end = time_ns()
             duration = (end - start) / 1e9
             timeout = self.schedule_delay_millis / 1e3 - duration
@@ -290,6 +446,7 @@ class BatchSpanProcessor(SpanProcessor):
 
         # be sure that all spans are sent
         self._drain_queue()
+        self._wait_for_exports()
         self._notify_flush_request_finished(flush_request)
         self._notify_flush_request_finished(shutdown_flush_request)
 
@@ -356,24 +513,55 @@ class BatchSpanProcessor(SpanProcessor):
         exported spans.
         """
         idx = 0
-        # currently only a single thread acts as consumer, so queue.pop() will
-        # not raise an exception
+        # Only a single thread acts as consumer, but the producers also pop
+        # spans from the shards of a sharded queue when they drop spans, so
+        # the queue can be emptied between the check and queue.pop(). The
+        # batch ends then.
         while idx < self.max_export_batch_size and self.queue:
-            self.spans_list[idx] = self.queue.pop()
+            try:
+                self.spans_list[idx] = self.queue.pop()
+            except IndexError:
+                break
             idx += 1
+        # Ignore type b/c the Optional[None]+slicing is too "clever"
+        # for mypy
+        spans = self.spans_list[:idx]  # type: ignore
+
+        if self._export_executor is None:
+            self._export_spans(spans)
+        else:
+            export_slots = self._export_slots
+            # blocks until one of the concurrent exports is finished
+            export_slots.acquire()  # pylint: disable=consider-using-with
+            self._export_executor.submit(
+                self._export_spans, spans
+            ).add_done_callback(lambda future: export_slots.release())
+
+        # clean up list
+        for index in range(idx):
+            self.spans_list[index] = None
+        return idx
+
+    def _export_spans(self, spans: typing.List[ReadableSpan]) -> None:
         token = attach(set_value(_SUPPRESS_INSTRUMENTATION_KEY, True))
         try:
-            # Ignore type b/c the Optional[None]+slicing is too "clever"
-            # for mypy
-            self.span_exporter.export(self.spans_list[:idx])  # type: ignore
+            self.span_exporter.export(spans)
         except Exception:  # pylint: disable=broad-except
             logger.exception("Exception while exporting Span batch.")
         detach(token)
 
-        # clean up list
-        for index in range(idx):
-            self.spans_list[index] = None
-        return idx
+    def _wait_for_exports(self):
+        """Waits until all concurrent exports are finished.
+
+        Can only be called from the worker thread context because it must not
+        run while new exports are started.
+        """
+        if self._export_slots is None:
+            return
+        for _ in range(self.max_concurrent_exports):
+            self._export_slots.acquire()  # pylint: disable=consider-using-with
+        for _ in range(self.max_concurrent_exports):
+            self._export_slots.release()
 
     def _drain_queue(self):
         """Export all elements until queue is empty.
@@ -410,6 +598,8 @@ class BatchSpanProcessor(SpanProcessor):
         with self.condition:
             self.condition.notify_all()
         self.worker_thread.join()
+        if self._export_executor is not None:
+            self._export_executor.shutdown()
         self.span_exporter.shutdown()
 
     @staticmethod
@@ -475,13 +665,47 @@ class BatchSpanProcessor(SpanProcessor):
             )
             return _DEFAULT_EXPORT_TIMEOUT_MILLIS
 
+    @staticmethod
+    def _default_max_concurrent_exports():
+        try:
+            return int(
+                environ.get(
+                    OTEL_BSP_MAX_CONCURRENT_EXPORTS,
+                    _DEFAULT_MAX_CONCURRENT_EXPORTS,
+                )
+            )
+        except ValueError:
+            logger.exception(
+                _ENV_VAR_INT_VALUE_ERROR_MESSAGE,
+                OTEL_BSP_MAX_CONCURRENT_EXPORTS,
+                _DEFAULT_MAX_CONCURRENT_EXPORTS,
+            )
+            return _DEFAULT_MAX_CONCURRENT_EXPORTS
+
     @staticmethod
     def _validate_arguments(
-        max_queue_size, schedule_delay_millis, max_export_batch_size
+        max_queue_size,
+        schedule_delay_millis,
+        max_export_batch_size,
+        queue_shards=1,
+        max_concurrent_exports=1,
     ):
         if max_queue_size <= 0:
             raise ValueError("max_queue_size must be a positive integer.")
 
+        if queue_shards <= 0:
+            raise ValueError("queue_shards must be a positive integer.")
+
+        if queue_shards > max_queue_size:
+            raise ValueError(
+                "queue_shards must be less than or equal to max_queue_size."
+            )
+
+        if max_concurrent_exports <= 0:
+            raise ValueError(
+                "max_concurrent_exports must be a positive integer."
+            )
+
         if schedule_delay_millis <= 0:
             raise ValueError("schedule_delay_millis must be positive.")
 
@@ -496,6 +720,266 @@ class BatchSpanProcessor(SpanProcessor):
             )
 
 
+class AsyncSpanExporter:
+    """Interface for exporting spans from an asyncio event loop.
+
+    Like `SpanExporter`, except that its methods are coroutines which are
+    run on the event loop of an `AsyncBatchSpanProcessor`.
+    """
+
+    async def export(
+        self, spans: typing.Sequence[ReadableSpan]
+    ) -> "SpanExportResult":
+        """Exports a batch of telemetry data.
+
+        Args:
+            spans: The list of `opentelemetry.trace.Span` objects to be exported
+
+        Returns:
+            The result of the export
+        """
+
+    async def shutdown(self) -> None:
+        """Shuts down the exporter.
+
+        Called when the SDK is shut down.
+        """
+
+    async def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Hint to ensure that the export of any spans the exporter has received
+        prior to the call to ForceFlush SHOULD be completed as soon as possible, preferably
+        before returning from this method.
+        """
+
+
+class AsyncBatchSpanProcessor(SpanProcessor):
+    """Batch span processor implementation for asyncio applications.
+
+    `AsyncBatchSpanProcessor` batches ended spans like `BatchSpanProcessor`
+    and pushes them to the configured `AsyncSpanExporter` from a task running
+    on the given event loop instead of a dedicated thread. If no loop is
+    given, the processor must be created from a coroutine and uses the
+    running loop.
+
+    Spans can be ended from any thread, adding them to the queue never
+    blocks. `force_flush` and `shutdown` wait for the event loop to finish
+    the export, when called from the event loop's own thread they only
+    schedule it and return without waiting.
+
+    `AsyncBatchSpanProcessor` is configurable with the same environment
+    variables as `BatchSpanProcessor`:
+
+    - :envvar:`OTEL_BSP_SCHEDULE_DELAY`
+    - :envvar:`OTEL_BSP_MAX_QUEUE_SIZE`
+    - :envvar:`OTEL_BSP_MAX_EXPORT_BATCH_SIZE`
+    - :envvar:`OTEL_BSP_EXPORT_TIMEOUT`
+    """
+
+    def __init__(
+        self,
+        span_exporter: AsyncSpanExporter,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        max_queue_size: int = None,
+        schedule_delay_millis: float = None,
+        max_export_batch_size: int = None,
+        export_timeout_millis: float = None,
+    ):
+        if max_queue_size is None:
+            max_queue_size = BatchSpanProcessor._default_max_queue_size()
+
+        if schedule_delay_millis is None:
+            schedule_delay_millis = (
+                BatchSpanProcessor._default_schedule_delay_millis()
+            )
+
+        if max_export_batch_size is None:
+            max_export_batch_size = (
+                BatchSpanProcessor._default_max_export_batch_size()
+            )
+
+        if export_timeout_millis is None:
+            export_timeout_millis = (
+                BatchSpanProcessor._default_export_timeout_millis()
+            )
+
+        BatchSpanProcessor._validate_arguments(
+            max_queue_size, schedule_delay_millis, max_export_batch_size
+        )
+
+        if loop is None:
+            loop = asyncio.get_running_loop()
+
+        self.span_exporter = span_exporter
+        self.loop = loop
+        self.queue = collections.deque(
+            [], max_queue_size
+        )  # type: typing.Deque[ReadableSpan]
+        self.schedule_delay_millis = schedule_delay_millis
+        self.max_export_batch_size = max_export_batch_size
+        self.max_queue_size = max_queue_size
+        self.export_timeout_millis = export_timeout_millis
+        self.done = False
+        # flag that indicates that spans are being dropped
+        self._spans_dropped = False
+        self._dropped_spans = 0
+        # only accessed from the event loop
+        self._wakeup = None  # type: typing.Optional[asyncio.Event]
+        self._flush_waiters = []  # type: typing.List[asyncio.Future]
+        # avoids scheduling a wake up of the worker task for every span
+        self._wakeup_scheduled = False
+        self._worker_future = asyncio.run_coroutine_threadsafe(
+            self._worker(), loop
+        )
+
+    def on_start(
+        self, span: Span, parent_context: typing.Optional[Context] = None
+    ) -> None:
+        pass
+
+    def on_end(self, span: ReadableSpan) -> None:
+        if self.done:
+            logger.warning("Already shutdown, dropping span.")
+            return
+        if not span.context.trace_flags.sampled:
+            return
+
+        if len(self.queue) == self.max_queue_size:
+            self._dropped_spans += 1
+            if not self._spans_dropped:
+                logger.warning("Queue is full, likely spans will be dropped.")
+                self._spans_dropped = True
+
+        self.queue.appendleft(span)
+
+        if (
+            len(self.queue) >= self.max_export_batch_size
+            and not self._wakeup_scheduled
+        ):
+            self._wakeup_scheduled = True
+            self._call_soon(self._wake_up)
+
+    @property
+    def dropped_spans(self) -> int:
+        """The number of spans dropped because the queue was full."""
+        return self._dropped_spans
+
+    def _call_soon(self, callback: typing.Callable[[], None]) -> bool:
+        try:
+            self.loop.call_soon_threadsafe(callback)
+        except RuntimeError:
+            logger.warning("Event loop is closed, spans can't be exported.")
+            return False
+        return True
+
+    def _in_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    def _can_wait_for_loop(self) -> bool:
+        if self._in_loop_thread():
+            # blocking here would keep the event loop from exporting
+            return False
+        if not self.loop.is_running():
+            logger.warning(
+                "Event loop is not running, spans can't be exported."
+            )
+            return False
+        return True
+
+    def _wake_up(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _worker(self):
+        self._wakeup = asyncio.Event()
+        timeout = self.schedule_delay_millis / 1e3
+        while not self.done:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            self._wakeup_scheduled = False
+            await self._export()
+
+        # be sure that all spans are sent
+        await self._export()
+        try:
+            await self.span_exporter.shutdown()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Exception while shutting down exporter.")
+
+    async def _export(self):
+        """Exports all queued spans in batches of at most
+        max_export_batch_size spans and then notifies the flush requests
+        that were made before the export started.
+        """
+        flush_waiters, self._flush_waiters = self._flush_waiters, []
+        while self.queue:
+            spans = []
+            while len(spans) < self.max_export_batch_size and self.queue:
+                spans.append(self.queue.pop())
+            token = attach(set_value(_SUPPRESS_INSTRUMENTATION_KEY, True))
+            try:
+                # a hung export does not block the exports that follow
+                await asyncio.wait_for(
+                    self.span_exporter.export(spans),
+                    self.export_timeout_millis / 1e3,
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Timeout was exceeded while exporting Span batch."
+                )
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Exception while exporting Span batch.")
+            detach(token)
+
+        for flush_waiter in flush_waiters:
+            if not flush_waiter.done():
+                flush_waiter.set_result(True)
+
+    async def _flush(self) -> bool:
+        flush_waiter = self.loop.create_future()
+        self._flush_waiters.append(flush_waiter)
+        self._wake_up()
+        return await flush_waiter
+
+    def force_flush(self, timeout_millis: int = None) -> bool:
+        if timeout_millis is None:
+            timeout_millis = self.export_timeout_millis
+
+        if self.done:
+            logger.warning("Already shutdown, ignoring call to force_flush().")
+            return True
+
+        try:
+            future = asyncio.run_coroutine_threadsafe(self._flush(), self.loop)
+        except RuntimeError:
+            logger.warning("Event loop is closed, spans can't be exported.")
+            return False
+
+        if not self._can_wait_for_loop():
+            return False
+
+        try:
+            return future.result(timeout_millis / 1e3)
+        except concurrent.futures.TimeoutError:
+            logger.warning("Timeout was exceeded in force_flush().")
+            return False
+
+    def shutdown(self) -> None:
+        # signal the worker task to finish and then wait for it
+        self.done = True
+        if not self._call_soon(self._wake_up) or not self._can_wait_for_loop():
+            return
+        try:
+            self._worker_future.result(self.export_timeout_millis / 1e3)
+        except concurrent.futures.TimeoutError:
+            logger.warning("Timeout was exceeded in shutdown().")
+
+
 class ConsoleSpanExporter(SpanExporter):
     """Implementation of :class:`SpanExporter` that prints spans to the
     console.
@@ -52,6 +52,7 @@ class BoundedList(Sequence):
         self.dropped = 0
         self._dq = deque(maxlen=maxlen)  # type: deque
         self._lock = threading.Lock()
+        self._immutable = False
 
     def __repr__(self):
         return f"{type(self).__name__}({list(self._dq)}, maxlen={self._dq.maxlen})"
@@ -63,10 +64,15 @@ class BoundedList(Sequence):
         return len(self._dq)
 
     def __iter__(self):
+        if self._immutable:
+            # immutable lists can't change while being iterated over
+            return iter(self._dq)
         with self._lock:
             return iter(deque(self._dq))
 
     def append(self, item):
+        if self._immutable:
+            raise TypeError
         with self._lock:
             if (
                 self._dq.maxlen is not None
@@ -76,6 +82,8 @@ class BoundedList(Sequence):
             self._dq.append(item)
 
     def extend(self, seq):
+        if self._immutable:
+            raise TypeError
         with self._lock:
             if self._dq.maxlen is not None:
                 to_drop = len(seq) + len(self._dq) - self._dq.maxlen
@@ -0,0 +1,89 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from copy import deepcopy
+from random import Random
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from opentelemetry.sdk.metrics._internal.aggregation import (
+    _ExponentialBucketHistogramAggregation,
+)
+from opentelemetry.sdk.metrics._internal.exponential_histogram.buckets import (
+    Buckets,
+)
+from opentelemetry.sdk.metrics._internal.measurement import Measurement
+
+
+def get_index_counts(buckets: Buckets) -> dict:
+    return {
+        buckets.offset + position: buckets[position]
+        for position in range(len(buckets))
+        if buckets[position]
+    }
+
+
+class TestBuckets(TestCase):
+    def test_new_buckets(self):
+        buckets = Buckets()
+
+        self.assertTrue(buckets.is_empty())
+        self.assertEqual(len(buckets), 0)
+        self.assertEqual(list(buckets.nonzero()), [])
+
+    def test_nonzero(self):
+        for size in (8, 128):
+            buckets = Buckets()
+            buckets.grow(size, size)
+            buckets.increment_bucket(1, 3)
+            buckets.increment_bucket(size - 1)
+
+            self.assertEqual(list(buckets.nonzero()), [(1, 3), (size - 1, 1)])
+            self.assertFalse(buckets.is_empty())
+
+    def test_downscale(self):
+        random = Random(0)
+        for max_size in (16, 160, 1024):
+            aggregation = _ExponentialBucketHistogramAggregation(
+                Mock(), 0, max_size=max_size
+            )
+            # decreasing values make the backing array wrap around
+            for value in sorted(
+                (random.uniform(1, 2) for _ in range(10 * max_size)),
+                reverse=True,
+            ):
+                aggregation.aggregate(Measurement(value, Mock()))
+            # pylint: disable=protected-access
+            positive = aggregation._positive
+            self.assertNotEqual(positive.index_base, positive.index_start)
+
+            for amount in (1, 3):
+                expected = {}
+                for index, count in get_index_counts(positive).items():
+                    expected[index >> amount] = (
+                        expected.get(index >> amount, 0) + count
+                    )
+
+                with_numpy = deepcopy(positive)
+                with_numpy.downscale(amount)
+                without_numpy = deepcopy(positive)
+                with patch(
+                    "opentelemetry.sdk.metrics._internal."
+                    "exponential_histogram.buckets.numpy",
+                    None,
+                ):
+                    without_numpy.downscale(amount)
+
+                self.assertEqual(get_index_counts(with_numpy), expected)
+                self.assertEqual(get_index_counts(without_numpy), expected)
@@ -975,7 +975,8 @@ class TestExponentialBucketHistogramAggregation(TestCase):
         self.assertEqual(exponential_histogram_aggregation._mapping.scale, 0)
         self.assertEqual(exponential_histogram_aggregation._positive.offset, 0)
         self.assertEqual(
-            exponential_histogram_aggregation._positive.counts, [1, 1, 1, 1]
+            list(exponential_histogram_aggregation._positive.counts),
+            [1, 1, 1, 1],
         )
 
         result = exponential_histogram_aggregation.collect(
@@ -993,7 +994,8 @@ class TestExponentialBucketHistogramAggregation(TestCase):
             exponential_histogram_aggregation._positive.offset, -4
         )
         self.assertEqual(
-            exponential_histogram_aggregation._positive.counts, [1, 1, 1, 1]
+            list(exponential_histogram_aggregation._positive.counts),
+            [1, 1, 1, 1],
         )
 
         result_1 = exponential_histogram_aggregation.collect(
@@ -1016,7 +1018,8 @@ class TestExponentialBucketHistogramAggregation(TestCase):
         self.assertEqual(exponential_histogram_aggregation._mapping.scale, 0)
         self.assertEqual(exponential_histogram_aggregation._positive.offset, 0)
         self.assertEqual(
-            exponential_histogram_aggregation._positive.counts, [1, 1, 1, 1]
+            list(exponential_histogram_aggregation._positive.counts),
+            [1, 1, 1, 1],
         )
 
         result = exponential_histogram_aggregation.collect(
@@ -1034,7 +1037,8 @@ class TestExponentialBucketHistogramAggregation(TestCase):
             exponential_histogram_aggregation._positive.offset, -4
         )
         self.assertEqual(
-            exponential_histogram_aggregation._positive.counts, [1, 1, 1, 1]
+            list(exponential_histogram_aggregation._positive.counts),
+            [1, 1, 1, 1],
         )
 
         result_1 = exponential_histogram_aggregation.collect(
@@ -1043,3 +1047,29 @@ class TestExponentialBucketHistogramAggregation(TestCase):
         )
 
         self.assertEqual(result.scale, result_1.scale)
+
+    def test_aggregate_batch(self):
+        values = [0, 1.5, -3, 8, 1e-5, 256, 256, -0.25, 4096]
+
+        exponential_histogram_aggregation = (
+            _ExponentialBucketHistogramAggregation({}, 0, max_size=4)
+        )
+        for value in values:
+            exponential_histogram_aggregation.aggregate(
+                Measurement(value, Mock())
+            )
+        batch_exponential_histogram_aggregation = (
+            _ExponentialBucketHistogramAggregation({}, 0, max_size=4)
+        )
+        self.assertTrue(
+            batch_exponential_histogram_aggregation.aggregate_batch(values)
+        )
+
+        self.assertEqual(
+            batch_exponential_histogram_aggregation.collect(
+                AggregationTemporality.DELTA, 1
+            ),
+            exponential_histogram_aggregation.collect(
+                AggregationTemporality.DELTA, 1
+            ),
+        )
@@ -0,0 +1,110 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import TestCase
+
+from opentelemetry.sdk.metrics import Counter, MeterProvider
+from opentelemetry.sdk.metrics.export import (
+    AggregationTemporality,
+    InMemoryMetricReader,
+)
+from opentelemetry.sdk.metrics.view import View
+
+
+class TestBoundInstruments(TestCase):
+    def test_bound_and_unbound_measurements_are_aggregated_together(self):
+        readers = [InMemoryMetricReader(), InMemoryMetricReader()]
+        meter_provider = MeterProvider(metric_readers=readers)
+        meter = meter_provider.get_meter("testmeter")
+        counter = meter.create_counter("testcounter")
+        histogram = meter.create_histogram("testhistogram")
+
+        bound_counter = counter.bind({"label": "value"})
+        bound_histogram = histogram.bind({"label": "value"})
+        counter.add(1, {"label": "value"})
+        bound_counter.add(2)
+        histogram.record(1, {"label": "value"})
+        bound_histogram.record(3)
+
+        for reader in readers:
+            metrics = (
+                reader.get_metrics_data()
+                .resource_metrics[0]
+                .scope_metrics[0]
+                .metrics
+            )
+            counter_points = list(metrics[0].data.data_points)
+            self.assertEqual(len(counter_points), 1)
+            self.assertEqual(counter_points[0].value, 3)
+            self.assertEqual(counter_points[0].attributes, {"label": "value"})
+
+            histogram_points = list(metrics[1].data.data_points)
+            self.assertEqual(len(histogram_points), 1)
+            self.assertEqual(histogram_points[0].count, 2)
+            self.assertEqual(histogram_points[0].sum, 4)
+
+    def test_bound_counter_with_view_attribute_keys(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(
+            metric_readers=[reader],
+            views=[View(instrument_name="testcounter", attribute_keys={"a"})],
+        )
+        counter = meter_provider.get_meter("testmeter").create_counter(
+            "testcounter"
+        )
+
+        counter.bind({"a": 1, "b": 1}).add(1)
+        counter.bind({"a": 1, "b": 2}).add(1)
+        counter.bind().add(1)
+
+        data_points = list(
+            reader.get_metrics_data()
+            .resource_metrics[0]
+            .scope_metrics[0]
+            .metrics[0]
+            .data.data_points
+        )
+        self.assertEqual(
+            {
+                frozenset(point.attributes.items()): point.value
+                for point in data_points
+            },
+            {frozenset({("a", 1)}): 2, frozenset(): 1},
+        )
+
+    def test_bound_counter_after_eviction(self):
+        reader = InMemoryMetricReader(
+            preferred_temporality={Counter: AggregationTemporality.DELTA}
+        )
+        meter_provider = MeterProvider(metric_readers=[reader])
+        counter = meter_provider.get_meter("testmeter").create_counter(
+            "testcounter"
+        )
+        bound_counter = counter.bind({"label": "value"})
+
+        bound_counter.add(1)
+        reader.get_metrics_data()
+        # the aggregation of the bound counter is idle and evicted here
+        self.assertIsNone(reader.get_metrics_data())
+
+        bound_counter.add(2)
+        data_points = list(
+            reader.get_metrics_data()
+            .resource_metrics[0]
+            .scope_metrics[0]
+            .metrics[0]
+            .data.data_points
+        )
+        self.assertEqual(len(data_points), 1)
+        self.assertEqual(data_points[0].value, 2)
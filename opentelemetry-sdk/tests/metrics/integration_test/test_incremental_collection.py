@@ -0,0 +1,150 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from time import sleep
+from unittest import TestCase
+
+from opentelemetry.sdk.metrics import Counter, MeterProvider
+from opentelemetry.sdk.metrics.export import (
+    AggregationTemporality,
+    IncrementalMetricsState,
+    InMemoryMetricReader,
+)
+from opentelemetry.sdk.metrics.view import View
+
+
+def _get_values(metrics_data):
+    return {
+        (metric.name, point.attributes["a"]): point.value
+        for metric in metrics_data.resource_metrics[0].scope_metrics[0].metrics
+        for point in metric.data.data_points
+    }
+
+
+class TestIncrementalCollection(TestCase):
+    def test_only_changed_series_are_collected(self):
+        reader = InMemoryMetricReader(incremental_collection=True)
+        meter_provider = MeterProvider(metric_readers=[reader])
+        counter = meter_provider.get_meter("testmeter").create_counter(
+            "testcounter"
+        )
+        state = IncrementalMetricsState()
+
+        for value in range(10):
+            counter.add(1, {"a": value})
+
+        metrics_data = reader.get_metrics_data()
+        self.assertEqual(len(_get_values(metrics_data)), 10)
+        self.assertEqual(len(_get_values(state.update(metrics_data))), 10)
+
+        counter.add(2, {"a": 3})
+
+        metrics_data = reader.get_metrics_data()
+        self.assertEqual(_get_values(metrics_data), {("testcounter", 3): 3})
+        values = _get_values(state.update(metrics_data))
+        self.assertEqual(len(values), 10)
+        self.assertEqual(values[("testcounter", 3)], 3)
+        self.assertEqual(values[("testcounter", 4)], 1)
+
+        # nothing changed
+        self.assertIsNone(reader.get_metrics_data())
+
+    def test_reused_data_points_have_collection_time(self):
+        reader = InMemoryMetricReader(incremental_collection=True)
+        meter_provider = MeterProvider(metric_readers=[reader])
+        counter = meter_provider.get_meter("testmeter").create_counter(
+            "testcounter"
+        )
+        state = IncrementalMetricsState()
+
+        counter.add(1, {"a": 1})
+        counter.add(1, {"a": 2})
+        state.update(reader.get_metrics_data())
+        counter.add(1, {"a": 2})
+
+        metrics_data = state.update(reader.get_metrics_data())
+        data_points = (
+            metrics_data.resource_metrics[0]
+            .scope_metrics[0]
+            .metrics[0]
+            .data.data_points
+        )
+        self.assertEqual(len(data_points), 2)
+        self.assertEqual(
+            data_points[0].time_unix_nano, data_points[1].time_unix_nano
+        )
+
+    def test_evicted_series_are_dropped(self):
+        reader = InMemoryMetricReader(incremental_collection=True)
+        meter_provider = MeterProvider(
+            metric_readers=[reader],
+            views=[View(instrument_name="testcounter", series_ttl_millis=50)],
+        )
+        counter = meter_provider.get_meter("testmeter").create_counter(
+            "testcounter"
+        )
+        state = IncrementalMetricsState(series_ttl_millis=50)
+
+        counter.add(1, {"a": 1})
+        counter.add(1, {"a": 2})
+        state.update(reader.get_metrics_data())
+        sleep(0.1)
+        counter.add(1, {"a": 2})
+
+        # the view evicts the series of a=1, the state drops its data point
+        self.assertEqual(
+            _get_values(state.update(reader.get_metrics_data())),
+            {("testcounter", 2): 2},
+        )
+
+    def test_delta_metrics_are_not_kept(self):
+        reader = InMemoryMetricReader(
+            preferred_temporality={Counter: AggregationTemporality.DELTA},
+            incremental_collection=True,
+        )
+        meter_provider = MeterProvider(metric_readers=[reader])
+        meter = meter_provider.get_meter("testmeter")
+        counter = meter.create_counter("testcounter")
+        up_down_counter = meter.create_up_down_counter("testupdowncounter")
+        state = IncrementalMetricsState()
+
+        counter.add(1, {"a": 1})
+        up_down_counter.add(1, {"a": 1})
+        self.assertEqual(
+            _get_values(state.update(reader.get_metrics_data())),
+            {("testcounter", 1): 1, ("testupdowncounter", 1): 1},
+        )
+
+        up_down_counter.add(1, {"a": 2})
+        self.assertEqual(
+            _get_values(state.update(reader.get_metrics_data())),
+            {("testupdowncounter", 1): 1, ("testupdowncounter", 2): 1},
+        )
+
+    def test_default_collects_every_series(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader])
+        counter = meter_provider.get_meter("testmeter").create_counter(
+            "testcounter"
+        )
+
+        counter.add(1, {"a": 1})
+        counter.add(1, {"a": 2})
+        reader.get_metrics_data()
+        counter.add(1, {"a": 1})
+
+        self.assertEqual(
+            _get_values(reader.get_metrics_data()),
+            {("testcounter", 1): 2, ("testcounter", 2): 1},
+        )
@@ -0,0 +1,211 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from time import sleep
+from unittest import TestCase
+
+from opentelemetry.sdk.metrics import Counter, Histogram, MeterProvider
+from opentelemetry.sdk.metrics.export import (
+    AggregationTemporality,
+    InMemoryMetricReader,
+)
+from opentelemetry.sdk.metrics.view import (
+    ExplicitBucketHistogramAggregation,
+    ExponentialBucketHistogramAggregation,
+    View,
+)
+
+
+def _get_data_points(reader):
+    metrics_data = reader.get_metrics_data()
+    if metrics_data is None:
+        return {}
+    return {
+        metric.name: list(metric.data.data_points)
+        for metric in metrics_data.resource_metrics[0].scope_metrics[0].metrics
+    }
+
+
+class TestSharedAggregation(TestCase):
+    def setUp(self):
+        self.delta_reader = InMemoryMetricReader(
+            preferred_temporality={
+                Counter: AggregationTemporality.DELTA,
+                Histogram: AggregationTemporality.DELTA,
+            }
+        )
+        self.cumulative_reader = InMemoryMetricReader()
+
+    def test_readers_with_different_temporalities(self):
+        meter_provider = MeterProvider(
+            metric_readers=[self.delta_reader, self.cumulative_reader]
+        )
+        meter = meter_provider.get_meter("testmeter")
+        counter = meter.create_counter("testcounter")
+        histogram = meter.create_histogram("testhistogram")
+
+        counter.add(1, {"a": 1})
+        histogram.record(2, {"a": 1})
+
+        for reader in (self.delta_reader, self.cumulative_reader):
+            data_points = _get_data_points(reader)
+            self.assertEqual(data_points["testcounter"][0].value, 1)
+            self.assertEqual(data_points["testhistogram"][0].count, 1)
+            self.assertEqual(data_points["testhistogram"][0].sum, 2)
+
+        counter.add(2, {"a": 1})
+        histogram.record(3, {"a": 1})
+        histogram.record(7, {"a": 1})
+
+        data_points = _get_data_points(self.delta_reader)
+        self.assertEqual(data_points["testcounter"][0].value, 2)
+        self.assertEqual(data_points["testhistogram"][0].count, 2)
+        self.assertEqual(data_points["testhistogram"][0].sum, 10)
+
+        counter.add(4, {"a": 1})
+
+        data_points = _get_data_points(self.cumulative_reader)
+        self.assertEqual(data_points["testcounter"][0].value, 7)
+        self.assertEqual(data_points["testhistogram"][0].count, 3)
+        self.assertEqual(data_points["testhistogram"][0].sum, 12)
+        self.assertEqual(data_points["testhistogram"][0].min, 2)
+        self.assertEqual(data_points["testhistogram"][0].max, 7)
+
+        data_points = _get_data_points(self.delta_reader)
+        self.assertEqual(data_points["testcounter"][0].value, 4)
+        self.assertNotIn("testhistogram", data_points)
+
+    def test_measurements_are_aggregated_once(self):
+        meter_provider = MeterProvider(
+            metric_readers=[self.delta_reader, self.cumulative_reader]
+        )
+        counter = meter_provider.get_meter("testmeter").create_counter(
+            "testcounter"
+        )
+
+        bound_counter = counter.bind({"a": 1})
+        # pylint: disable=protected-access
+        self.assertEqual(len(bound_counter._aggregations), 1)
+
+        bound_counter.add(1)
+        counter.add(1, {"a": 1})
+
+        for reader in (self.delta_reader, self.cumulative_reader):
+            self.assertEqual(
+                _get_data_points(reader)["testcounter"][0].value, 2
+            )
+
+    def test_readers_with_different_aggregations_are_not_shared(self):
+        reader = InMemoryMetricReader(
+            preferred_aggregation={
+                Histogram: ExplicitBucketHistogramAggregation(
+                    boundaries=(1.0, 10.0)
+                )
+            }
+        )
+        meter_provider = MeterProvider(
+            metric_readers=[self.cumulative_reader, reader]
+        )
+        histogram = meter_provider.get_meter("testmeter").create_histogram(
+            "testhistogram"
+        )
+
+        bound_histogram = histogram.bind({"a": 1})
+        # pylint: disable=protected-access
+        self.assertEqual(len(bound_histogram._aggregations), 2)
+
+        bound_histogram.record(5)
+
+        self.assertEqual(
+            len(
+                _get_data_points(self.cumulative_reader)["testhistogram"][
+                    0
+                ].bucket_counts
+            ),
+            16,
+        )
+        self.assertEqual(
+            _get_data_points(reader)["testhistogram"][0].bucket_counts,
+            (0, 1, 0),
+        )
+
+    def test_exponential_histogram_is_aggregated_by_every_reader(self):
+        meter_provider = MeterProvider(
+            metric_readers=[self.delta_reader, self.cumulative_reader],
+            views=[
+                View(
+                    instrument_name="testhistogram",
+                    aggregation=ExponentialBucketHistogramAggregation(),
+                )
+            ],
+        )
+        histogram = meter_provider.get_meter("testmeter").create_histogram(
+            "testhistogram"
+        )
+
+        histogram.record(1, {"a": 1})
+        histogram.record(2, {"a": 1})
+
+        for reader in (self.delta_reader, self.cumulative_reader):
+            data_point = _get_data_points(reader)["testhistogram"][0]
+            self.assertEqual(data_point.count, 2)
+            self.assertEqual(data_point.sum, 3)
+
+    def test_idle_series_are_evicted(self):
+        meter_provider = MeterProvider(
+            metric_readers=[self.delta_reader, self.cumulative_reader]
+        )
+        counter = meter_provider.get_meter("testmeter").create_counter(
+            "testcounter"
+        )
+
+        bound_counter = counter.bind({"a": 1})
+        bound_counter.add(1)
+        _get_data_points(self.delta_reader)
+        # Nothing was recorded since the last collection, the shared
+        # aggregation is evicted and replaced on the next measurement.
+        _get_data_points(self.delta_reader)
+        bound_counter.add(2)
+
+        self.assertEqual(
+            _get_data_points(self.delta_reader)["testcounter"][0].value, 2
+        )
+        self.assertEqual(
+            _get_data_points(self.cumulative_reader)["testcounter"][0].value,
+            3,
+        )
+
+    def test_cumulative_start_time(self):
+        elapsed = []
+        for metric_readers in (
+            [InMemoryMetricReader()],
+            [self.delta_reader, self.cumulative_reader],
+        ):
+            counter = (
+                MeterProvider(metric_readers=metric_readers)
+                .get_meter("testmeter")
+                .create_counter("testcounter")
+            )
+            counter.add(1, {"a": 1})
+            sleep(0.1)
+
+            data_point = _get_data_points(metric_readers[-1])["testcounter"][0]
+            elapsed.append(
+                data_point.time_unix_nano - data_point.start_time_unix_nano
+            )
+
+        # With one reader or with a shared aggregation, the first cumulative
+        # data point starts when the counter is first used.
+        for elapsed_nanos in elapsed:
+            self.assertGreaterEqual(elapsed_nanos, 100 * 10**6)
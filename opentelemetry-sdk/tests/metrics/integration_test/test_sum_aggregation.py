@@ -154,6 +154,43 @@ class TestSumAggregation(TestCase):
         for metrics_data in results:
             self.assertIsNone(metrics_data)
 
+    def test_asynchronous_delta_temporality_skipped_collection(self):
+        observations = iter([[100], [], [150], [160]])
+
+        def observable_counter_callback(callback_options):
+            for value in next(observations):
+                yield Observation(value)
+
+        reader = InMemoryMetricReader(
+            preferred_temporality={
+                ObservableCounter: AggregationTemporality.DELTA
+            },
+        )
+        provider = MeterProvider(metric_readers=[reader])
+        provider.get_meter("name", "version").create_observable_counter(
+            "observable_counter", [observable_counter_callback]
+        )
+
+        values = []
+        for _ in range(4):
+            metrics_data = reader.get_metrics_data()
+            if metrics_data is None:
+                values.append(None)
+                continue
+            values.append(
+                [
+                    data_point.value
+                    for data_point in metrics_data.resource_metrics[0]
+                    .scope_metrics[0]
+                    .metrics[0]
+                    .data.data_points
+                ]
+            )
+
+        # the series is not evicted when a collection observes nothing, the
+        # next delta is computed from the last observation
+        self.assertEqual(values, [[100], None, [50], [10]])
+
     @mark.skipif(
         system() != "Linux",
         reason=(
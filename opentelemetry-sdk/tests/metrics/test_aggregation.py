@@ -13,14 +13,18 @@
 # limitations under the License.
 
 from math import inf
+from threading import Thread
 from time import sleep
 from typing import Union
-from unittest import TestCase
-from unittest.mock import Mock
+from unittest import TestCase, skipIf
+from unittest.mock import Mock, patch
 
+from opentelemetry.sdk.metrics._internal._batch import _to_batch, numpy
 from opentelemetry.sdk.metrics._internal.aggregation import (
     _ExplicitBucketHistogramAggregation,
     _LastValueAggregation,
+    _PerThreadExplicitBucketHistogramAggregation,
+    _PerThreadSumAggregation,
     _SumAggregation,
 )
 from opentelemetry.sdk.metrics._internal.instrument import (
@@ -193,6 +197,93 @@ class TestSynchronousSumAggregation(TestCase):
         )
         self.assertIsNone(third_sum)
 
+    def test_aggregate_batch(self):
+        sum_aggregation = _SumAggregation(
+            Mock(), True, AggregationTemporality.DELTA, 0
+        )
+
+        self.assertTrue(sum_aggregation.aggregate_batch([1, 2, 3.5]))
+        self.assertTrue(sum_aggregation.aggregate_batch(_to_batch(range(100))))
+        self.assertEqual(sum_aggregation._current_value, 4956.5)
+
+    def test_evict_if_idle(self):
+        sum_aggregation = _SumAggregation(
+            Mock(), True, AggregationTemporality.DELTA, 0
+        )
+
+        self.assertTrue(sum_aggregation.aggregate(measurement(1)))
+        self.assertFalse(sum_aggregation._evict_if_idle())
+
+        sum_aggregation.collect(AggregationTemporality.DELTA, 1)
+        self.assertTrue(sum_aggregation._evict_if_idle())
+        self.assertFalse(sum_aggregation.aggregate(measurement(1)))
+        self.assertIsNone(
+            sum_aggregation.collect(AggregationTemporality.DELTA, 2)
+        )
+
+
+class TestPerThreadSumAggregation(TestCase):
+    def test_aggregate_from_threads(self):
+        sum_aggregation = _PerThreadSumAggregation(
+            {}, True, AggregationTemporality.DELTA, 0
+        )
+
+        def record():
+            for _ in range(1000):
+                sum_aggregation.aggregate(measurement(1))
+            sum_aggregation.aggregate_batch([2, 3])
+
+        threads = [Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        sum_aggregation.aggregate(measurement(1))
+
+        self.assertEqual(len(list(sum_aggregation._cells)), 9)
+        self.assertEqual(
+            sum_aggregation.collect(AggregationTemporality.DELTA, 1).value,
+            8 * 1005 + 1,
+        )
+        # the cells of the threads that ended are dropped once collected
+        self.assertEqual(len(list(sum_aggregation._cells)), 1)
+        self.assertIsNone(
+            sum_aggregation.collect(AggregationTemporality.DELTA, 2)
+        )
+
+    def test_collect_cumulative(self):
+        sum_aggregation = _PerThreadSumAggregation(
+            {}, True, AggregationTemporality.DELTA, 0
+        )
+
+        sum_aggregation.aggregate(measurement(1))
+        self.assertEqual(
+            sum_aggregation.collect(
+                AggregationTemporality.CUMULATIVE, 1
+            ).value,
+            1,
+        )
+        sum_aggregation.aggregate(measurement(2))
+        self.assertEqual(
+            sum_aggregation.collect(
+                AggregationTemporality.CUMULATIVE, 2
+            ).value,
+            3,
+        )
+
+    def test_evict_if_idle(self):
+        sum_aggregation = _PerThreadSumAggregation(
+            {}, True, AggregationTemporality.DELTA, 0
+        )
+
+        sum_aggregation.aggregate(measurement(1))
+        self.assertFalse(sum_aggregation._evict_if_idle())
+
+        sum_aggregation.collect(AggregationTemporality.DELTA, 1)
+        self.assertTrue(sum_aggregation._evict_if_idle())
+        self.assertFalse(sum_aggregation.aggregate(measurement(1)))
+        self.assertFalse(sum_aggregation.aggregate_batch([1]))
+
 
 class TestLastValueAggregation(TestCase):
     def test_aggregate(self):
@@ -378,6 +469,145 @@ class TestExplicitBucketHistogramAggregation(TestCase):
             second_histogram.time_unix_nano, first_histogram.time_unix_nano
         )
 
+    def _assert_aggregate_batch(self, values, batch):
+        explicit_bucket_histogram_aggregation = (
+            _ExplicitBucketHistogramAggregation({}, 0, boundaries=[0, 5])
+        )
+        for value in values:
+            explicit_bucket_histogram_aggregation.aggregate(measurement(value))
+        batch_explicit_bucket_histogram_aggregation = (
+            _ExplicitBucketHistogramAggregation({}, 0, boundaries=[0, 5])
+        )
+        self.assertTrue(
+            batch_explicit_bucket_histogram_aggregation.aggregate_batch(batch)
+        )
+
+        self.assertEqual(
+            batch_explicit_bucket_histogram_aggregation.collect(
+                AggregationTemporality.DELTA, 1
+            ),
+            explicit_bucket_histogram_aggregation.collect(
+                AggregationTemporality.DELTA, 1
+            ),
+        )
+
+    def test_aggregate_batch(self):
+        values = [-1, 0, 0.5, 5, 5.5, 7, 100] * 20
+
+        self._assert_aggregate_batch(values, values)
+        self._assert_aggregate_batch(values, tuple(values))
+
+    @skipIf(numpy is None, "NumPy is not installed")
+    def test_aggregate_batch_numpy(self):
+        values = [-1, 0, 0.5, 5, 5.5, 7, 100] * 20
+
+        self.assertIsInstance(_to_batch(values), numpy.ndarray)
+        self._assert_aggregate_batch(values, _to_batch(values))
+        self._assert_aggregate_batch(
+            list(range(-10, 10)), numpy.arange(-10, 10)
+        )
+
+    def test_evict_if_idle(self):
+        explicit_bucket_histogram_aggregation = (
+            _ExplicitBucketHistogramAggregation(Mock(), 0)
+        )
+
+        self.assertTrue(
+            explicit_bucket_histogram_aggregation.aggregate(measurement(1))
+        )
+        self.assertFalse(
+            explicit_bucket_histogram_aggregation._evict_if_idle()
+        )
+
+        explicit_bucket_histogram_aggregation.collect(
+            AggregationTemporality.DELTA, 1
+        )
+        self.assertTrue(explicit_bucket_histogram_aggregation._evict_if_idle())
+        self.assertFalse(
+            explicit_bucket_histogram_aggregation.aggregate(measurement(1))
+        )
+
+    def test_aggregate_during_eviction(self):
+        explicit_bucket_histogram_aggregation = (
+            _ExplicitBucketHistogramAggregation(Mock(), 0)
+        )
+        is_idle = explicit_bucket_histogram_aggregation._is_idle
+        results = []
+        threads = []
+
+        def aggregate_while_evicting():
+            # a measurement recorded after the aggregation was found idle
+            # but before it is marked as evicted
+            thread = Thread(
+                target=lambda: results.append(
+                    explicit_bucket_histogram_aggregation.aggregate(
+                        measurement(1)
+                    )
+                )
+            )
+            threads.append(thread)
+            thread.start()
+            thread.join(0.1)
+            return is_idle()
+
+        with patch.object(
+            explicit_bucket_histogram_aggregation,
+            "_is_idle",
+            side_effect=aggregate_while_evicting,
+        ):
+            self.assertTrue(
+                explicit_bucket_histogram_aggregation._evict_if_idle()
+            )
+        threads[0].join()
+
+        # the measurement is not aggregated into the evicted aggregation
+        self.assertEqual(results, [False])
+
+    def test_per_thread(self):
+        values = [-1, 0, 0.5, 5, 5.5, 7, 100]
+        explicit_bucket_histogram_aggregation = (
+            _ExplicitBucketHistogramAggregation({}, 0, boundaries=[0, 5])
+        )
+        per_thread_explicit_bucket_histogram_aggregation = (
+            _PerThreadExplicitBucketHistogramAggregation(
+                {}, 0, boundaries=[0, 5]
+            )
+        )
+
+        def record():
+            for value in values:
+                per_thread_explicit_bucket_histogram_aggregation.aggregate(
+                    measurement(value)
+                )
+            per_thread_explicit_bucket_histogram_aggregation.aggregate_batch(
+                values
+            )
+
+        threads = [Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for value in values * 8:
+            explicit_bucket_histogram_aggregation.aggregate(measurement(value))
+
+        self.assertEqual(
+            per_thread_explicit_bucket_histogram_aggregation.collect(
+                AggregationTemporality.DELTA, 1
+            ),
+            explicit_bucket_histogram_aggregation.collect(
+                AggregationTemporality.DELTA, 1
+            ),
+        )
+        self.assertTrue(
+            per_thread_explicit_bucket_histogram_aggregation._evict_if_idle()
+        )
+        self.assertFalse(
+            per_thread_explicit_bucket_histogram_aggregation.aggregate(
+                measurement(1)
+            )
+        )
+
     def test_boundaries(self):
         self.assertEqual(
             _ExplicitBucketHistogramAggregation(Mock(), 0)._boundaries,
@@ -414,6 +644,12 @@ class TestAggregationFactory(TestCase):
         )
         aggregation2 = factory._create_aggregation(counter, Mock(), 0)
         self.assertNotEqual(aggregation, aggregation2)
+        self.assertIsInstance(
+            SumAggregation(per_thread=True)._create_aggregation(
+                counter, Mock(), 0
+            ),
+            _PerThreadSumAggregation,
+        )
 
         counter = _UpDownCounter("name", Mock(), Mock())
         factory = SumAggregation()
@@ -450,6 +686,12 @@ class TestAggregationFactory(TestCase):
         self.assertEqual(aggregation._boundaries, (0.0, 5.0))
         aggregation2 = factory._create_aggregation(histo, Mock(), 0)
         self.assertNotEqual(aggregation, aggregation2)
+        self.assertIsInstance(
+            ExplicitBucketHistogramAggregation(
+                per_thread=True
+            )._create_aggregation(histo, Mock(), 0),
+            _PerThreadExplicitBucketHistogramAggregation,
+        )
 
     def test_last_value_factory(self):
         counter = _Counter("name", Mock(), Mock())
@@ -0,0 +1,97 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from math import isnan, nan
+from unittest import TestCase, skipIf
+
+from opentelemetry.sdk.metrics._internal._batch import (
+    _bucket_counts,
+    _min_max,
+    _sum,
+    _to_list,
+    _validate,
+    numpy,
+)
+
+
+@skipIf(numpy is None, "NumPy is not installed")
+class TestBatch(TestCase):
+    """The NumPy and the plain Python helpers give the same results, float
+    sums only up to rounding."""
+
+    def _assert_same_results(self, amounts, non_negative):
+        list_batch, list_dropped = _validate(list(amounts), non_negative)
+        array_batch, array_dropped = _validate(
+            numpy.asarray(amounts), non_negative
+        )
+
+        self.assertIsInstance(array_batch, numpy.ndarray)
+        self.assertEqual(list_dropped, array_dropped)
+        self.assertEqual(_to_list(list_batch), _to_list(array_batch))
+        if any(isinstance(amount, float) for amount in amounts):
+            self.assertAlmostEqual(_sum(list_batch), _sum(array_batch))
+        else:
+            self.assertEqual(_sum(list_batch), _sum(array_batch))
+        if len(list_batch):
+            self.assertEqual(_min_max(list_batch), _min_max(array_batch))
+        self.assertEqual(
+            _bucket_counts((0.0, 5.0, 10.0), list_batch),
+            _bucket_counts((0.0, 5.0, 10.0), array_batch),
+        )
+        return list_batch, list_dropped
+
+    def test_floats(self):
+        for non_negative in (False, True):
+            with self.subTest(non_negative=non_negative):
+                self._assert_same_results(
+                    [-1.5, 0.0, 2.5, 5.0, 7.5, 12.0], non_negative
+                )
+
+    def test_float_sums_round_differently(self):
+        self._assert_same_results([0.1] * 1000, False)
+
+    def test_nan_dropped(self):
+        for non_negative in (False, True):
+            with self.subTest(non_negative=non_negative):
+                batch, dropped = self._assert_same_results(
+                    [1.0, nan, 6.0, nan], non_negative
+                )
+                self.assertTrue(dropped)
+                self.assertFalse(any(isnan(amount) for amount in batch))
+                self.assertEqual(_to_list(batch), [1.0, 6.0])
+
+    def test_negative_dropped(self):
+        batch, dropped = self._assert_same_results([3, -1, 0, -7], True)
+
+        self.assertTrue(dropped)
+        self.assertEqual(_to_list(batch), [3, 0])
+
+    def test_nothing_dropped(self):
+        batch, dropped = self._assert_same_results([3, -1, 0, -7], False)
+
+        self.assertFalse(dropped)
+        self.assertEqual(_to_list(batch), [3, -1, 0, -7])
+
+    def test_int_sum_does_not_overflow(self):
+        amounts = [2**62, 2**62, 2**62]
+
+        self.assertEqual(_sum(numpy.asarray(amounts)), 3 * 2**62)
+        self._assert_same_results(amounts, True)
+        self._assert_same_results([-(2**62)] * 3, False)
+
+    def test_empty(self):
+        batch, dropped = self._assert_same_results([], True)
+
+        self.assertFalse(dropped)
+        self.assertEqual(_to_list(batch), [])
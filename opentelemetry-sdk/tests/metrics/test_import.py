@@ -25,6 +25,9 @@ class TestImport(TestCase):
 
         try:
             from opentelemetry.sdk.metrics import (  # noqa: F401
+                BoundCounter,
+                BoundHistogram,
+                BoundUpDownCounter,
                 Counter,
                 Histogram,
                 Meter,
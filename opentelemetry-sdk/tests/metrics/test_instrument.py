@@ -55,6 +55,38 @@ class TestCounter(TestCase):
             counter.add(-1.0)
         mc.consume_measurement.assert_not_called()
 
+    def test_bind(self):
+        mc = Mock()
+        aggregation = Mock()
+        mc.get_aggregations.return_value = [aggregation]
+        counter = _Counter("name", Mock(), mc)
+        attributes = {"key": "value"}
+        bound_counter = counter.bind(attributes)
+        mc.get_aggregations.assert_called_once_with(counter, attributes)
+
+        bound_counter.add(1.0)
+        bound_counter.add(2)
+        mc.consume_measurement.assert_not_called()
+        self.assertEqual(
+            aggregation.aggregate.call_args_list[-1].args[0],
+            Measurement(2, counter, attributes),
+        )
+        self.assertEqual(aggregation.aggregate.call_count, 2)
+
+        with self.assertLogs(level=WARNING):
+            bound_counter.add(-1.0)
+        self.assertEqual(aggregation.aggregate.call_count, 2)
+
+    def test_add_batch(self):
+        mc = Mock()
+        aggregation = Mock()
+        mc.get_aggregations.return_value = [aggregation]
+        counter = _Counter("name", Mock(), mc)
+
+        with self.assertLogs(level=WARNING):
+            counter.add_batch([1, -1.0, 2])
+        aggregation.aggregate_batch.assert_called_once_with([1, 2])
+
     def test_disallow_direct_counter_creation(self):
         with self.assertRaises(TypeError):
             # pylint: disable=abstract-class-instantiated
@@ -74,6 +106,32 @@ class TestUpDownCounter(TestCase):
         counter.add(-1.0)
         mc.consume_measurement.assert_called_once()
 
+    def test_bind(self):
+        mc = Mock()
+        aggregation = Mock()
+        mc.get_aggregations.return_value = [aggregation]
+        counter = _UpDownCounter("name", Mock(), mc)
+        bound_counter = counter.bind()
+        mc.get_aggregations.assert_called_once_with(counter, None)
+
+        bound_counter.add(-1.0)
+        aggregation.aggregate.assert_called_once_with(
+            Measurement(-1.0, counter, None)
+        )
+
+    def test_add_batch(self):
+        mc = Mock()
+        aggregation = Mock()
+        mc.get_aggregations.return_value = [aggregation]
+        counter = _UpDownCounter("name", Mock(), mc)
+
+        counter.bind().add_batch([1, -1.0, 2])
+        aggregation.aggregate_batch.assert_called_once_with([1, -1.0, 2])
+
+        with self.assertLogs(level=WARNING):
+            counter.bind().add_batch([1, float("nan"), 2])
+        aggregation.aggregate_batch.assert_called_with([1, 2])
+
     def test_disallow_direct_up_down_counter_creation(self):
         with self.assertRaises(TypeError):
             # pylint: disable=abstract-class-instantiated
@@ -366,6 +424,41 @@ class TestHistogram(TestCase):
             hist.record(-1.0)
         mc.consume_measurement.assert_not_called()
 
+    def test_bind(self):
+        mc = Mock()
+        aggregation = Mock()
+        mc.get_aggregations.return_value = [aggregation]
+        hist = _Histogram("name", Mock(), mc)
+        bound_hist = hist.bind({"key": "value"})
+
+        bound_hist.record(1.0)
+        aggregation.aggregate.assert_called_once_with(
+            Measurement(1.0, hist, {"key": "value"})
+        )
+        mc.consume_measurement.assert_not_called()
+
+        with self.assertLogs(level=WARNING):
+            bound_hist.record(-1.0)
+        aggregation.aggregate.assert_called_once()
+
+    def test_record_batch(self):
+        mc = Mock()
+        aggregation = Mock()
+        mc.get_aggregations.return_value = [aggregation]
+        hist = _Histogram("name", Mock(), mc)
+
+        hist.record_batch((amount for amount in [1, 2.5]), {"key": "value"})
+        mc.get_aggregations.assert_called_once_with(hist, {"key": "value"})
+        aggregation.aggregate_batch.assert_called_once_with([1, 2.5])
+
+        with self.assertLogs(level=WARNING):
+            hist.record_batch([-1, 3])
+        aggregation.aggregate_batch.assert_called_with([3])
+
+        hist.record_batch([])
+        self.assertEqual(aggregation.aggregate_batch.call_count, 2)
+        mc.consume_measurement.assert_not_called()
+
     def test_disallow_direct_histogram_creation(self):
         with self.assertRaises(TypeError):
             # pylint: disable=abstract-class-instantiated
@@ -12,11 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+from logging import WARNING
+from multiprocessing import get_context
 from sys import version_info
-from time import sleep
-from unittest import TestCase
+from threading import current_thread
+from time import sleep, time
+from unittest import TestCase, skipUnless
 from unittest.mock import MagicMock, Mock, patch
 
+from opentelemetry.sdk.metrics import MetricsTimeoutError
 from opentelemetry.sdk.metrics._internal.measurement_consumer import (
     MeasurementConsumer,
     SynchronousMeasurementConsumer,
@@ -104,14 +109,15 @@ class TestSynchronousMeasurementConsumer(TestCase):
         )
         async_instrument_mocks = [MagicMock() for _ in range(5)]
         for i_mock in async_instrument_mocks:
-            i_mock.callback.return_value = [Mock()]
+            i_mock._callbacks = [Mock()]
+            i_mock._run_callback.return_value = [Mock()]
             consumer.register_asynchronous_instrument(i_mock)
 
         consumer.collect(reader_mock)
 
         # it should call async instruments
         for i_mock in async_instrument_mocks:
-            i_mock.callback.assert_called_once()
+            i_mock._run_callback.assert_called_once()
 
         # it should pass measurements to reader storage
         self.assertEqual(
@@ -132,18 +138,181 @@ class TestSynchronousMeasurementConsumer(TestCase):
 
         def sleep_1(*args, **kwargs):
             sleep(1)
+            return [Mock()]
 
         consumer.register_asynchronous_instrument(
-            Mock(**{"callback.side_effect": sleep_1})
+            Mock(
+                _callbacks=[Mock()],
+                **{"_run_callback.side_effect": sleep_1},
+            )
         )
 
-        with self.assertRaises(Exception) as error:
+        with self.assertRaises(MetricsTimeoutError) as error:
             consumer.collect(reader_mock, timeout_millis=10)
 
         self.assertIn(
             "Timed out while executing callback", error.exception.args[0]
         )
 
+    def test_collect_runs_callbacks_in_collecting_thread(
+        self, MockMetricReaderStorage
+    ):
+        reader_mock = Mock()
+        MockMetricReaderStorage.return_value = Mock()
+        consumer = SynchronousMeasurementConsumer(
+            SdkConfiguration(
+                resource=Mock(),
+                metric_readers=[reader_mock],
+                views=Mock(),
+            )
+        )
+        threads = []
+
+        def record_thread(*args, **kwargs):
+            threads.append(current_thread())
+            return []
+
+        for _ in range(2):
+            consumer.register_asynchronous_instrument(
+                Mock(
+                    _callbacks=[Mock()],
+                    **{"_run_callback.side_effect": record_thread},
+                )
+            )
+
+        consumer.collect(reader_mock)
+
+        self.assertEqual(threads, [current_thread()] * 2)
+        self.assertIsNone(consumer._callback_executor)
+
+    @patch.dict(
+        "os.environ", {"OTEL_PYTHON_METRICS_CALLBACK_MAX_WORKERS": "2"}
+    )
+    def test_collect_timeout_concurrent(self, MockMetricReaderStorage):
+        """Callbacks that do not finish before the deadline are skipped, the
+        measurements of the others are collected"""
+        reader_mock = Mock()
+        reader_storage_mock = Mock()
+        MockMetricReaderStorage.return_value = reader_storage_mock
+        consumer = SynchronousMeasurementConsumer(
+            SdkConfiguration(
+                resource=Mock(),
+                metric_readers=[reader_mock],
+                views=Mock(),
+            )
+        )
+
+        def sleep_1(*args, **kwargs):
+            sleep(1)
+            return [Mock()]
+
+        slow_callback = Mock(__qualname__="slow_callback")
+        consumer.register_asynchronous_instrument(
+            Mock(
+                _callbacks=[slow_callback],
+                **{"_run_callback.side_effect": sleep_1},
+            )
+        )
+        consumer.register_asynchronous_instrument(
+            Mock(
+                _callbacks=[Mock()],
+                **{"_run_callback.return_value": [Mock()]},
+            )
+        )
+
+        with self.assertLogs(level=WARNING) as logs:
+            result = consumer.collect(reader_mock, timeout_millis=100)
+
+        self.assertIs(result, reader_storage_mock.collect.return_value)
+        self.assertEqual(
+            len(reader_storage_mock.consume_measurement.mock_calls), 1
+        )
+        self.assertIn("slow_callback", logs.output[0])
+        self.assertIn("did not finish before its deadline", logs.output[0])
+
+        # the callback is not run again while its previous run is running
+        with self.assertLogs(level=WARNING) as logs:
+            consumer.collect(reader_mock, timeout_millis=100)
+
+        self.assertIn("has not finished", logs.output[0])
+        consumer.shutdown()
+
+    @patch.dict(
+        "os.environ",
+        {
+            "OTEL_PYTHON_METRICS_CALLBACK_MAX_WORKERS": "2",
+            "OTEL_PYTHON_METRICS_CALLBACK_TIMEOUT": "100",
+        },
+    )
+    def test_collect_callback_timeout(self, MockMetricReaderStorage):
+        reader_mock = Mock()
+        reader_storage_mock = Mock()
+        MockMetricReaderStorage.return_value = reader_storage_mock
+        consumer = SynchronousMeasurementConsumer(
+            SdkConfiguration(
+                resource=Mock(),
+                metric_readers=[reader_mock],
+                views=Mock(),
+            )
+        )
+
+        def sleep_1(*args, **kwargs):
+            sleep(1)
+            return [Mock()]
+
+        consumer.register_asynchronous_instrument(
+            Mock(
+                _callbacks=[Mock()],
+                **{"_run_callback.side_effect": sleep_1},
+            )
+        )
+
+        start = time()
+        with self.assertLogs(level=WARNING):
+            consumer.collect(reader_mock)
+
+        self.assertLess(time() - start, 1)
+        reader_storage_mock.consume_measurement.assert_not_called()
+        consumer.shutdown()
+
+    @patch.dict(
+        "os.environ", {"OTEL_PYTHON_METRICS_CALLBACK_MAX_WORKERS": "3"}
+    )
+    def test_collect_runs_callbacks_concurrently(
+        self, MockMetricReaderStorage
+    ):
+        reader_mock = Mock()
+        reader_storage_mock = Mock()
+        MockMetricReaderStorage.return_value = reader_storage_mock
+        consumer = SynchronousMeasurementConsumer(
+            SdkConfiguration(
+                resource=Mock(),
+                metric_readers=[reader_mock],
+                views=Mock(),
+            )
+        )
+
+        def sleep_half(*args, **kwargs):
+            sleep(0.5)
+            return [Mock()]
+
+        for _ in range(3):
+            consumer.register_asynchronous_instrument(
+                Mock(
+                    _callbacks=[Mock()],
+                    **{"_run_callback.side_effect": sleep_half},
+                )
+            )
+
+        start = time()
+        consumer.collect(reader_mock)
+
+        self.assertLess(time() - start, 1.5)
+        self.assertEqual(
+            len(reader_storage_mock.consume_measurement.mock_calls), 3
+        )
+        consumer.shutdown()
+
     @patch(
         "opentelemetry.sdk.metrics._internal."
         "measurement_consumer.CallbackOptions"
@@ -162,29 +331,62 @@ class TestSynchronousMeasurementConsumer(TestCase):
             )
         )
 
-        def sleep_1(*args, **kwargs):
-            sleep(1)
-            return []
+        for _ in range(2):
+            consumer.register_asynchronous_instrument(
+                Mock(
+                    _callbacks=[Mock()],
+                    **{"_run_callback.return_value": []},
+                )
+            )
 
-        consumer.register_asynchronous_instrument(
-            Mock(**{"callback.side_effect": sleep_1})
+        consumer.collect(reader_mock, timeout_millis=1000)
+
+        for mock_call in mock_callback_options.mock_calls:
+            if version_info < (3, 8):
+                timeout_millis = mock_call[2]["timeout_millis"]
+            else:
+                timeout_millis = mock_call.kwargs["timeout_millis"]
+            self.assertLessEqual(timeout_millis, 1000)
+        self.assertEqual(len(mock_callback_options.mock_calls), 2)
+
+    @skipUnless(hasattr(os, "fork"), "needs *nix")
+    @patch.dict(
+        "os.environ", {"OTEL_PYTHON_METRICS_CALLBACK_MAX_WORKERS": "2"}
+    )
+    def test_collect_after_fork(self, MockMetricReaderStorage):
+        reader_mock = Mock()
+        reader_storage_mock = Mock()
+        MockMetricReaderStorage.return_value = reader_storage_mock
+        consumer = SynchronousMeasurementConsumer(
+            SdkConfiguration(
+                resource=Mock(),
+                metric_readers=[reader_mock],
+                views=Mock(),
+            )
         )
         consumer.register_asynchronous_instrument(
-            Mock(**{"callback.side_effect": sleep_1})
+            Mock(
+                _callbacks=[Mock()],
+                **{"_run_callback.return_value": [Mock()]},
+            )
         )
-
         consumer.collect(reader_mock)
 
-        if version_info < (3, 8):
-            callback_options_time_call = mock_callback_options.mock_calls[-1][
-                2
-            ]["timeout_millis"]
-        else:
-            callback_options_time_call = mock_callback_options.mock_calls[
-                -1
-            ].kwargs["timeout_millis"]
+        def child(conn):
+            # the executor of the parent has no threads in the child
+            reinitialized = consumer._callback_executor is None
+            consumer.collect(reader_mock, timeout_millis=1000)
+            conn.send(
+                reinitialized
+                and len(reader_storage_mock.consume_measurement.mock_calls)
+                == 2
+            )
+            conn.close()
 
-        self.assertLess(
-            callback_options_time_call,
-            10000 * 10**6,
-        )
+        context = get_context("fork")
+        parent_conn, child_conn = context.Pipe()
+        process = context.Process(target=child, args=(child_conn,))
+        process.start()
+        self.assertTrue(parent_conn.recv())
+        process.join()
+        consumer.shutdown()
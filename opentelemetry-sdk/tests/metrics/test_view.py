@@ -123,3 +123,16 @@ class TestView(TestCase):
 
         with self.assertRaises(Exception):
             View(name="name", instrument_name="instrument_name*")
+
+    def test_aggregation_cardinality_limit(self):
+
+        with self.assertRaises(ValueError):
+            View(
+                instrument_name="instrument_name",
+                aggregation_cardinality_limit=0,
+            )
+
+    def test_series_ttl_millis(self):
+
+        with self.assertRaises(ValueError):
+            View(instrument_name="instrument_name", series_ttl_millis=0)
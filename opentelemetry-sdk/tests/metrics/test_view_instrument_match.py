@@ -12,15 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from threading import Event, Thread
 from unittest import TestCase
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
+from opentelemetry.sdk.environment_variables import (
+    OTEL_PYTHON_METRICS_CARDINALITY_LIMIT,
+)
 from opentelemetry.sdk.metrics._internal._view_instrument_match import (
     _ViewInstrumentMatch,
 )
 from opentelemetry.sdk.metrics._internal.aggregation import (
     _DropAggregation,
     _LastValueAggregation,
+    _SumAggregation,
 )
 from opentelemetry.sdk.metrics._internal.instrument import _Counter
 from opentelemetry.sdk.metrics._internal.measurement import Measurement
@@ -318,3 +323,273 @@ class Test_ViewInstrumentMatch(TestCase):
             ],
             _LastValueAggregation,
         )
+
+    def _counter_view_instrument_match(self, view):
+        instrument = _Counter(
+            name="instrument1",
+            instrumentation_scope=Mock(),
+            measurement_consumer=Mock(),
+        )
+        return instrument, _ViewInstrumentMatch(
+            view=view,
+            instrument=instrument,
+            instrument_class_aggregation={_Counter: DefaultAggregation()},
+        )
+
+    def test_cardinality_limit(self):
+        (
+            instrument,
+            view_instrument_match,
+        ) = self._counter_view_instrument_match(
+            View(
+                instrument_name="instrument1", aggregation_cardinality_limit=3
+            )
+        )
+
+        for index in range(2):
+            view_instrument_match.consume_measurement(
+                Measurement(
+                    value=1, instrument=instrument, attributes={"a": index}
+                )
+            )
+        with self.assertLogs(level="WARNING"):
+            for index in range(2, 5):
+                view_instrument_match.consume_measurement(
+                    Measurement(
+                        value=1, instrument=instrument, attributes={"a": index}
+                    )
+                )
+        # attributes seen before the limit was reached keep their data point
+        view_instrument_match.consume_measurement(
+            Measurement(value=1, instrument=instrument, attributes={"a": 0})
+        )
+
+        self.assertEqual(len(view_instrument_match._attributes_aggregation), 3)
+        self.assertIsInstance(
+            view_instrument_match.get_aggregation({"a": 5}), _SumAggregation
+        )
+        self.assertIs(
+            view_instrument_match.get_aggregation({"a": 5}),
+            view_instrument_match.get_aggregation({"a": 6}),
+        )
+
+        data_points = view_instrument_match.collect(
+            AggregationTemporality.CUMULATIVE, 0
+        )
+        self.assertEqual(
+            {
+                frozenset(data_point.attributes.items()): data_point.value
+                for data_point in data_points
+            },
+            {
+                frozenset({("a", 0)}): 2,
+                frozenset({("a", 1)}): 1,
+                frozenset({("otel.metric.overflow", True)}): 3,
+            },
+        )
+
+    @patch.dict("os.environ", {OTEL_PYTHON_METRICS_CARDINALITY_LIMIT: "1"})
+    def test_cardinality_limit_from_environment(self):
+        (
+            instrument,
+            view_instrument_match,
+        ) = self._counter_view_instrument_match(
+            View(instrument_name="instrument1")
+        )
+        self.assertEqual(view_instrument_match._cardinality_limit, 1)
+
+        with self.assertLogs(level="WARNING"):
+            view_instrument_match.consume_measurement(
+                Measurement(
+                    value=1, instrument=instrument, attributes={"a": 1}
+                )
+            )
+        self.assertEqual(
+            list(view_instrument_match._attributes_aggregation),
+            [frozenset({("otel.metric.overflow", True)})],
+        )
+
+        # the view takes precedence over the environment variable
+        _, view_instrument_match = self._counter_view_instrument_match(
+            View(
+                instrument_name="instrument1", aggregation_cardinality_limit=5
+            )
+        )
+        self.assertEqual(view_instrument_match._cardinality_limit, 5)
+
+    @patch.dict(
+        "os.environ", {OTEL_PYTHON_METRICS_CARDINALITY_LIMIT: "invalid"}
+    )
+    def test_invalid_cardinality_limit_from_environment(self):
+        with self.assertLogs(level="WARNING"):
+            _, view_instrument_match = self._counter_view_instrument_match(
+                View(instrument_name="instrument1")
+            )
+        self.assertEqual(view_instrument_match._cardinality_limit, 2000)
+
+    def test_collect_delta_evicts_idle_attributes(self):
+        (
+            instrument,
+            view_instrument_match,
+        ) = self._counter_view_instrument_match(
+            View(instrument_name="instrument1")
+        )
+        view_instrument_match.consume_measurement(
+            Measurement(value=1, instrument=instrument, attributes={"a": 1})
+        )
+        view_instrument_match.consume_measurement(
+            Measurement(value=1, instrument=instrument, attributes={"a": 2})
+        )
+        view_instrument_match.collect(AggregationTemporality.DELTA, 1)
+
+        evicted_aggregation = view_instrument_match.get_aggregation({"a": 2})
+        view_instrument_match.consume_measurement(
+            Measurement(value=1, instrument=instrument, attributes={"a": 1})
+        )
+        data_points = view_instrument_match.collect(
+            AggregationTemporality.DELTA, 2
+        )
+
+        self.assertEqual(len(data_points), 1)
+        self.assertEqual(data_points[0].attributes, {"a": 1})
+        self.assertEqual(
+            list(view_instrument_match._attributes_aggregation),
+            [frozenset({("a", 1)})],
+        )
+
+        # measurements for evicted attributes go to a new aggregation that
+        # starts with the last collection
+        self.assertFalse(evicted_aggregation.aggregate(Mock()))
+        view_instrument_match.consume_measurement(
+            Measurement(value=3, instrument=instrument, attributes={"a": 2})
+        )
+        self.assertIsNot(
+            view_instrument_match.get_aggregation({"a": 2}),
+            evicted_aggregation,
+        )
+        data_points = view_instrument_match.collect(
+            AggregationTemporality.DELTA, 3
+        )
+        data_point = [
+            data_point
+            for data_point in data_points
+            if data_point.attributes == {"a": 2}
+        ][0]
+        self.assertEqual(data_point.value, 3)
+        self.assertEqual(data_point.start_time_unix_nano, 2)
+
+    def test_collect_does_not_block_new_attributes(self):
+        (
+            instrument,
+            view_instrument_match,
+        ) = self._counter_view_instrument_match(
+            View(instrument_name="instrument1")
+        )
+        view_instrument_match.consume_measurement(
+            Measurement(value=1, instrument=instrument, attributes={"a": 1})
+        )
+        aggregation = view_instrument_match.get_aggregation({"a": 1})
+
+        collecting = Event()
+        recorded = Event()
+        collect = aggregation.collect
+
+        def blocking_collect(*args):
+            collecting.set()
+            # measurements with new attributes are recorded while the
+            # collection is in progress
+            self.assertTrue(recorded.wait(5))
+            return collect(*args)
+
+        def record():
+            collecting.wait(5)
+            view_instrument_match.consume_measurement(
+                Measurement(
+                    value=2, instrument=instrument, attributes={"a": 2}
+                )
+            )
+            recorded.set()
+
+        thread = Thread(target=record)
+        thread.start()
+        with patch.object(aggregation, "collect", blocking_collect):
+            data_points = view_instrument_match.collect(
+                AggregationTemporality.DELTA, 1
+            )
+        thread.join()
+
+        self.assertEqual(len(data_points), 1)
+        self.assertEqual(data_points[0].value, 1)
+        # the new attributes are part of the next collection
+        data_points = view_instrument_match.collect(
+            AggregationTemporality.DELTA, 2
+        )
+        self.assertEqual(len(data_points), 1)
+        self.assertEqual(data_points[0].attributes, {"a": 2})
+        self.assertEqual(data_points[0].start_time_unix_nano, 1)
+
+    def test_collect_cumulative_keeps_idle_attributes(self):
+        (
+            instrument,
+            view_instrument_match,
+        ) = self._counter_view_instrument_match(
+            View(instrument_name="instrument1")
+        )
+        view_instrument_match.consume_measurement(
+            Measurement(value=1, instrument=instrument, attributes={"a": 1})
+        )
+        for collection_start_nanos in range(1, 4):
+            data_points = view_instrument_match.collect(
+                AggregationTemporality.CUMULATIVE, collection_start_nanos
+            )
+            self.assertEqual(len(data_points), 1)
+            self.assertEqual(data_points[0].value, 1)
+
+    def test_collect_cumulative_evicts_expired_attributes(self):
+        (
+            instrument,
+            view_instrument_match,
+        ) = self._counter_view_instrument_match(
+            View(instrument_name="instrument1", series_ttl_millis=2)
+        )
+        view_instrument_match.consume_measurement(
+            Measurement(value=1, instrument=instrument, attributes={"a": 1})
+        )
+        view_instrument_match.consume_measurement(
+            Measurement(value=1, instrument=instrument, attributes={"a": 2})
+        )
+        view_instrument_match.collect(AggregationTemporality.CUMULATIVE, 0)
+
+        view_instrument_match.consume_measurement(
+            Measurement(value=1, instrument=instrument, attributes={"a": 1})
+        )
+        data_points = view_instrument_match.collect(
+            AggregationTemporality.CUMULATIVE, 1e6
+        )
+        # idle for less than the TTL
+        self.assertEqual(len(data_points), 2)
+
+        view_instrument_match.consume_measurement(
+            Measurement(value=1, instrument=instrument, attributes={"a": 1})
+        )
+        data_points = view_instrument_match.collect(
+            AggregationTemporality.CUMULATIVE, 2e6
+        )
+        self.assertEqual(len(data_points), 1)
+        self.assertEqual(data_points[0].attributes, {"a": 1})
+        self.assertEqual(data_points[0].value, 3)
+
+        # the value of evicted attributes starts again from zero
+        view_instrument_match.consume_measurement(
+            Measurement(value=5, instrument=instrument, attributes={"a": 2})
+        )
+        data_points = view_instrument_match.collect(
+            AggregationTemporality.CUMULATIVE, 3e6
+        )
+        data_point = [
+            data_point
+            for data_point in data_points
+            if data_point.attributes == {"a": 2}
+        ][0]
+        self.assertEqual(data_point.value, 5)
+        self.assertEqual(data_point.start_time_unix_nano, 2e6)
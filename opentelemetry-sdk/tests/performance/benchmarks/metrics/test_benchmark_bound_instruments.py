@@ -0,0 +1,67 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+reader = InMemoryMetricReader()
+provider = MeterProvider(metric_readers=[reader])
+meter = provider.get_meter("sdk_meter_provider")
+counter = meter.create_counter("test_counter")
+histogram = meter.create_histogram("test_histogram")
+
+
+def _labels(num_labels):
+    return {f"Key{i}": f"Value{i}" for i in range(num_labels)}
+
+
+@pytest.mark.parametrize("num_labels", [0, 1, 3, 5, 10])
+def test_counter_add(benchmark, num_labels):
+    labels = _labels(num_labels)
+
+    def benchmark_counter_add():
+        counter.add(1, labels)
+
+    benchmark(benchmark_counter_add)
+
+
+@pytest.mark.parametrize("num_labels", [0, 1, 3, 5, 10])
+def test_bound_counter_add(benchmark, num_labels):
+    bound_counter = counter.bind(_labels(num_labels))
+
+    def benchmark_bound_counter_add():
+        bound_counter.add(1)
+
+    benchmark(benchmark_bound_counter_add)
+
+
+@pytest.mark.parametrize("num_labels", [0, 1, 3, 5, 10])
+def test_histogram_record(benchmark, num_labels):
+    labels = _labels(num_labels)
+
+    def benchmark_histogram_record():
+        histogram.record(1, labels)
+
+    benchmark(benchmark_histogram_record)
+
+
+@pytest.mark.parametrize("num_labels", [0, 1, 3, 5, 10])
+def test_bound_histogram_record(benchmark, num_labels):
+    bound_histogram = histogram.bind(_labels(num_labels))
+
+    def benchmark_bound_histogram_record():
+        bound_histogram.record(1)
+
+    benchmark(benchmark_bound_histogram_record)
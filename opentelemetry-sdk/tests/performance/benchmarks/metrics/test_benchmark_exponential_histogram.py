@@ -0,0 +1,82 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+from unittest.mock import Mock
+
+import pytest
+
+from opentelemetry.sdk.metrics._internal.aggregation import (
+    _ExponentialBucketHistogramAggregation,
+)
+from opentelemetry.sdk.metrics._internal.exponential_histogram.buckets import (
+    Buckets,
+)
+from opentelemetry.sdk.metrics._internal.measurement import Measurement
+from opentelemetry.sdk.metrics.export import AggregationTemporality
+
+
+def _aggregation(max_size, values):
+    aggregation = _ExponentialBucketHistogramAggregation(
+        Mock(), 0, max_size=max_size
+    )
+    for value in values:
+        aggregation.aggregate(Measurement(value, Mock()))
+    return aggregation
+
+
+@pytest.mark.parametrize("max_size", [20, 160])
+def test_aggregate(benchmark, max_size):
+    aggregation = _aggregation(max_size, [])
+    measurements = [
+        Measurement(random.uniform(1, 10000), Mock()) for _ in range(1000)
+    ]
+
+    def benchmark_aggregate():
+        for measurement in measurements:
+            aggregation.aggregate(measurement)
+
+    benchmark(benchmark_aggregate)
+
+
+@pytest.mark.parametrize("size", [16, 160, 1024])
+def test_downscale(benchmark, size):
+    def setup():
+        buckets = Buckets()
+        buckets.grow(size, size)
+        for position in range(size):
+            buckets.increment_bucket(position, random.randint(1, 100))
+        buckets.index_start = 1000
+        buckets.index_end = 1000 + size - 1
+        buckets.index_base = 1000
+        return (buckets,), {}
+
+    benchmark.pedantic(
+        lambda buckets: buckets.downscale(3), setup=setup, rounds=200
+    )
+
+
+@pytest.mark.parametrize("max_size", [20, 160])
+def test_collect_cumulative(benchmark, max_size):
+    aggregation = _aggregation(
+        max_size, [random.uniform(1, 10000) for _ in range(1000)]
+    )
+    values = [random.uniform(1, 10000) for _ in range(100)]
+
+    def benchmark_collect():
+        for value in values:
+            aggregation.aggregate(Measurement(value, Mock()))
+        aggregation.collect(AggregationTemporality.CUMULATIVE, 0)
+
+    benchmark(benchmark_collect)
@@ -0,0 +1,68 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import pytest
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.metrics.view import (
+    ExplicitBucketHistogramAggregation,
+    SumAggregation,
+    View,
+)
+
+reader = InMemoryMetricReader()
+provider = MeterProvider(
+    metric_readers=[reader],
+    views=[
+        View(instrument_name="shared_*"),
+        View(
+            instrument_name="per_thread_counter",
+            aggregation=SumAggregation(per_thread=True),
+        ),
+        View(
+            instrument_name="per_thread_histogram",
+            aggregation=ExplicitBucketHistogramAggregation(per_thread=True),
+        ),
+    ],
+)
+meter = provider.get_meter("sdk_meter_provider")
+recorders = {
+    "shared_counter": meter.create_counter("shared_counter").add,
+    "per_thread_counter": meter.create_counter("per_thread_counter").add,
+    "shared_histogram": meter.create_histogram("shared_histogram").record,
+    "per_thread_histogram": meter.create_histogram(
+        "per_thread_histogram"
+    ).record,
+}
+labels = {"Key": "Value"}
+RECORDS_PER_THREAD = 1000
+
+
+@pytest.mark.parametrize("recorder", list(recorders))
+@pytest.mark.parametrize("num_threads", [1, 8, 32])
+def test_concurrent_record(benchmark, recorder, num_threads):
+    record = recorders[recorder]
+
+    def record_many():
+        for value in range(RECORDS_PER_THREAD):
+            record(value, labels)
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+
+        def benchmark_concurrent_record():
+            wait([executor.submit(record_many) for _ in range(num_threads)])
+
+        benchmark(benchmark_concurrent_record)
@@ -0,0 +1,73 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import random
+
+import pytest
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.metrics.view import (
+    ExponentialBucketHistogramAggregation,
+    View,
+)
+
+reader = InMemoryMetricReader()
+provider = MeterProvider(
+    metric_readers=[reader],
+    views=[
+        View(instrument_name="test_histogram"),
+        View(
+            instrument_name="test_exponential_histogram",
+            aggregation=ExponentialBucketHistogramAggregation(),
+        ),
+    ],
+)
+meter = provider.get_meter("sdk_meter_provider")
+counter = meter.create_counter("test_counter")
+histogram = meter.create_histogram("test_histogram")
+exponential_histogram = meter.create_histogram("test_exponential_histogram")
+instruments = {
+    "counter": (counter.add, counter.add_batch),
+    "histogram": (histogram.record, histogram.record_batch),
+    "exponential_histogram": (
+        exponential_histogram.record,
+        exponential_histogram.record_batch,
+    ),
+}
+labels = {"Key": "Value"}
+
+
+@pytest.mark.parametrize("instrument", list(instruments))
+@pytest.mark.parametrize("num_values", [10, 1000])
+def test_record(benchmark, instrument, num_values):
+    record, _ = instruments[instrument]
+    values = [random.uniform(0, 10000) for _ in range(num_values)]
+
+    def benchmark_record():
+        for value in values:
+            record(value, labels)
+
+    benchmark(benchmark_record)
+
+
+@pytest.mark.parametrize("instrument", list(instruments))
+@pytest.mark.parametrize("num_values", [10, 1000])
+def test_record_batch(benchmark, instrument, num_values):
+    _, record_batch = instruments[instrument]
+    values = [random.uniform(0, 10000) for _ in range(num_values)]
+
+    def benchmark_record_batch():
+        record_batch(values, labels)
+
+    benchmark(benchmark_record_batch)
@@ -0,0 +1,60 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    SpanExporter,
+    SpanExportResult,
+)
+
+SPANS_PER_THREAD = 1000
+
+
+class NoOpSpanExporter(SpanExporter):
+    def export(self, spans):
+        return SpanExportResult.SUCCESS
+
+
+@pytest.mark.parametrize("queue_shards", [1, 8])
+@pytest.mark.parametrize("num_threads", [1, 4, 16, 64])
+def test_batch_span_processor_on_end(benchmark, num_threads, queue_shards):
+    span_processor = BatchSpanProcessor(
+        NoOpSpanExporter(),
+        max_queue_size=num_threads * SPANS_PER_THREAD,
+        queue_shards=queue_shards,
+    )
+    tracer = TracerProvider().get_tracer("sdk_tracer_provider")
+    span = tracer.start_span("benchmarkedSpan")
+    span.end()
+    readable_span = span._readable_span()  # pylint: disable=protected-access
+
+    def end_spans():
+        for _ in range(SPANS_PER_THREAD):
+            span_processor.on_end(readable_span)
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+
+        def benchmark_on_end():
+            futures = [executor.submit(end_spans) for _ in range(num_threads)]
+            for future in futures:
+                future.result()
+
+        benchmark(benchmark_on_end)
+
+    span_processor.shutdown()
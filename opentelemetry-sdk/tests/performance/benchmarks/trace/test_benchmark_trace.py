@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import tracemalloc
+
 import opentelemetry.sdk.trace as trace
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import sampling
@@ -49,3 +51,69 @@ def test_simple_start_as_current_span(benchmark):
             span.add_event("benchmarkEvent")
 
     benchmark(benchmark_start_as_current_span)
+
+
+def test_start_span_no_attributes(benchmark):
+    def benchmark_start_span_no_attributes():
+        span = tracer.start_span("benchmarkedSpan")
+        span.end()
+
+    benchmark(benchmark_start_span_no_attributes)
+
+
+def test_start_span_with_attributes(benchmark):
+    attributes = {f"attribute.{index}": index for index in range(16)}
+
+    def benchmark_start_span_with_attributes():
+        span = tracer.start_span("benchmarkedSpan", attributes=attributes)
+        span.set_attribute("http.status_code", 200)
+        span.end()
+
+    benchmark(benchmark_start_span_with_attributes)
+
+
+def test_start_many_spans(benchmark):
+    def benchmark_start_many_spans():
+        return [tracer.start_span("benchmarkedSpan") for _ in range(1000)]
+
+    spans = benchmark(benchmark_start_many_spans)
+    for span in spans:
+        span.end()
+
+
+def test_add_event_with_attributes(benchmark):
+    attributes = {f"attribute.{index}": str(index) for index in range(20)}
+    span = tracer.start_span("benchmarkedSpan")
+
+    def benchmark_add_event_with_attributes():
+        span.add_event("benchmarkEvent", attributes=attributes)
+
+    benchmark(benchmark_add_event_with_attributes)
+    span.end()
+
+
+def test_start_span_allocations(benchmark):
+    def benchmark_start_span_allocations():
+        tracemalloc.start()
+        try:
+            spans = [tracer.start_span("benchmarkedSpan") for _ in range(1000)]
+            allocated, _ = tracemalloc.get_traced_memory()
+            blocks = sum(
+                statistic.count
+                for statistic in tracemalloc.take_snapshot().statistics(
+                    "filename"
+                )
+            )
+        finally:
+            tracemalloc.stop()
+        for span in spans:
+            span.end()
+        return allocated, blocks
+
+    allocated, blocks = benchmark.pedantic(
+        benchmark_start_span_allocations, rounds=5
+    )
+    # the memory and the number of allocations that are still alive for each
+    # started span
+    benchmark.extra_info["bytes_per_span"] = allocated / 1000
+    benchmark.extra_info["allocations_per_span"] = blocks / 1000
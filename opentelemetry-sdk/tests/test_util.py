@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import unittest
+from unittest.mock import MagicMock
 
 from opentelemetry.sdk.util import BoundedList
 
@@ -85,6 +86,20 @@ class TestBoundedList(unittest.TestCase):
         for idx, val in enumerate(blist):
             self.assertEqual(val, self.base[idx])
 
+    def test_immutable(self):
+        blist = BoundedList.from_seq(len(self.base), self.base)
+        # pylint: disable=protected-access
+        blist._immutable = True
+        blist._lock = MagicMock()
+
+        self.assertEqual(list(blist), self.base)
+        blist._lock.__enter__.assert_not_called()
+
+        with self.assertRaises(TypeError):
+            blist.append(1)
+        with self.assertRaises(TypeError):
+            blist.extend([1])
+
     def test_append_drop(self):
         """Append more than max capacity elements and test that oldest ones are dropped."""
         list_len = len(self.base)
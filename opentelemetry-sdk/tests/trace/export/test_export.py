@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import multiprocessing
 import os
 import threading
@@ -29,6 +30,7 @@ from opentelemetry.context import Context
 from opentelemetry.sdk import trace
 from opentelemetry.sdk.environment_variables import (
     OTEL_BSP_EXPORT_TIMEOUT,
+    OTEL_BSP_MAX_CONCURRENT_EXPORTS,
     OTEL_BSP_MAX_EXPORT_BATCH_SIZE,
     OTEL_BSP_MAX_QUEUE_SIZE,
     OTEL_BSP_SCHEDULE_DELAY,
@@ -174,6 +176,7 @@ class TestBatchSpanProcessor(ConcurrencyTestBase):
             OTEL_BSP_SCHEDULE_DELAY: "2",
             OTEL_BSP_MAX_EXPORT_BATCH_SIZE: "3",
             OTEL_BSP_EXPORT_TIMEOUT: "4",
+            OTEL_BSP_MAX_CONCURRENT_EXPORTS: "5",
         },
     )
     def test_args_env_var(self):
@@ -186,6 +189,8 @@ class TestBatchSpanProcessor(ConcurrencyTestBase):
         self.assertEqual(batch_span_processor.schedule_delay_millis, 2)
         self.assertEqual(batch_span_processor.max_export_batch_size, 3)
         self.assertEqual(batch_span_processor.export_timeout_millis, 4)
+        self.assertEqual(batch_span_processor.max_concurrent_exports, 5)
+        batch_span_processor.shutdown()
 
     def test_args_env_var_defaults(self):
 
@@ -197,6 +202,7 @@ class TestBatchSpanProcessor(ConcurrencyTestBase):
         self.assertEqual(batch_span_processor.schedule_delay_millis, 5000)
         self.assertEqual(batch_span_processor.max_export_batch_size, 512)
         self.assertEqual(batch_span_processor.export_timeout_millis, 30000)
+        self.assertEqual(batch_span_processor.max_concurrent_exports, 1)
 
     @mock.patch.dict(
         "os.environ",
@@ -205,6 +211,7 @@ class TestBatchSpanProcessor(ConcurrencyTestBase):
             OTEL_BSP_SCHEDULE_DELAY: " ",
             OTEL_BSP_MAX_EXPORT_BATCH_SIZE: "One",
             OTEL_BSP_EXPORT_TIMEOUT: "@",
+            OTEL_BSP_MAX_CONCURRENT_EXPORTS: "many",
         },
     )
     def test_args_env_var_value_error(self):
@@ -219,6 +226,7 @@ class TestBatchSpanProcessor(ConcurrencyTestBase):
         self.assertEqual(batch_span_processor.schedule_delay_millis, 5000)
         self.assertEqual(batch_span_processor.max_export_batch_size, 512)
         self.assertEqual(batch_span_processor.export_timeout_millis, 30000)
+        self.assertEqual(batch_span_processor.max_concurrent_exports, 1)
 
     def test_on_start_accepts_parent_context(self):
         # pylint: disable=no-self-use
@@ -573,6 +581,398 @@ class TestBatchSpanProcessor(ConcurrencyTestBase):
             max_export_batch_size=512,
         )
 
+        # zero max_concurrent_exports
+        self.assertRaises(
+            ValueError,
+            export.BatchSpanProcessor,
+            None,
+            max_concurrent_exports=0,
+        )
+
+        # zero queue_shards
+        self.assertRaises(
+            ValueError,
+            export.BatchSpanProcessor,
+            None,
+            queue_shards=0,
+        )
+
+        # queue_shards > max_queue_size
+        self.assertRaises(
+            ValueError,
+            export.BatchSpanProcessor,
+            None,
+            max_queue_size=4,
+            max_export_batch_size=4,
+            queue_shards=8,
+        )
+
+    def test_batch_span_processor_queue_shards(self):
+        num_threads = 8
+        num_spans = 100
+
+        spans_names_list = []
+
+        my_exporter = MySpanExporter(
+            destination=spans_names_list, max_export_batch_size=64
+        )
+        span_processor = export.BatchSpanProcessor(
+            my_exporter,
+            max_queue_size=1024,
+            max_export_batch_size=64,
+            queue_shards=4,
+        )
+
+        def create_spans(tno: int):
+            for span_idx in range(num_spans):
+                _create_start_and_end_span(
+                    f"Span {tno}-{span_idx}", span_processor
+                )
+
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            for thread_no in range(num_threads):
+                executor.submit(create_spans, thread_no)
+
+        self.assertTrue(span_processor.force_flush())
+        self.assertEqual(
+            sorted(spans_names_list),
+            sorted(
+                f"Span {tno}-{span_idx}"
+                for tno in range(num_threads)
+                for span_idx in range(num_spans)
+            ),
+        )
+        self.assertEqual(span_processor.dropped_spans, 0)
+        span_processor.shutdown()
+
+    def test_batch_span_processor_concurrent_exports(self):
+        spans_names_list = []
+        # every export waits until another one is running concurrently
+        barrier = threading.Barrier(2, timeout=5)
+
+        class ConcurrentSpanExporter(MySpanExporter):
+            def export(self, spans):
+                barrier.wait()
+                return super().export(spans)
+
+        my_exporter = ConcurrentSpanExporter(destination=spans_names_list)
+        span_processor = export.BatchSpanProcessor(
+            my_exporter,
+            max_queue_size=16,
+            max_export_batch_size=2,
+            max_concurrent_exports=2,
+        )
+
+        for name in ["a", "b", "c", "d"]:
+            _create_start_and_end_span(name, span_processor)
+
+        self.assertTrue(span_processor.force_flush())
+        self.assertFalse(barrier.broken)
+        self.assertEqual(sorted(spans_names_list), ["a", "b", "c", "d"])
+        span_processor.shutdown()
+
+    def test_batch_span_processor_concurrent_exports_backpressure(self):
+        spans_names_list = []
+        export_event = threading.Event()
+        in_flight = []
+        max_in_flight = []
+        lock = threading.Lock()
+
+        class BlockingSpanExporter(MySpanExporter):
+            def export(self, spans):
+                with lock:
+                    in_flight.append(spans)
+                    max_in_flight.append(len(in_flight))
+                export_event.wait(5)
+                with lock:
+                    in_flight.remove(spans)
+                return super().export(spans)
+
+        my_exporter = BlockingSpanExporter(destination=spans_names_list)
+        span_processor = export.BatchSpanProcessor(
+            my_exporter,
+            max_queue_size=16,
+            max_export_batch_size=1,
+            max_concurrent_exports=2,
+        )
+
+        for name in ["a", "b", "c", "d"]:
+            _create_start_and_end_span(name, span_processor)
+
+        # give the worker thread the chance to start more exports
+        time.sleep(0.1)
+        self.assertEqual(len(in_flight), 2)
+        self.assertEqual(spans_names_list, [])
+
+        export_event.set()
+        span_processor.shutdown()
+
+        self.assertTrue(my_exporter.is_shutdown)
+        self.assertEqual(max(max_in_flight), 2)
+        self.assertEqual(sorted(spans_names_list), ["a", "b", "c", "d"])
+
+    @mock.patch.object(export.BatchSpanProcessor, "worker")
+    def test_batch_span_processor_dropped_spans(self, mock_worker):
+        for queue_shards in (1, 2):
+            with self.subTest(queue_shards=queue_shards):
+                span_processor = export.BatchSpanProcessor(
+                    MySpanExporter(destination=[]),
+                    max_queue_size=2,
+                    max_export_batch_size=2,
+                    queue_shards=queue_shards,
+                )
+
+                with self.assertLogs(level=WARNING):
+                    for _ in range(5):
+                        _create_start_and_end_span("foo", span_processor)
+
+                self.assertEqual(len(span_processor.queue), 2)
+                self.assertEqual(span_processor.dropped_spans, 3)
+                span_processor.shutdown()
+
+    @mock.patch.object(export.BatchSpanProcessor, "worker")
+    def test_batch_span_processor_queue_shards_share_capacity(
+        self, mock_worker
+    ):
+        span_processor = export.BatchSpanProcessor(
+            MySpanExporter(destination=[]),
+            max_queue_size=5,
+            max_export_batch_size=5,
+            queue_shards=2,
+        )
+
+        # spans of a single thread all go to the same shard, which can hold
+        # the whole capacity of the queue
+        for name in ["a", "b", "c", "d", "e"]:
+            _create_start_and_end_span(name, span_processor)
+        self.assertEqual(len(span_processor.queue), 5)
+        self.assertEqual(span_processor.dropped_spans, 0)
+
+        with self.assertLogs(level=WARNING):
+            _create_start_and_end_span("f", span_processor)
+        self.assertEqual(len(span_processor.queue), 5)
+        self.assertEqual(span_processor.dropped_spans, 1)
+        # the oldest span is dropped
+        self.assertEqual(
+            [span_processor.queue.pop().name for _ in range(5)],
+            ["b", "c", "d", "e", "f"],
+        )
+        span_processor.shutdown()
+
+    @mock.patch.object(export.BatchSpanProcessor, "worker")
+    def test_batch_span_processor_queue_shards_emptied_by_producer(
+        self, mock_worker
+    ):
+        spans_names_list = []
+        span_processor = export.BatchSpanProcessor(
+            MySpanExporter(destination=spans_names_list),
+            max_queue_size=5,
+            max_export_batch_size=5,
+            queue_shards=2,
+        )
+        for name in ["a", "b"]:
+            _create_start_and_end_span(name, span_processor)
+        queue = span_processor.queue
+
+        # a producer dropping spans empties the queue while the batch is
+        # being built
+        with mock.patch.object(
+            queue, "pop", side_effect=[queue.pop(), IndexError()]
+        ):
+            self.assertEqual(span_processor._export_batch(), 1)
+        self.assertEqual(spans_names_list, ["a"])
+        span_processor.shutdown()
+
+    @mock.patch.object(export.BatchSpanProcessor, "worker")
+    def test_batch_span_processor_queue_shards_fork_reinit(self, mock_worker):
+        span_processor = export.BatchSpanProcessor(
+            MySpanExporter(destination=[]),
+            max_queue_size=5,
+            max_export_batch_size=5,
+            queue_shards=2,
+        )
+        # held by a thread of the parent process when it forked
+        span_processor.queue._drop_lock.acquire()
+
+        span_processor._at_fork_reinit()
+
+        self.assertFalse(span_processor.queue._drop_lock.locked())
+        span_processor.shutdown()
+
+
+class MyAsyncSpanExporter(export.AsyncSpanExporter):
+    """Very simple async span exporter used for testing."""
+
+    def __init__(self, destination):
+        self.destination = destination
+        self.batches = []
+        self.is_shutdown = False
+
+    async def export(self, spans):
+        await asyncio.sleep(0)
+        self.batches.append(len(spans))
+        self.destination.extend(span.name for span in spans)
+        return export.SpanExportResult.SUCCESS
+
+    async def shutdown(self):
+        self.is_shutdown = True
+
+
+class TestAsyncBatchSpanProcessor(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.loop_thread = threading.Thread(target=self.loop.run_forever)
+        self.loop_thread.start()
+
+    def tearDown(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.loop_thread.join()
+        self.loop.close()
+
+    def test_shutdown(self):
+        spans_names_list = []
+
+        my_exporter = MyAsyncSpanExporter(destination=spans_names_list)
+        span_processor = export.AsyncBatchSpanProcessor(
+            my_exporter, loop=self.loop
+        )
+
+        span_names = ["xxx", "bar", "foo"]
+
+        for name in span_names:
+            _create_start_and_end_span(name, span_processor)
+
+        span_processor.shutdown()
+        self.assertTrue(my_exporter.is_shutdown)
+        self.assertListEqual(span_names, spans_names_list)
+
+        with self.assertLogs(level=WARNING):
+            _create_start_and_end_span("late", span_processor)
+
+    def test_flush(self):
+        spans_names_list = []
+
+        my_exporter = MyAsyncSpanExporter(destination=spans_names_list)
+        span_processor = export.AsyncBatchSpanProcessor(
+            my_exporter, loop=self.loop, max_export_batch_size=2
+        )
+
+        span_names = ["xxx", "bar", "foo"]
+
+        for name in span_names:
+            _create_start_and_end_span(name, span_processor)
+
+        self.assertTrue(span_processor.force_flush())
+        self.assertListEqual(span_names, spans_names_list)
+        self.assertListEqual([2, 1], my_exporter.batches)
+
+        span_processor.shutdown()
+
+    def test_on_end_from_multiple_threads(self):
+        num_threads = 8
+        num_spans = 20
+
+        spans_names_list = []
+
+        my_exporter = MyAsyncSpanExporter(destination=spans_names_list)
+        span_processor = export.AsyncBatchSpanProcessor(
+            my_exporter,
+            loop=self.loop,
+            max_queue_size=1024,
+            max_export_batch_size=64,
+        )
+
+        def create_spans(tno: int):
+            for span_idx in range(num_spans):
+                _create_start_and_end_span(
+                    f"Span {tno}-{span_idx}", span_processor
+                )
+
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            for thread_no in range(num_threads):
+                executor.submit(create_spans, thread_no)
+
+        self.assertTrue(span_processor.force_flush())
+        self.assertEqual(len(spans_names_list), num_threads * num_spans)
+        self.assertEqual(span_processor.dropped_spans, 0)
+        span_processor.shutdown()
+
+    def test_batch_exported_without_flush(self):
+        spans_names_list = []
+
+        my_exporter = MyAsyncSpanExporter(destination=spans_names_list)
+        span_processor = export.AsyncBatchSpanProcessor(
+            my_exporter, loop=self.loop, max_export_batch_size=2
+        )
+
+        _create_start_and_end_span("foo", span_processor)
+        _create_start_and_end_span("bar", span_processor)
+
+        for _ in range(100):
+            if spans_names_list:
+                break
+            time.sleep(0.01)
+        self.assertListEqual(["foo", "bar"], spans_names_list)
+        span_processor.shutdown()
+
+    def test_flush_from_event_loop(self):
+        spans_names_list = []
+
+        async def create_spans():
+            span_processor = export.AsyncBatchSpanProcessor(
+                MyAsyncSpanExporter(destination=spans_names_list)
+            )
+            _create_start_and_end_span("foo", span_processor)
+            # can't wait on the event loop's own thread
+            self.assertFalse(span_processor.force_flush())
+            await asyncio.sleep(0.1)
+            return span_processor
+
+        span_processor = asyncio.run_coroutine_threadsafe(
+            create_spans(), self.loop
+        ).result(5)
+
+        self.assertListEqual(["foo"], spans_names_list)
+        span_processor.shutdown()
+
+    def test_exporter_exception(self):
+        class FailingAsyncSpanExporter(MyAsyncSpanExporter):
+            async def export(self, spans):
+                raise ValueError("export failed")
+
+        span_processor = export.AsyncBatchSpanProcessor(
+            FailingAsyncSpanExporter(destination=[]), loop=self.loop
+        )
+        _create_start_and_end_span("foo", span_processor)
+
+        with self.assertLogs(level="ERROR"):
+            self.assertTrue(span_processor.force_flush())
+        span_processor.shutdown()
+
+    def test_export_timeout(self):
+        class HungAsyncSpanExporter(MyAsyncSpanExporter):
+            async def export(self, spans):
+                if spans[0].name == "hung":
+                    await asyncio.Event().wait()
+                return await super().export(spans)
+
+        spans_names_list = []
+        span_processor = export.AsyncBatchSpanProcessor(
+            HungAsyncSpanExporter(destination=spans_names_list),
+            loop=self.loop,
+            max_export_batch_size=1,
+            export_timeout_millis=100,
+        )
+        _create_start_and_end_span("hung", span_processor)
+        _create_start_and_end_span("foo", span_processor)
+
+        with self.assertLogs(level=WARNING) as logs:
+            self.assertTrue(span_processor.force_flush(5000))
+        self.assertIn("Timeout was exceeded", logs.output[0])
+        # the export that follows the hung one still happens
+        self.assertListEqual(["foo"], spans_names_list)
+        span_processor.shutdown()
+
 
 class TestConsoleSpanExporter(unittest.TestCase):
     def test_export(self):  # pylint: disable=no-self-use
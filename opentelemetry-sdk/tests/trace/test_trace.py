@@ -49,7 +49,7 @@ from opentelemetry.sdk.trace.sampling import (
     ParentBased,
     StaticSampler,
 )
-from opentelemetry.sdk.util import BoundedDict, ns_to_iso_str
+from opentelemetry.sdk.util import BoundedDict, BoundedList, ns_to_iso_str
 from opentelemetry.sdk.util.instrumentation import InstrumentationInfo
 from opentelemetry.test.spantestutil import (
     get_span_with_dropped_attributes_events_links,
@@ -636,6 +636,50 @@ class TestSpan(unittest.TestCase):
         span = trace._Span("name", mock.Mock(spec=trace_api.SpanContext))
         self.assertEqual(span.name, "name")
 
+    def test_events_and_links_created_lazily(self):
+        span = trace._Span("name", mock.Mock(spec=trace_api.SpanContext))
+        self.assertIs(span._events, trace._EMPTY_SEQUENCE)
+        self.assertIs(span._links, trace._EMPTY_SEQUENCE)
+        self.assertEqual(span.events, ())
+        self.assertEqual(span.links, ())
+        self.assertEqual(span.dropped_events, 0)
+        self.assertEqual(span.dropped_links, 0)
+
+        span.start()
+        span.add_event("event")
+        self.assertIsInstance(span._events, BoundedList)
+        self.assertEqual(len(span.events), 1)
+        span.end()
+
+    def test_end_shares_frozen_snapshot(self):
+        first_processor = mock.Mock(spec=trace.SpanProcessor)
+        second_processor = mock.Mock(spec=trace.SpanProcessor)
+        tracer_provider = trace.TracerProvider()
+        tracer_provider.add_span_processor(first_processor)
+        tracer_provider.add_span_processor(second_processor)
+        tracer = tracer_provider.get_tracer(__name__)
+
+        span = tracer.start_span("span", attributes={"key": "value"})
+        span.add_event("event", {"event_key": "event_value"})
+        span.end()
+
+        readable_span = first_processor.on_end.call_args[0][0]
+        self.assertIs(readable_span, second_processor.on_end.call_args[0][0])
+        self.assertEqual(dict(readable_span.attributes), {"key": "value"})
+        self.assertEqual(readable_span.events[0].name, "event")
+
+        with self.assertRaises(TypeError):
+            span._attributes["key"] = "other"
+        with self.assertRaises(TypeError):
+            span._events.append(trace.Event("other"))
+
+    def test_readable_span_slots(self):
+        self.assertFalse(hasattr(trace.ReadableSpan(), "__dict__"))
+
+    def test_span_slots(self):
+        span = trace._Span("name", mock.Mock(spec=trace_api.SpanContext))
+        self.assertFalse(hasattr(span, "__dict__"))
+
     def test_attributes(self):
         with self.tracer.start_as_current_span("root") as root:
             root.set_attributes(